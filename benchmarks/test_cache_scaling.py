@@ -0,0 +1,163 @@
+"""Thread-scaling benchmarks for the memory caches.
+
+Run ``python -m benchmarks.test_cache_scaling`` for a throughput table of
+``MemoryCache`` against ``ShardedMemoryCache`` by thread count, for two
+workloads:
+
+``mixed``
+    Plain cache traffic. The critical sections are a few dictionary
+    operations, so under the GIL neither layout scales with threads and
+    both stay within noise of each other. This is a regression guard for
+    per-operation overhead, not evidence for sharding.
+``contended``
+    Every lock hold also pauses for ``HOLD_SECONDS`` with the GIL released,
+    like a backend doing I/O or C-level work under its lock. Throughput is
+    then bounded by lock contention: one lock serializes all threads while
+    the segments of a sharded cache are held concurrently.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from openalex.cache import MemoryCache, ShardedMemoryCache, SmartMemoryCache
+from openalex.logging import configure_logging
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+OPS_PER_THREAD = 20_000
+CONTENDED_OPS_PER_THREAD = 200
+KEYS = 2_000
+SHARDS = 16
+HOLD_SECONDS = 0.0002
+
+
+class _HeldLock:
+    """Re-entrant lock that keeps each hold busy for ``HOLD_SECONDS``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> _HeldLock:
+        self._lock.acquire()
+        time.sleep(HOLD_SECONDS)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._lock.release()
+
+
+def _single_lock() -> MemoryCache:
+    return SmartMemoryCache(max_size=KEYS)
+
+
+def _sharded() -> ShardedMemoryCache:
+    return ShardedMemoryCache.create(SmartMemoryCache, SHARDS, max_size=KEYS)
+
+
+def _held(cache: Any) -> Any:
+    """Replace the lock of ``cache`` (or of each segment) with a held one."""
+    for segment in getattr(cache, "segments", (cache,)):
+        segment._lock = _HeldLock()  # noqa: SLF001
+    return cache
+
+
+CACHES = {"single_lock": _single_lock, "sharded": _sharded}
+WORKLOADS = {"mixed": OPS_PER_THREAD, "contended": CONTENDED_OPS_PER_THREAD}
+
+
+def make_cache(kind: str, workload: str) -> MemoryCache | ShardedMemoryCache:
+    """Build the ``kind`` cache set up for ``workload``."""
+    cache = CACHES[kind]()
+    return _held(cache) if workload == "contended" else cache
+
+
+def run_workload(
+    cache: MemoryCache | ShardedMemoryCache,
+    threads: int,
+    ops_per_thread: int = OPS_PER_THREAD,
+) -> float:
+    """Run a 90% read / 10% write mix on ``threads`` threads; return ops/s."""
+    keys = [f"works:W{i}" for i in range(KEYS)]
+    for key in keys:
+        cache.set(key, {"id": key}, 3600)
+    start = threading.Barrier(threads + 1)
+
+    def worker(offset: int) -> None:
+        start.wait()
+        for i in range(ops_per_thread):
+            key = keys[(offset + i * 7) % KEYS]
+            if i % 10 == 0:
+                cache.set(key, {"id": key}, 3600)
+            else:
+                cache.get(key)
+
+    workers = [
+        threading.Thread(target=worker, args=(n * 101,)) for n in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * ops_per_thread / (time.perf_counter() - began)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("threads", THREAD_COUNTS)
+@pytest.mark.parametrize("kind", sorted(CACHES))
+def test_cache_thread_scaling(benchmark, kind, threads):
+    """Record mixed-traffic throughput; a regression guard only."""
+    cache = make_cache(kind, "mixed")
+    ops = benchmark.pedantic(
+        run_workload, args=(cache, threads, 2_000), rounds=3
+    )
+    benchmark.extra_info["ops_per_second"] = ops
+    assert ops > 0
+
+
+@pytest.mark.benchmark
+def test_sharding_relieves_lock_contention(benchmark):
+    """With contended locks, 16 threads go faster on 16 segments."""
+    threads = 16
+
+    def compare() -> tuple[float, float]:
+        single, sharded = (
+            run_workload(
+                make_cache(kind, "contended"), threads, CONTENDED_OPS_PER_THREAD
+            )
+            for kind in ("single_lock", "sharded")
+        )
+        return single, sharded
+
+    single, sharded = benchmark.pedantic(compare, rounds=1)
+    benchmark.extra_info.update(single_lock=single, sharded=sharded)
+    assert sharded > 2 * single
+
+
+def main() -> None:
+    """Print throughput for each workload, cache layout and thread count."""
+    configure_logging(level="WARNING")
+    for workload, ops_per_thread in WORKLOADS.items():
+        print(f"\n{workload}")
+        print(f"{'threads':>8} " + " ".join(f"{k:>14}" for k in CACHES))
+        for threads in THREAD_COUNTS:
+            row = [
+                run_workload(
+                    make_cache(kind, workload), threads, ops_per_thread
+                )
+                for kind in CACHES
+            ]
+            print(
+                f"{threads:>8} " + " ".join(f"{ops:>12,.0f}/s" for ops in row)
+            )
+
+
+if __name__ == "__main__":
+    main()
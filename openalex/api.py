@@ -487,32 +487,9 @@ class AsyncBaseAPI(Generic[T]):
             raise_for_status(response)
             return cast("dict[str, Any]", response.json())
 
-        cache_key = None
-        if cache_manager.enabled:
-            from .cache.base import CacheKeyBuilder
-
-            cache_key = CacheKeyBuilder.build_key(
-                self.endpoint, entity_id, params
-            )
-            cached = (
-                cache_manager.cache.get(cache_key)
-                if cache_manager.cache
-                else None
-            )
-            if cached is not None:
-                return cast("dict[str, Any]", cached)
-
-        data = await fetch()
-
-        if (
-            cache_manager.enabled
-            and cache_manager.cache
-            and cache_key is not None
-        ):
-            ttl = cache_manager.get_ttl_for_endpoint(self.endpoint)
-            cache_manager.cache.set(cache_key, data, ttl)
-
-        return data
+        return await cache_manager.aget_or_fetch(
+            self.endpoint, fetch, entity_id=entity_id, params=params
+        )
 
     async def get_list(
         self, params: dict[str, Any] | None = None
@@ -1,12 +1,51 @@
 """Cache module exports."""
 
-from .base import BaseCache, CacheEntry, CacheKeyBuilder
+from .adapters import AsyncCacheAdapter, as_async_cache
+from .base import (
+    AsyncBaseCache,
+    BaseCache,
+    CacheEntry,
+    CacheKeyBuilder,
+    FetchResult,
+)
+from .eviction import (
+    EvictionPolicy,
+    LFUPolicy,
+    LRUPolicy,
+    TinyLFUPolicy,
+)
 from .memory import MemoryCache, SmartMemoryCache
+from .sharded import ShardedMemoryCache, StripedLock
+from .snapshot import iter_snapshot, read_snapshot, write_snapshot
+from .sqlite import SQLiteCache
+from .sweeper import ExpirySweeper
+from .tiered import TieredCache
+from .warmup import Manifest, WarmupReport, load_manifest, warm_manifest
 
 __all__ = [
+    "AsyncBaseCache",
+    "AsyncCacheAdapter",
     "BaseCache",
     "CacheEntry",
     "CacheKeyBuilder",
+    "EvictionPolicy",
+    "ExpirySweeper",
+    "FetchResult",
+    "LFUPolicy",
+    "LRUPolicy",
+    "Manifest",
     "MemoryCache",
+    "SQLiteCache",
+    "ShardedMemoryCache",
     "SmartMemoryCache",
+    "StripedLock",
+    "TieredCache",
+    "TinyLFUPolicy",
+    "WarmupReport",
+    "as_async_cache",
+    "iter_snapshot",
+    "load_manifest",
+    "read_snapshot",
+    "warm_manifest",
+    "write_snapshot",
 ]
@@ -0,0 +1,105 @@
+"""Async adapters for the synchronous cache backends."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from .base import AsyncBaseCache, BaseCache, CacheEntry
+from .memory import MemoryCache
+from .sharded import ShardedMemoryCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+__all__ = ["AsyncCacheAdapter", "as_async_cache"]
+
+
+class AsyncCacheAdapter(AsyncBaseCache):
+    """Expose a :class:`BaseCache` through the awaitable cache protocol.
+
+    With ``offload`` every operation runs in the default thread pool, so a
+    backend that blocks on I/O (or on a lock held by another thread) only
+    suspends the awaiting coroutine. Without it operations run inline,
+    which suits in-memory caches whose critical sections are short.
+    """
+
+    def __init__(self, cache: BaseCache, *, offload: bool = True) -> None:
+        self.cache = cache
+        self.offload = offload
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.offload:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def aget(self, key: str) -> Any | None:
+        """Get a value from the cache."""
+        return await self._call(self.cache.get, key)
+
+    async def aget_entry(self, key: str) -> CacheEntry | None:
+        """Get a value together with its expiry metadata."""
+        entry: CacheEntry | None = await self._call(self.cache.get_entry, key)
+        return entry
+
+    async def aget_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get the cached values of ``keys`` in one backend call."""
+        return await self._call(self._get_many, list(keys))
+
+    def _get_many(self, keys: list[str]) -> dict[str, Any]:
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = self.cache.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def aget_entries(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get the cached entries of ``keys`` in one backend call."""
+        return await self._call(self._get_entries, list(keys))
+
+    def _get_entries(self, keys: list[str]) -> dict[str, CacheEntry]:
+        found: dict[str, CacheEntry] = {}
+        for key in keys:
+            entry = self.cache.get_entry(key)
+            if entry is not None:
+                found[key] = entry
+        return found
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Set a value in the cache with TTL in seconds."""
+        await self._call(self.cache.set, key, value, ttl, validators)
+
+    async def aset_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key`` as it is."""
+        await self._call(self.cache.set_entry, key, entry)
+
+    async def aset_many(self, entries: dict[str, Any], ttl: float) -> None:
+        """Set several values with the same TTL in one backend call."""
+        await self._call(self._set_many, entries, ttl)
+
+    def _set_many(self, entries: dict[str, Any], ttl: float) -> None:
+        for key, value in entries.items():
+            self.cache.set(key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Delete a value from the cache."""
+        await self._call(self.cache.delete, key)
+
+
+def as_async_cache(cache: BaseCache | AsyncBaseCache) -> AsyncBaseCache:
+    """Return ``cache`` as an :class:`AsyncBaseCache`.
+
+    Memory caches are used inline; any other backend is offloaded to
+    threads.
+    """
+    if isinstance(cache, AsyncBaseCache):
+        return cache
+    in_memory = isinstance(cache, MemoryCache | ShardedMemoryCache)
+    return AsyncCacheAdapter(cache, offload=not in_memory)
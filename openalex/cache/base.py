@@ -2,23 +2,41 @@
 
 from __future__ import annotations
 
+import math
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, TypeVar
-from urllib.parse import urlencode
+from typing import TYPE_CHECKING, Any, Final, TypeVar
 
-import xxhash
 from structlog import get_logger
 
+from ..constants import (
+    HEADER_ETAG,
+    HEADER_IF_MODIFIED_SINCE,
+    HEADER_IF_NONE_MATCH,
+    HEADER_LAST_MODIFIED,
+)
+from ..utils.fingerprint import request_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
 logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+#: Cached in place of a payload to remember that an entity does not exist
+NOT_FOUND: Final = "openalex:not-found"
+
 __all__ = [
+    "NOT_FOUND",
+    "AsyncBaseCache",
     "BaseCache",
     "CacheEntry",
     "CacheKeyBuilder",
+    "FetchResult",
+    "conditional_headers",
+    "validators_from_headers",
 ]
 
 
@@ -30,20 +48,30 @@ class CacheKeyBuilder:
         endpoint: str,
         entity_id: str | None = None,
         params: dict[str, Any] | None = None,
+        fingerprint: str | None = None,
     ) -> str:
-        """Build a cache key from request parameters."""
+        """Build a cache key from request parameters.
+
+        Parameters are represented by their :func:`request_fingerprint`;
+        pass ``fingerprint`` to reuse one computed earlier.
+        """
         parts = [endpoint]
 
         if entity_id:
             parts.append(entity_id)
 
-        if params:
-            sorted_params = sorted(params.items())
-            param_str = urlencode(sorted_params)
-            parts.append(xxhash.xxh64(param_str).hexdigest())
+        if fingerprint is None and params:
+            fingerprint = request_fingerprint(endpoint, params)
+        if fingerprint:
+            parts.append(fingerprint)
 
         return ":".join(parts)
 
+    @staticmethod
+    def list_key(endpoint: str, fingerprint: str) -> str:
+        """Build the cache key of a list page from its request fingerprint."""
+        return f"{endpoint}:list:{fingerprint}"
+
 
 @dataclass(slots=True)
 class CacheEntry:
@@ -53,11 +81,28 @@ class CacheEntry:
     expires_at: float
     created_at: float = field(default_factory=time.time)
     hit_count: int = 0
+    size: int = 0
+    validators: dict[str, str] | None = None
+    # Set once the backend pushed ``expires_at`` past the TTL it was stored
+    # with, e.g. an adaptive extension for a frequently read entry
+    extended: bool = False
 
     @classmethod
-    def create(cls, data: Any, ttl: float) -> CacheEntry:
+    def create(
+        cls,
+        data: Any,
+        ttl: float,
+        size: int = 0,
+        validators: dict[str, str] | None = None,
+    ) -> CacheEntry:
         now = time.time()
-        return cls(data=data, expires_at=now + ttl, created_at=now)
+        return cls(
+            data=data,
+            expires_at=now + ttl,
+            created_at=now,
+            size=size,
+            validators=validators,
+        )
 
     def is_expired(self) -> bool:
         """Check if this entry has expired."""
@@ -68,6 +113,40 @@ class CacheEntry:
         self.hit_count += 1
 
 
+@dataclass(slots=True)
+class FetchResult:
+    """A fetched payload with the cache validators of its response.
+
+    ``not_modified`` marks a ``304`` answer to a conditional request, which
+    carries no payload. ``size`` is the length of the response body, when
+    known.
+    """
+
+    data: Any = None
+    validators: dict[str, str] | None = None
+    not_modified: bool = False
+    size: int | None = None
+
+
+def validators_from_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Return the ``ETag``/``Last-Modified`` headers of a response."""
+    return {
+        name: value
+        for name in (HEADER_ETAG, HEADER_LAST_MODIFIED)
+        if (value := headers.get(name))
+    }
+
+
+def conditional_headers(validators: Mapping[str, str]) -> dict[str, str]:
+    """Return request headers revalidating a response with ``validators``."""
+    headers: dict[str, str] = {}
+    if etag := validators.get(HEADER_ETAG):
+        headers[HEADER_IF_NONE_MATCH] = etag
+    if last_modified := validators.get(HEADER_LAST_MODIFIED):
+        headers[HEADER_IF_MODIFIED_SINCE] = last_modified
+    return headers
+
+
 class BaseCache(ABC):
     """Abstract base class for cache implementations."""
 
@@ -75,14 +154,60 @@ class BaseCache(ABC):
     def get(self, key: str) -> Any | None:
         """Get a value from the cache."""
 
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get a value together with its expiry metadata.
+
+        Backends that do not track expiry report entries that never expire.
+        """
+        value = self.get(key)
+        if value is None:
+            return None
+        return CacheEntry(data=value, expires_at=math.inf)
+
     @abstractmethod
-    def set(self, key: str, value: Any, ttl: float) -> None:
-        """Set a value in the cache with TTL in seconds."""
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Set a value in the cache with TTL in seconds.
+
+        ``validators`` are the response's ``ETag``/``Last-Modified`` headers,
+        returned with the entry by :meth:`get_entry`.
+        """
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key`` as it is.
+
+        Backends keep what they track of it: its creation time, validators
+        and a known ``size`` (such as the response body length). This
+        default stores the value for its remaining lifetime.
+        """
+        ttl = entry.expires_at - time.time()
+        if ttl > 0:
+            self.set(key, entry.data, ttl, entry.validators)
 
     @abstractmethod
     def delete(self, key: str) -> None:
         """Delete a value from the cache."""
 
+    def expire(self) -> int:
+        """Drop expired entries now; return how many were dropped.
+
+        Backends that only expire entries lazily, on access, drop none.
+        """
+        return 0
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        """Yield ``(key, entry)`` for every unexpired entry.
+
+        Iterating does not count as a hit or touch the eviction order.
+        Backends that cannot enumerate their contents yield nothing.
+        """
+        return iter(())
+
     @abstractmethod
     def clear(self) -> None:
         """Clear all cache entries."""
@@ -90,3 +215,68 @@ class BaseCache(ABC):
     @abstractmethod
     def stats(self) -> dict[str, Any]:
         """Get cache statistics."""
+
+
+class AsyncBaseCache(ABC):
+    """Abstract base class for caches used from the event loop.
+
+    Every operation is awaitable, so a backend doing disk or network I/O
+    suspends the calling coroutine instead of blocking the loop.
+    """
+
+    @abstractmethod
+    async def aget(self, key: str) -> Any | None:
+        """Get a value from the cache."""
+
+    async def aget_entry(self, key: str) -> CacheEntry | None:
+        """Get a value together with its expiry metadata.
+
+        Backends that do not track expiry report entries that never expire.
+        """
+        value = await self.aget(key)
+        if value is None:
+            return None
+        return CacheEntry(data=value, expires_at=math.inf)
+
+    async def aget_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get the cached values of ``keys`` that are present."""
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = await self.aget(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def aget_entries(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get the cached entries of ``keys`` that are present."""
+        found: dict[str, CacheEntry] = {}
+        for key in keys:
+            entry = await self.aget_entry(key)
+            if entry is not None:
+                found[key] = entry
+        return found
+
+    @abstractmethod
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Set a value in the cache with TTL in seconds."""
+
+    async def aset_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key`` as it is (see ``set_entry``)."""
+        ttl = entry.expires_at - time.time()
+        if ttl > 0:
+            await self.aset(key, entry.data, ttl, entry.validators)
+
+    async def aset_many(self, entries: dict[str, Any], ttl: float) -> None:
+        """Set several values with the same TTL."""
+        for key, value in entries.items():
+            await self.aset(key, value, ttl)
+
+    @abstractmethod
+    async def adelete(self, key: str) -> None:
+        """Delete a value from the cache."""
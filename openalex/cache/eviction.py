@@ -0,0 +1,355 @@
+"""Constant-time eviction policies for the in-memory caches."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, ClassVar, Final, Literal
+
+__all__ = [
+    "EVICTION_POLICIES",
+    "EvictionPolicy",
+    "EvictionPolicyName",
+    "LFUPolicy",
+    "LRUPolicy",
+    "TinyLFUPolicy",
+    "create_policy",
+]
+
+EvictionPolicyName = Literal["lru", "lfu", "tinylfu"]
+
+_SEEDS: Final = (
+    0x97CB3127D1A5E1C3,
+    0xBF58476D1CE4E5B9,
+    0x94D049BB133111EB,
+    0x9E3779B97F4A7C15,
+)
+_MASK64: Final = (1 << 64) - 1
+_SKETCH_MAX_COUNT: Final = 15
+_SKETCH_MIN_WIDTH: Final = 16
+_COUNTERS_PER_ENTRY: Final = 8
+_SAMPLE_FACTOR: Final = 10
+_WINDOW_FRACTION: Final = 0.01
+_PROTECTED_FRACTION: Final = 0.8
+
+
+class EvictionPolicy(ABC):
+    """Tracks resident keys and decides which one to evict next.
+
+    The cache owns the data; the policy only sees keys. Every operation is
+    O(1) (amortized for the TinyLFU sketch reset). Reads reported through
+    :meth:`record_hit` and :meth:`record_miss` are counted for the
+    policy's hit rate.
+    """
+
+    name: ClassVar[str]
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._hits = 0
+        self._misses = 0
+
+    def record_hit(self, key: str) -> None:
+        """Count a read of the resident ``key`` and update its position."""
+        self._hits += 1
+        self.on_hit(key)
+
+    def record_miss(self, key: str) -> None:
+        """Count a read of ``key`` that is not cached."""
+        self._misses += 1
+        self.on_miss(key)
+
+    @abstractmethod
+    def on_hit(self, key: str) -> None:
+        """Record a read or overwrite of the resident ``key``."""
+
+    def on_miss(self, key: str) -> None:  # noqa: B027 - optional hook
+        """Record a read of ``key`` that is not cached."""
+
+    @abstractmethod
+    def on_insert(self, key: str) -> None:
+        """Start tracking a newly cached ``key``."""
+
+    @abstractmethod
+    def on_remove(self, key: str) -> None:
+        """Stop tracking ``key`` after a delete or expiry."""
+
+    @abstractmethod
+    def victim(self) -> str | None:
+        """Pick, forget and return the key to evict, if any.
+
+        Called before a new key is inserted into a full cache.
+        """
+
+    def clear(self) -> None:
+        """Forget all keys and reset the read counters."""
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the read counters and policy-specific counters."""
+        reads = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / reads if reads else 0,
+        }
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key."""
+
+    name = "lru"
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(max_size)
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def on_hit(self, key: str) -> None:
+        self._order.move_to_end(key)
+
+    def on_insert(self, key: str) -> None:
+        self._order[key] = None
+
+    def on_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self) -> str | None:
+        if not self._order:
+            return None
+        key, _ = self._order.popitem(last=False)
+        return key
+
+    def clear(self) -> None:
+        super().clear()
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evict the least frequently used key, oldest first among ties.
+
+    Keys live in per-frequency buckets so that a hit moves a key one bucket
+    up and the victim is always at the front of the lowest bucket.
+    """
+
+    name = "lfu"
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(max_size)
+        self._freq: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_freq = 0
+
+    def _unlink(self, key: str, freq: int) -> None:
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+
+    def on_hit(self, key: str) -> None:
+        freq = self._freq[key]
+        self._unlink(key, freq)
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def on_insert(self, key: str) -> None:
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def on_remove(self, key: str) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+        self._unlink(key, freq)
+        if not self._freq:
+            self._min_freq = 0
+        elif self._min_freq not in self._buckets:
+            # Only happens when an arbitrary key leaves the lowest bucket
+            self._min_freq = min(self._buckets)
+
+    def victim(self) -> str | None:
+        if not self._freq:
+            return None
+        key = next(iter(self._buckets[self._min_freq]))
+        self.on_remove(key)
+        return key
+
+    def clear(self) -> None:
+        super().clear()
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **super().stats(),
+            "min_frequency": self._min_freq,
+            "frequency_buckets": len(self._buckets),
+        }
+
+
+class _FrequencySketch:
+    """Count-min sketch with counters capped at 15 and periodic halving."""
+
+    def __init__(self, capacity: int) -> None:
+        width = _SKETCH_MIN_WIDTH
+        while width < capacity * _COUNTERS_PER_ENTRY:
+            width *= 2
+        self._shift = 64 - (width.bit_length() - 1)
+        self._table = [bytearray(width) for _ in _SEEDS]
+        self._sample_size = _SAMPLE_FACTOR * max(capacity, 1)
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key) & _MASK64
+        h ^= h >> 31
+        # Independent multiplicative hashes, one per row
+        return [((h * seed) & _MASK64) >> self._shift for seed in _SEEDS]
+
+    def increment(self, key: str) -> None:
+        for row, index in zip(self._table, self._indexes(key), strict=True):
+            if row[index] < _SKETCH_MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            # Age all counts so that past popularity fades
+            self._table = [
+                bytearray(c >> 1 for c in row) for row in self._table
+            ]
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        return min(
+            row[index]
+            for row, index in zip(self._table, self._indexes(key), strict=True)
+        )
+
+    def clear(self) -> None:
+        for row in self._table:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """W-TinyLFU: a small LRU window in front of a segmented LRU main area.
+
+    New keys enter the window. Keys leaving the window join the main
+    area's probation segment only if their estimated access frequency
+    beats the probation victim's, so one-off scans cannot flush popular
+    keys. A hit in probation promotes a key to the protected segment.
+    """
+
+    name = "tinylfu"
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(max_size)
+        self._window_size = max(1, int(max_size * _WINDOW_FRACTION))
+        main_size = max(1, max_size - self._window_size)
+        self._protected_size = max(1, int(main_size * _PROTECTED_FRACTION))
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+        self._sketch = _FrequencySketch(max_size)
+        self._window_hits = 0
+        self._main_hits = 0
+        self._admitted = 0
+        self._rejected = 0
+
+    def on_hit(self, key: str) -> None:
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window_hits += 1
+            self._window.move_to_end(key)
+            return
+        self._main_hits += 1
+        if key in self._protected:
+            self._protected.move_to_end(key)
+            return
+        del self._probation[key]
+        self._protected[key] = None
+        if len(self._protected) > self._protected_size:
+            demoted, _ = self._protected.popitem(last=False)
+            self._probation[demoted] = None
+
+    def on_miss(self, key: str) -> None:
+        self._sketch.increment(key)
+
+    def on_insert(self, key: str) -> None:
+        self._window[key] = None
+        if len(self._window) > self._window_size:
+            # The cache had room, so the displaced key joins main unopposed
+            overflow, _ = self._window.popitem(last=False)
+            self._probation[overflow] = None
+
+    def on_remove(self, key: str) -> None:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                break
+
+    def victim(self) -> str | None:
+        if len(self._window) >= self._window_size and self._probation:
+            # The window's oldest key is about to be displaced; it enters
+            # main only if it is more popular than main's next victim
+            candidate, _ = self._window.popitem(last=False)
+            incumbent = next(iter(self._probation))
+            freq = self._sketch.frequency
+            if freq(candidate) > freq(incumbent):
+                self._admitted += 1
+                del self._probation[incumbent]
+                self._probation[candidate] = None
+                return incumbent
+            self._rejected += 1
+            return candidate
+
+        for segment in (self._probation, self._protected, self._window):
+            if segment:
+                key, _ = segment.popitem(last=False)
+                return key
+        return None
+
+    def clear(self) -> None:
+        super().clear()
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._sketch.clear()
+        self._window_hits = 0
+        self._main_hits = 0
+        self._admitted = 0
+        self._rejected = 0
+
+    def stats(self) -> dict[str, Any]:
+        hits = self._window_hits + self._main_hits
+        return {
+            **super().stats(),
+            "window_size": len(self._window),
+            "probation_size": len(self._probation),
+            "protected_size": len(self._protected),
+            "window_hits": self._window_hits,
+            "main_hits": self._main_hits,
+            "window_hit_share": self._window_hits / hits if hits else 0,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+        }
+
+
+EVICTION_POLICIES: Final[dict[str, type[EvictionPolicy]]] = {
+    policy.name: policy for policy in (LRUPolicy, LFUPolicy, TinyLFUPolicy)
+}
+
+
+def create_policy(name: str, max_size: int) -> EvictionPolicy:
+    """Return a new eviction policy called ``name``."""
+    try:
+        policy = EVICTION_POLICIES[name]
+    except KeyError:
+        msg = (
+            f"Unknown eviction policy {name!r}; "
+            f"expected one of {sorted(EVICTION_POLICIES)}"
+        )
+        raise ValueError(msg) from None
+    return policy(max_size)
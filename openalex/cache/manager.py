@@ -2,25 +2,83 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
+import time
 import weakref
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Final, TypeVar, cast
 
 from structlog import get_logger
 
-__all__ = ["CacheManager", "clear_cache", "get_cache_manager"]
+from ..exceptions import NotFoundError
+
+__all__ = ["NOT_FOUND", "CacheManager", "clear_cache", "get_cache_manager"]
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    import os
+    from collections.abc import Awaitable, Callable, Iterable
 
     from ..config import OpenAlexConfig
-from .base import BaseCache, CacheKeyBuilder
+from .adapters import as_async_cache
+from .base import (
+    NOT_FOUND,
+    AsyncBaseCache,
+    BaseCache,
+    CacheEntry,
+    CacheKeyBuilder,
+    FetchResult,
+    conditional_headers,
+)
 from .memory import SmartMemoryCache
+from .sharded import ShardedMemoryCache, StripedLock
+from .snapshot import iter_snapshot, write_snapshot
+from .sweeper import ExpirySweeper
+from .ttl import TTLPolicy
 
 logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+REFRESH_WORKERS: Final = 4
+
+_FRESH: Final = "fresh"
+_STALE: Final = "stale"
+_EXPIRED: Final = "expired"
+
+#: Returned by :meth:`CacheManager._project_cached` when nothing covers a
+#: ``select`` request
+_NO_PROJECTION: Final = object()
+
+
+def _payload(fetched: Any) -> Any:
+    """Return the payload of a fetch result (or a plain payload)."""
+    return fetched.data if isinstance(fetched, FetchResult) else fetched
+
+
+def _body_size(fetched: Any) -> int | None:
+    """Return the response body length of a fetch result, if known."""
+    return fetched.size if isinstance(fetched, FetchResult) else None
+
+
+def _select_fields(params: dict[str, Any] | None) -> frozenset[str] | None:
+    """Return the field set a ``select`` parameter asks for, if any."""
+    select = (params or {}).get("select")
+    if not select:
+        return None
+    if isinstance(select, str):
+        select = select.split(",")
+    return frozenset(str(field).strip() for field in select if field)
+
+
+def _unselected_key(
+    endpoint: str, entity_id: str, params: dict[str, Any] | None
+) -> str:
+    """Return the cache key of the same request without ``select``."""
+    base = {k: v for k, v in (params or {}).items() if k != "select"}
+    return CacheKeyBuilder.build_key(endpoint, entity_id, base)
+
 
 class CacheManager:
     """Manages caching for OpenAlex API requests."""
@@ -28,13 +86,35 @@ class CacheManager:
     def __init__(self, config: OpenAlexConfig) -> None:
         self.config = config
         self._cache: BaseCache | None = None
-        self._locks: dict[str, threading.Lock] = {}
+        self._acache: AsyncBaseCache | None = None
+        self._sweeper: ExpirySweeper | None = None
+        self._locks = StripedLock()
+        self._ttl_policy = TTLPolicy.from_config(config)
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_executor: ThreadPoolExecutor | None = None
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._revalidations = 0
+        self._not_modified = 0
+        self._negative_hits = 0
+        self._negative_stores = 0
+        self._projected_hits = 0
+        # Entity key -> {selected fields: cache key} of cached select responses
+        self._projections: OrderedDict[str, dict[frozenset[str], str]] = (
+            OrderedDict()
+        )
 
         if config.cache_enabled:
-            self._cache = SmartMemoryCache(
-                max_size=config.cache_maxsize,
-                base_ttl=config.cache_ttl,
-            )
+            self._cache = _create_cache(config)
+            self._acache = as_async_cache(self._cache)
+            if config.cache_sweep_interval:
+                self._sweeper = ExpirySweeper(
+                    self._cache, config.cache_sweep_interval
+                )
+                self._sweeper.start()
 
     @property
     def enabled(self) -> bool:
@@ -45,59 +125,713 @@ class CacheManager:
         """Expose the underlying cache object, if enabled."""
         return self._cache if self.config.cache_enabled else None
 
-    def get_ttl_for_endpoint(self, endpoint: str) -> float:
+    @property
+    def acache(self) -> AsyncBaseCache | None:
+        """The cache behind the awaitable protocol used by async callers.
+
+        Operations on backends other than the memory caches run in worker
+        threads, so they never block the event loop.
+        """
+        return self._acache if self.config.cache_enabled else None
+
+    @property
+    def ttl_policy(self) -> TTLPolicy:
+        """The policy choosing each entry's TTL (see ``cache_ttl_rules``)."""
+        return self._ttl_policy
+
+    def get_ttl_for_endpoint(
+        self, endpoint: str, operation: str = "get"
+    ) -> float:
         """Public wrapper for ``_get_ttl_for_endpoint``."""
-        return self._get_ttl_for_endpoint(endpoint)
+        return self._get_ttl_for_endpoint(endpoint, operation)
+
+    def is_fresh(self, cache_key: str, ttl: float) -> bool:
+        """Return whether ``cache_key`` holds an entry still within ``ttl``.
+
+        Entries kept past their TTL, for stale-while-revalidate, for
+        revalidation or by an adaptive extension, are not fresh.
+        """
+        if not self.enabled:
+            return False
+
+        assert self._cache is not None
+        entry = self._cache.get_entry(cache_key)
+        return entry is not None and self._entry_state(entry, ttl) == _FRESH
 
     def get_or_fetch(
         self,
         endpoint: str,
-        fetch_func: Callable[[], T],
+        fetch_func: Callable[[], T | FetchResult],
         entity_id: str | None = None,
         params: dict[str, Any] | None = None,
         ttl: float | None = None,
+        revalidate_func: Callable[[dict[str, str]], FetchResult] | None = None,
     ) -> T:
-        if not self.enabled:
-            return fetch_func()
+        """Return the cached value for the request or fetch and cache it.
+
+        Once an entry is older than its TTL it is still returned for up to
+        ``cache_stale_ttl`` more seconds while one background refresh
+        revalidates it; a failed refresh keeps serving the stale value.
+
+        ``fetch_func`` may return a :class:`FetchResult` so the response's
+        ``ETag``/``Last-Modified`` validators are cached too. Such entries
+        are kept ``cache_revalidate_ttl`` seconds past their TTL and are
+        then refreshed through ``revalidate_func``, which is passed the
+        conditional request headers; a ``304`` answer only renews the TTL.
+
+        ``ttl`` defaults to the endpoint's ``get`` TTL; a TTL of ``0``, such
+        as a ``"*:autocomplete": 0`` rule, fetches without caching.
+
+        A ``select`` request for an entity is answered without fetching
+        when a fresh cached entry covering the selected fields exists (the
+        full entity or an earlier, wider ``select``).
+        """
+        cache_ttl = self._get_ttl_for_endpoint(endpoint) if ttl is None else ttl
+        if not self.enabled or cache_ttl <= 0:
+            return cast("T", _payload(fetch_func()))
 
         assert self._cache is not None
 
         cache_key = CacheKeyBuilder.build_key(endpoint, entity_id, params)
 
-        lock = self._locks.setdefault(cache_key, threading.Lock())
-        with lock:
-            cached_data = self._cache.get(cache_key)
-            if cached_data is not None:
-                logger.debug(
-                    "cache_hit",
-                    endpoint=endpoint,
-                    entity_id=entity_id,
-                    from_cache=True,
+        # The stripe only guards reading and filling the cache; concurrent
+        # fetches of one request are shared by the connection's coalescer
+        with self._locks.for_key(cache_key):
+            entry = self._cache.get_entry(cache_key)
+            if entry is not None and entry.data == NOT_FOUND:
+                self._raise_not_found(endpoint, entity_id)
+            if entry is None:
+                projected = self._project_cached(
+                    endpoint, entity_id, params, cache_ttl
                 )
-                if self.config.collect_metrics:
-                    from ..metrics import get_metrics_collector
-
-                    metrics = get_metrics_collector(self.config)
-                    metrics.record_cache_hit(endpoint)
-                return cast("T", cached_data)
-
-            logger.debug(
-                "cache_miss",
-                endpoint=endpoint,
-                entity_id=entity_id,
-                from_cache=False,
+                if projected is not _NO_PROJECTION:
+                    return cast("T", projected)
+            state = self._entry_state(entry, cache_ttl)
+            if entry is not None and state != _EXPIRED:
+                self._record_hit(endpoint, entity_id)
+                if state == _STALE and self._claim_refresh(cache_key):
+                    self._get_refresh_executor().submit(
+                        self._refresh,
+                        cache_key,
+                        entry,
+                        fetch_func,
+                        revalidate_func,
+                        cache_ttl,
+                    )
+                return cast("T", entry.data)
+
+        self._record_miss(endpoint, entity_id)
+        try:
+            if (
+                entry is not None
+                and entry.validators
+                and revalidate_func is not None
+            ):
+                fetched = self._revalidate(entry, revalidate_func)
+            else:
+                fetched = fetch_func()
+        except NotFoundError:
+            with self._locks.for_key(cache_key):
+                self._store_not_found(cache_key)
+            raise
+        with self._locks.for_key(cache_key):
+            data = self._store_fetched(cache_key, fetched, cache_ttl, entry)
+            self._record_projection(endpoint, entity_id, params, cache_key)
+        return cast("T", data)
+
+    async def aget_or_fetch(
+        self,
+        endpoint: str,
+        fetch_func: Callable[[], Awaitable[T | FetchResult]],
+        entity_id: str | None = None,
+        params: dict[str, Any] | None = None,
+        ttl: float | None = None,
+        revalidate_func: Callable[[dict[str, str]], Awaitable[FetchResult]]
+        | None = None,
+    ) -> T:
+        """Async :meth:`get_or_fetch`; stale entries refresh in a task.
+
+        Cache reads and writes go through :attr:`acache`.
+        """
+        cache_ttl = self._get_ttl_for_endpoint(endpoint) if ttl is None else ttl
+        if not self.enabled or cache_ttl <= 0:
+            return cast("T", _payload(await fetch_func()))
+
+        assert self._acache is not None
+
+        cache_key = CacheKeyBuilder.build_key(endpoint, entity_id, params)
+
+        entry = await self._acache.aget_entry(cache_key)
+        if entry is not None and entry.data == NOT_FOUND:
+            self._raise_not_found(endpoint, entity_id)
+        if entry is None:
+            projected = await self._aproject_cached(
+                endpoint, entity_id, params, cache_ttl
             )
+            if projected is not _NO_PROJECTION:
+                return cast("T", projected)
+        state = self._entry_state(entry, cache_ttl)
+        if entry is not None and state != _EXPIRED:
+            self._record_hit(endpoint, entity_id)
+            if state == _STALE and self._claim_refresh(cache_key):
+                task = asyncio.get_running_loop().create_task(
+                    self._arefresh(
+                        cache_key, entry, fetch_func, revalidate_func, cache_ttl
+                    )
+                )
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return cast("T", entry.data)
 
-            if self.config.collect_metrics:
-                from ..metrics import get_metrics_collector
+        self._record_miss(endpoint, entity_id)
+        try:
+            if (
+                entry is not None
+                and entry.validators
+                and revalidate_func is not None
+            ):
+                fetched = await self._arevalidate(entry, revalidate_func)
+            else:
+                fetched = await fetch_func()
+        except NotFoundError:
+            await self._astore_not_found(cache_key)
+            raise
+        data = await self._astore_fetched(cache_key, fetched, cache_ttl, entry)
+        self._record_projection(endpoint, entity_id, params, cache_key)
+        return cast("T", data)
 
-                metrics = get_metrics_collector(self.config)
-                metrics.record_cache_miss(endpoint)
+    def _project_cached(
+        self,
+        endpoint: str,
+        entity_id: str | None,
+        params: dict[str, Any] | None,
+        ttl: float,
+    ) -> Any:
+        """Answer a ``select`` request from a cached superset entry.
+
+        The entity cached without ``select`` covers every field; earlier
+        ``select`` responses cover the fields they asked for. The first
+        fresh candidate is trimmed to the requested fields locally.
+        Returns ``_NO_PROJECTION`` when no cached entry covers them.
+        """
+        fields, candidates = self._projection_candidates(
+            endpoint, entity_id, params
+        )
+        assert self._cache is not None
+        for key in candidates:
+            projected = self._project(
+                self._cache.get_entry(key), fields, ttl, endpoint, entity_id
+            )
+            if projected is not _NO_PROJECTION:
+                return projected
+        return _NO_PROJECTION
+
+    async def _aproject_cached(
+        self,
+        endpoint: str,
+        entity_id: str | None,
+        params: dict[str, Any] | None,
+        ttl: float,
+    ) -> Any:
+        """Async :meth:`_project_cached`."""
+        fields, candidates = self._projection_candidates(
+            endpoint, entity_id, params
+        )
+        assert self._acache is not None
+        for key in candidates:
+            projected = self._project(
+                await self._acache.aget_entry(key),
+                fields,
+                ttl,
+                endpoint,
+                entity_id,
+            )
+            if projected is not _NO_PROJECTION:
+                return projected
+        return _NO_PROJECTION
+
+    def _projection_candidates(
+        self,
+        endpoint: str,
+        entity_id: str | None,
+        params: dict[str, Any] | None,
+    ) -> tuple[frozenset[str], list[str]]:
+        """Return the selected fields and the keys of entries covering them."""
+        fields = _select_fields(params)
+        if entity_id is None or fields is None:
+            return frozenset(), []
+        base_key = _unselected_key(endpoint, entity_id, params)
+        candidates = [base_key]
+        with self._refresh_lock:
+            covered = self._projections.get(base_key, {})
+            candidates.extend(
+                key for selected, key in covered.items() if fields <= selected
+            )
+        return fields, candidates
+
+    def _project(
+        self,
+        entry: CacheEntry | None,
+        fields: frozenset[str],
+        ttl: float,
+        endpoint: str,
+        entity_id: str | None,
+    ) -> Any:
+        """Trim a fresh candidate entry to ``fields``."""
+        if entry is None or self._entry_state(entry, ttl) != _FRESH:
+            return _NO_PROJECTION
+        if entry.data == NOT_FOUND:
+            self._raise_not_found(endpoint, entity_id)
+        if not isinstance(entry.data, dict):
+            return _NO_PROJECTION
+        with self._refresh_lock:
+            self._projected_hits += 1
+        self._record_hit(endpoint, entity_id)
+        return {
+            field: entry.data[field] for field in entry.data if field in fields
+        }
+
+    def _record_projection(
+        self,
+        endpoint: str,
+        entity_id: str | None,
+        params: dict[str, Any] | None,
+        cache_key: str,
+    ) -> None:
+        """Remember which fields the ``select`` entry at ``cache_key`` has."""
+        fields = _select_fields(params)
+        if entity_id is None or fields is None:
+            return
+        base_key = _unselected_key(endpoint, entity_id, params)
+        with self._refresh_lock:
+            self._projections.setdefault(base_key, {})[fields] = cache_key
+            self._projections.move_to_end(base_key)
+            # Bounded like the cache itself; a forgotten field set only
+            # costs a refetch
+            while len(self._projections) > self.config.cache_maxsize:
+                self._projections.popitem(last=False)
+
+    def _record_hit(self, endpoint: str, entity_id: str | None) -> None:
+        logger.debug(
+            "cache_hit",
+            endpoint=endpoint,
+            entity_id=entity_id,
+            from_cache=True,
+        )
+        if self.config.collect_metrics:
+            from ..metrics import get_metrics_collector
 
-            data = fetch_func()
-            cache_ttl = ttl or self._get_ttl_for_endpoint(endpoint)
-            self._cache.set(cache_key, data, cache_ttl)
-            return data
+            metrics = get_metrics_collector(self.config)
+            metrics.record_cache_hit(endpoint)
+
+    def _record_miss(self, endpoint: str, entity_id: str | None) -> None:
+        logger.debug(
+            "cache_miss",
+            endpoint=endpoint,
+            entity_id=entity_id,
+            from_cache=False,
+        )
+        if self.config.collect_metrics:
+            from ..metrics import get_metrics_collector
+
+            metrics = get_metrics_collector(self.config)
+            metrics.record_cache_miss(endpoint)
+
+    def _store(
+        self,
+        cache_key: str,
+        data: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Cache ``data`` for ``ttl`` seconds plus its retention window.
+
+        Stable payloads may be kept longer; see :meth:`TTLPolicy.for_payload`.
+        ``size`` is the response body length, when known.
+        """
+        assert self._cache is not None
+        ttl = self._retained_ttl(
+            self._ttl_policy.for_payload(ttl, data), validators
+        )
+        if size is not None:
+            self._cache.set_entry(
+                cache_key, CacheEntry.create(data, ttl, size, validators)
+            )
+        elif validators:
+            self._cache.set(cache_key, data, ttl, validators)
+        else:
+            self._cache.set(cache_key, data, ttl)
+
+    async def _astore(
+        self,
+        cache_key: str,
+        data: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Async :meth:`_store`."""
+        assert self._acache is not None
+        ttl = self._retained_ttl(
+            self._ttl_policy.for_payload(ttl, data), validators
+        )
+        if size is not None:
+            await self._acache.aset_entry(
+                cache_key, CacheEntry.create(data, ttl, size, validators)
+            )
+        elif validators:
+            await self._acache.aset(cache_key, data, ttl, validators)
+        else:
+            await self._acache.aset(cache_key, data, ttl)
+
+    def _retained_ttl(
+        self, ttl: float, validators: dict[str, str] | None
+    ) -> float:
+        """Return ``ttl`` extended by the entry's retention window."""
+        window = self.config.cache_stale_ttl
+        if validators:
+            window = max(window, self.config.cache_revalidate_ttl)
+        return ttl + window
+
+    def _store_not_found(self, cache_key: str) -> None:
+        """Remember a missing entity for ``cache_negative_ttl`` seconds."""
+        assert self._cache is not None
+        if not self.config.cache_negative_ttl:
+            return
+        self._cache.set(cache_key, NOT_FOUND, self.config.cache_negative_ttl)
+        with self._refresh_lock:
+            self._negative_stores += 1
+
+    async def _astore_not_found(self, cache_key: str) -> None:
+        """Async :meth:`_store_not_found`."""
+        assert self._acache is not None
+        if not self.config.cache_negative_ttl:
+            return
+        await self._acache.aset(
+            cache_key, NOT_FOUND, self.config.cache_negative_ttl
+        )
+        with self._refresh_lock:
+            self._negative_stores += 1
+
+    def _raise_not_found(self, endpoint: str, entity_id: str | None) -> None:
+        """Answer a request for an entity cached as missing."""
+        with self._refresh_lock:
+            self._negative_hits += 1
+        logger.debug(
+            "cache_negative_hit", endpoint=endpoint, entity_id=entity_id
+        )
+        msg = f"{endpoint} entity {entity_id} not found (cached)"
+        raise NotFoundError(msg, resource_id=entity_id, resource_type=endpoint)
+
+    def _store_fetched(
+        self,
+        cache_key: str,
+        fetched: Any,
+        ttl: float,
+        previous: CacheEntry | None,
+    ) -> Any:
+        """Cache a fetch result and return its payload.
+
+        A ``304`` result renews ``previous`` instead of replacing it.
+        """
+        data, validators = self._resolve_fetched(cache_key, fetched, previous)
+        self._store(cache_key, data, ttl, validators, _body_size(fetched))
+        return data
+
+    async def _astore_fetched(
+        self,
+        cache_key: str,
+        fetched: Any,
+        ttl: float,
+        previous: CacheEntry | None,
+    ) -> Any:
+        """Async :meth:`_store_fetched`."""
+        data, validators = self._resolve_fetched(cache_key, fetched, previous)
+        await self._astore(
+            cache_key, data, ttl, validators, _body_size(fetched)
+        )
+        return data
+
+    def _resolve_fetched(
+        self,
+        cache_key: str,
+        fetched: Any,
+        previous: CacheEntry | None,
+    ) -> tuple[Any, dict[str, str] | None]:
+        """Return the payload and validators a fetch result should cache."""
+        if not isinstance(fetched, FetchResult):
+            return fetched, None
+        if fetched.not_modified and previous is not None:
+            validators = {**(previous.validators or {})}
+            validators.update(fetched.validators or {})
+            with self._refresh_lock:
+                self._not_modified += 1
+            logger.debug("cache_not_modified", key=cache_key)
+            return previous.data, validators
+        return fetched.data, fetched.validators
+
+    def _entry_state(self, entry: CacheEntry | None, ttl: float) -> str:
+        """Classify an entry as fresh, stale or expired (needing a request).
+
+        Entries are stale for ``cache_stale_ttl`` seconds past their TTL.
+        An entry the backend kept alive beyond that by an adaptive
+        extension stays stale, so it is served while a refresh runs; any
+        other entry past the window, such as one retained only for
+        revalidation, is expired.
+        """
+        if entry is None:
+            return _EXPIRED
+        ttl = self._ttl_policy.for_payload(ttl, entry.data, entry.created_at)
+        age = time.time() - entry.created_at
+        if age <= ttl:
+            return _FRESH
+        if age <= ttl + self.config.cache_stale_ttl or entry.extended:
+            return _STALE
+        return _EXPIRED
+
+    def _revalidate(
+        self,
+        entry: CacheEntry,
+        revalidate_func: Callable[[dict[str, str]], FetchResult],
+    ) -> FetchResult:
+        with self._refresh_lock:
+            self._revalidations += 1
+        return revalidate_func(conditional_headers(entry.validators or {}))
+
+    async def _arevalidate(
+        self,
+        entry: CacheEntry,
+        revalidate_func: Callable[[dict[str, str]], Awaitable[FetchResult]],
+    ) -> FetchResult:
+        with self._refresh_lock:
+            self._revalidations += 1
+        return await revalidate_func(
+            conditional_headers(entry.validators or {})
+        )
+
+    def _claim_refresh(self, cache_key: str) -> bool:
+        """Reserve the refresh of ``cache_key``; ``False`` if one is running."""
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return False
+            self._refreshing.add(cache_key)
+            self._stale_hits += 1
+            return True
+
+    def _finish_refresh(self, cache_key: str, error: Exception | None) -> None:
+        with self._refresh_lock:
+            self._refreshing.discard(cache_key)
+            if error is None:
+                self._refreshes += 1
+            else:
+                self._refresh_failures += 1
+        if error is not None:
+            logger.warning(
+                "cache_refresh_failed", key=cache_key, error=str(error)
+            )
+
+    def _get_refresh_executor(self) -> ThreadPoolExecutor:
+        with self._refresh_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=REFRESH_WORKERS,
+                    thread_name_prefix="openalex-cache-refresh",
+                )
+            return self._refresh_executor
+
+    def _refresh(
+        self,
+        cache_key: str,
+        entry: CacheEntry,
+        fetch_func: Callable[[], Any],
+        revalidate_func: Callable[[dict[str, str]], FetchResult] | None,
+        ttl: float,
+    ) -> None:
+        """Refetch a stale entry; on failure the stale value stays cached."""
+        try:
+            if entry.validators and revalidate_func is not None:
+                fetched = self._revalidate(entry, revalidate_func)
+            else:
+                fetched = fetch_func()
+            self._store_fetched(cache_key, fetched, ttl, entry)
+        except Exception as e:
+            self._finish_refresh(cache_key, e)
+        else:
+            self._finish_refresh(cache_key, None)
+
+    async def _arefresh(
+        self,
+        cache_key: str,
+        entry: CacheEntry,
+        fetch_func: Callable[[], Awaitable[Any]],
+        revalidate_func: Callable[[dict[str, str]], Awaitable[FetchResult]]
+        | None,
+        ttl: float,
+    ) -> None:
+        """Async :meth:`_refresh`."""
+        try:
+            if entry.validators and revalidate_func is not None:
+                fetched = await self._arevalidate(entry, revalidate_func)
+            else:
+                fetched = await fetch_func()
+            await self._astore_fetched(cache_key, fetched, ttl, entry)
+        except Exception as e:
+            self._finish_refresh(cache_key, e)
+        else:
+            self._finish_refresh(cache_key, None)
+
+    def get_many(
+        self,
+        endpoint: str,
+        entity_ids: Iterable[str],
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Return cached payloads for ``entity_ids`` that are present."""
+        return self.lookup_many(endpoint, entity_ids, params)[0]
+
+    def lookup_many(
+        self,
+        endpoint: str,
+        entity_ids: Iterable[str],
+        params: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Return fresh cached payloads and the IDs cached as not found.
+
+        IDs whose entries are stale or expired are in neither, so callers
+        fetch them again.
+        """
+        if not self.enabled:
+            return {}, set()
+
+        assert self._cache is not None
+        entries: dict[str, CacheEntry] = {}
+        for entity_id in entity_ids:
+            cache_key = CacheKeyBuilder.build_key(endpoint, entity_id, params)
+            entry = self._cache.get_entry(cache_key)
+            if entry is not None:
+                entries[entity_id] = entry
+        return self._split_cached(endpoint, entries)
+
+    async def alookup_many(
+        self,
+        endpoint: str,
+        entity_ids: Iterable[str],
+        params: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Async :meth:`lookup_many`, reading all keys in one cache call."""
+        if not self.enabled:
+            return {}, set()
+
+        assert self._acache is not None
+        keys = {
+            CacheKeyBuilder.build_key(endpoint, entity_id, params): entity_id
+            for entity_id in entity_ids
+        }
+        cached = await self._acache.aget_entries(keys)
+        return self._split_cached(
+            endpoint,
+            {keys[cache_key]: entry for cache_key, entry in cached.items()},
+        )
+
+    def _split_cached(
+        self, endpoint: str, entries: dict[str, CacheEntry]
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Split cached entries into fresh payloads and not-found IDs."""
+        ttl = self._get_ttl_for_endpoint(endpoint)
+        found: dict[str, Any] = {}
+        missing: set[str] = set()
+        for entity_id, entry in entries.items():
+            if entry.data == NOT_FOUND:
+                missing.add(entity_id)
+            elif self._entry_state(entry, ttl) == _FRESH:
+                found[entity_id] = entry.data
+        if missing:
+            with self._refresh_lock:
+                self._negative_hits += len(missing)
+        return found, missing
+
+    def set_missing(
+        self,
+        endpoint: str,
+        entity_ids: Iterable[str],
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Cache ``entity_ids`` as not found for ``cache_negative_ttl``."""
+        if not self.enabled:
+            return
+
+        for entity_id in entity_ids:
+            cache_key = CacheKeyBuilder.build_key(endpoint, entity_id, params)
+            self._store_not_found(cache_key)
+
+    async def aset_missing(
+        self,
+        endpoint: str,
+        entity_ids: Iterable[str],
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Async :meth:`set_missing`."""
+        if not self.enabled or not self.config.cache_negative_ttl:
+            return
+
+        assert self._acache is not None
+        keys = [
+            CacheKeyBuilder.build_key(endpoint, entity_id, params)
+            for entity_id in entity_ids
+        ]
+        await self._acache.aset_many(
+            dict.fromkeys(keys, NOT_FOUND), self.config.cache_negative_ttl
+        )
+        with self._refresh_lock:
+            self._negative_stores += len(keys)
+
+    def set_many(
+        self,
+        endpoint: str,
+        entries: dict[str, Any],
+        params: dict[str, Any] | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Store several per-entity payloads under their entity cache keys."""
+        cache_ttl = self._get_ttl_for_endpoint(endpoint) if ttl is None else ttl
+        if not self.enabled or cache_ttl <= 0:
+            return
+
+        for entity_id, data in entries.items():
+            cache_key = CacheKeyBuilder.build_key(endpoint, entity_id, params)
+            self._store(cache_key, data, cache_ttl)
+
+    async def aset_many(
+        self,
+        endpoint: str,
+        entries: dict[str, Any],
+        params: dict[str, Any] | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Async :meth:`set_many`, writing all entries in one cache call."""
+        rule_ttl = self._get_ttl_for_endpoint(endpoint) if ttl is None else ttl
+        if not self.enabled or not entries or rule_ttl <= 0:
+            return
+
+        assert self._acache is not None
+        if self._ttl_policy.age_factor:
+            # TTLs differ per payload
+            for entity_id, data in entries.items():
+                await self._astore(
+                    CacheKeyBuilder.build_key(endpoint, entity_id, params),
+                    data,
+                    rule_ttl,
+                )
+            return
+        cache_ttl = self._retained_ttl(rule_ttl, None)
+        await self._acache.aset_many(
+            {
+                CacheKeyBuilder.build_key(endpoint, entity_id, params): data
+                for entity_id, data in entries.items()
+            },
+            cache_ttl,
+        )
 
     def invalidate(
         self,
@@ -116,17 +850,94 @@ class CacheManager:
         if self.enabled:
             assert self._cache is not None
             self._cache.clear()
+            with self._refresh_lock:
+                self._projections.clear()
+
+    def close(self) -> None:
+        """Stop background work: expiry sweeps and the refresh workers.
+
+        The manager stays usable; expired entries are then dropped when
+        read.
+        """
+        if self._sweeper is not None:
+            self._sweeper.stop(timeout=1.0)
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def stats(self) -> dict[str, Any]:
         if not self.enabled:
             return {"enabled": False}
 
         assert self._cache is not None
+        with self._refresh_lock:
+            refresh_stats = {
+                "stale_hits": self._stale_hits,
+                "refreshes": self._refreshes,
+                "refresh_failures": self._refresh_failures,
+                "revalidations": self._revalidations,
+                "not_modified": self._not_modified,
+                "negative_hits": self._negative_hits,
+                "negative_stores": self._negative_stores,
+                "projected_hits": self._projected_hits,
+            }
+        if self._sweeper is not None:
+            refresh_stats["sweeps"] = self._sweeper.sweeps
         return {
             "enabled": True,
             **self._cache.stats(),
+            **refresh_stats,
         }
 
+    def export_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """Write every unexpired entry to a snapshot file at ``path``.
+
+        Entries keep their remaining TTLs (see :mod:`.snapshot` for the
+        format). Returns the number of entries written.
+        """
+        if not self.enabled:
+            return 0
+
+        assert self._cache is not None
+        start = time.perf_counter()
+        written = write_snapshot(path, self._cache.entries())
+        logger.info(
+            "cache_snapshot_exported",
+            path=str(path),
+            entries=written,
+            duration_ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+        return written
+
+    def load_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """Load the entries of a snapshot written by :meth:`export_snapshot`.
+
+        The whole file is checked before anything is stored, so a truncated
+        or corrupt snapshot raises ``ValueError`` and leaves the cache as
+        it was; entries are then decoded and stored one at a time, at the
+        cost of reading the file twice (see :func:`.snapshot.iter_snapshot`).
+        Entries that expired since the snapshot was written are skipped.
+        The rest keep their age and remaining TTL and replace any cached
+        value. Returns the number of entries loaded.
+        """
+        if not self.enabled:
+            return 0
+
+        assert self._cache is not None
+        start = time.perf_counter()
+        loaded = 0
+        for key, entry in iter_snapshot(path):
+            self._cache.set_entry(key, entry)
+            loaded += 1
+        logger.info(
+            "cache_snapshot_loaded",
+            path=str(path),
+            entries=loaded,
+            duration_ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+        return loaded
+
     def warm_cache(
         self,
         endpoint: str,
@@ -141,10 +952,8 @@ class CacheManager:
                 cache_key = CacheKeyBuilder.build_key(endpoint, entity_id)
                 if self._cache and not self._cache.get(cache_key):
                     data = fetch_func(entity_id)
-                    self._cache.set(
-                        cache_key,
-                        data,
-                        self._get_ttl_for_endpoint(endpoint),
+                    self._store(
+                        cache_key, data, self._get_ttl_for_endpoint(endpoint)
                     )
                     results[entity_id] = True
                 else:
@@ -155,11 +964,47 @@ class CacheManager:
 
         return results
 
-    def _get_ttl_for_endpoint(self, _endpoint: str) -> float:
-        return float(self.config.cache_ttl)
+    def _get_ttl_for_endpoint(
+        self, endpoint: str, operation: str = "get"
+    ) -> float:
+        return self._ttl_policy.ttl(endpoint, operation)
+
+
+def _create_cache(config: OpenAlexConfig) -> BaseCache:
+    """Build the cache backend selected by ``config.cache_backend``."""
+    if config.cache_backend == "sqlite":
+        from .sqlite import SQLiteCache
+
+        return SQLiteCache(
+            config.cache_path, max_size=config.cache_sqlite_maxsize
+        )
+    options: dict[str, Any] = {
+        "max_size": config.cache_maxsize,
+        "base_ttl": config.cache_ttl,
+        "policy": config.cache_eviction_policy,
+        "max_bytes": config.cache_max_bytes,
+        "compress_threshold": config.cache_compress_threshold,
+    }
+    memory: BaseCache
+    if config.cache_shards > 1:
+        memory = ShardedMemoryCache.create(
+            SmartMemoryCache, config.cache_shards, **options
+        )
+    else:
+        memory = SmartMemoryCache(**options)
+    if config.cache_backend == "tiered":
+        from .sqlite import SQLiteCache
+        from .tiered import TieredCache
+
+        disk = SQLiteCache(config.cache_path, max_size=config.cache_l2_maxsize)
+        assert isinstance(memory, SmartMemoryCache | ShardedMemoryCache)
+        return TieredCache(memory, disk)
+    return memory
 
 
-_cache_managers: dict[int, tuple[weakref.ReferenceType[OpenAlexConfig], CacheManager]] = {}
+_cache_managers: dict[
+    int, tuple[weakref.ReferenceType[OpenAlexConfig], CacheManager]
+] = {}
 
 
 def get_cache_manager(config: OpenAlexConfig) -> CacheManager:
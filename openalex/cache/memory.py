@@ -2,82 +2,352 @@
 
 from __future__ import annotations
 
+import heapq
+import json
+import sys
 import threading
 import time
-from typing import Any
+import zlib
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Final
 
 from structlog import get_logger
 
 from ..metrics import get_collector
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
 __all__ = [
     "MemoryCache",
     "SmartMemoryCache",
 ]
 
-from .base import BaseCache, CacheEntry
+from .base import NOT_FOUND, BaseCache, CacheEntry
+from .eviction import create_policy
 
 logger = get_logger(__name__)
 
 
+DEFAULT_COMPRESS_LEVEL: Final = 6
+#: Most expired entries :meth:`MemoryCache.expire` drops per lock hold
+EXPIRE_BATCH: Final = 1000
+
+
+class _Compressed:
+    """A value held as zlib-compressed JSON until it is read."""
+
+    __slots__ = ("blob",)
+
+    def __init__(self, blob: bytes) -> None:
+        self.blob = blob
+
+    def decode(self) -> Any:
+        return json.loads(zlib.decompress(self.blob))
+
+
+def _json_body(value: Any) -> bytes | None:
+    """Return ``value`` as compact JSON, or ``None`` if it is not JSON."""
+    try:
+        return json.dumps(value, separators=(",", ":")).encode()
+    except (TypeError, ValueError):
+        return None
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate an entry's size as the length of its compact JSON body."""
+    if isinstance(value, bytes | bytearray | str):
+        return len(value)
+    try:
+        return len(json.dumps(value, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
 class MemoryCache(BaseCache):
     """Thread-safe in-memory cache implementation."""
 
-    def __init__(self, max_size: int = 1000) -> None:
-        """Initialize memory cache with maximum size limit."""
+    def __init__(
+        self,
+        max_size: int = 1000,
+        policy: str = "lru",
+        max_bytes: int | None = None,
+        compress_threshold: int | None = None,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        on_evict: Callable[[str, CacheEntry], None] | None = None,
+    ) -> None:
+        """Initialize memory cache with maximum size and eviction policy.
+
+        ``policy`` is ``"lru"``, ``"lfu"`` or ``"tinylfu"``; see
+        :mod:`openalex.cache.eviction`. With ``max_bytes`` entries are also
+        evicted to keep their estimated total size within that budget.
+        Values whose JSON body reaches ``compress_threshold`` bytes are
+        stored zlib-compressed and decoded on each hit. ``on_evict`` is
+        called with the key and decoded entry of every unexpired entry the
+        policy evicts, outside the cache lock.
+        """
         self._cache: dict[str, CacheEntry] = {}
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._compress_threshold = compress_threshold
+        self._compress_level = compress_level
+        self._bytes = 0
+        self._policy = create_policy(policy, max_size)
         self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._expired = 0
+        # (expires_at, key) heap; superseded records are skipped when popped
+        self._expiry: list[tuple[float, str]] = []
+        self.on_evict = on_evict
 
     def get(self, key: str) -> Any | None:
         """Get a value from the cache."""
-        collector = get_collector()
+        entry = self.get_entry(key)
+        return None if entry is None else entry.data
 
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get a copy of the entry for ``key`` holding its decoded value."""
+        # Logging and metrics stay outside the lock to keep it short
         with self._lock:
             entry = self._cache.get(key)
-            if entry is None:
+            expired = entry is not None and entry.is_expired()
+            if entry is None or expired:
+                if expired:
+                    self._remove(key)
+                self._policy.record_miss(key)
                 self._misses += 1
-                collector.record_cache_miss()
-                logger.debug("cache_miss", key=key)
-                return None
-            if entry.is_expired():
-                del self._cache[key]
-                self._misses += 1
-                collector.record_cache_miss()
-                logger.debug("cache_expired", key=key)
-                return None
-            entry.increment_hits()
-            self._hits += 1
-            collector.record_cache_hit()
-            logger.debug("cache_hit", key=key, hits=entry.hit_count)
-            return entry.data
-
-    def set(self, key: str, value: Any, ttl: float) -> None:
+                entry = None
+            else:
+                entry.increment_hits()
+                self._policy.record_hit(key)
+                self._hits += 1
+                entry = replace(entry)
+
+        collector = get_collector()
+        if entry is None:
+            collector.record_cache_miss()
+            logger.debug("cache_expired" if expired else "cache_miss", key=key)
+            return None
+        collector.record_cache_hit()
+        logger.debug("cache_hit", key=key, hits=entry.hit_count)
+        entry.data = self._unpack(entry.data)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
         """Set a value in the cache with TTL in seconds."""
+        self._put(key, CacheEntry.create(value, ttl, validators=validators))
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry``, keeping its expiry, creation time and validators.
+
+        A positive ``entry.size``, such as the response body length, is
+        taken as the entry's size instead of an estimate.
+        """
+        self._put(key, replace(entry, hit_count=0))
+
+    def _put(self, key: str, entry: CacheEntry) -> None:
+        """Pack the value of a new ``entry`` and store it under ``key``."""
+        entry.data, entry.size = self._pack(entry.data, entry.size or None)
+        evicted: list[tuple[str, CacheEntry]] = []
+        with self._lock:
+            too_large = (
+                self._max_bytes is not None and entry.size > self._max_bytes
+            )
+            if too_large:
+                self._remove(key)
+            else:
+                self._insert(key, entry, evicted)
+
+        if too_large:
+            logger.debug("cache_entry_too_large", key=key, size=entry.size)
+            return
+        for victim, _ in evicted:
+            logger.debug("cache_evicted", key=victim, policy=self._policy.name)
+        logger.debug(
+            "cache_set", key=key, ttl=entry.expires_at - entry.created_at
+        )
+        if evicted and self.on_evict is not None:
+            self._notify_evicted(evicted)
+
+    def _insert(
+        self,
+        key: str,
+        entry: CacheEntry,
+        evicted: list[tuple[str, CacheEntry]],
+    ) -> None:
+        """Store a packed entry, appending the entries evicted for room."""
+        current = self._cache.get(key)
+        if current is not None and not self._over_budget(
+            entry.size - current.size, new_entry=False
+        ):
+            self._policy.on_hit(key)
+            self._bytes -= current.size
+        else:
+            # A replacement that needs room is re-inserted from scratch
+            self._remove(key)
+            while self._over_budget(entry.size, new_entry=True):
+                victim = self._evict()
+                if victim is None:
+                    break
+                evicted.append(victim)
+            self._policy.on_insert(key)
+        self._cache[key] = entry
+        self._bytes += entry.size
+        self._schedule(key, entry.expires_at)
+
+    def _schedule(self, key: str, expires_at: float) -> None:
+        """Record when ``key`` expires; call with the lock held."""
+        heapq.heappush(self._expiry, (expires_at, key))
+        if len(self._expiry) > 2 * len(self._cache) + EXPIRE_BATCH:
+            # Rebuild once superseded records dominate the heap
+            self._expiry = [(e.expires_at, k) for k, e in self._cache.items()]
+            heapq.heapify(self._expiry)
+
+    def expire(self) -> int:
+        """Drop every expired entry now; return how many were dropped.
+
+        Entries are popped from the expiry heap in expiry order, so the
+        work done is proportional to the entries that actually expired.
+        A record older than its entry's expiry (the entry was replaced or
+        its TTL extended) is pushed back with the current expiry, so TTL
+        extensions need not add records of their own. The lock is released
+        every ``EXPIRE_BATCH`` entries.
+        """
+        removed = 0
+        done = False
+        while not done:
+            now = time.time()
+            with self._lock:
+                popped = dropped = 0
+                while (
+                    self._expiry
+                    and self._expiry[0][0] <= now
+                    and popped < EXPIRE_BATCH
+                ):
+                    expires_at, key = heapq.heappop(self._expiry)
+                    popped += 1
+                    entry = self._cache.get(key)
+                    if entry is None:
+                        continue
+                    if entry.expires_at <= now:
+                        self._remove(key)
+                        dropped += 1
+                    elif entry.expires_at > expires_at:
+                        heapq.heappush(self._expiry, (entry.expires_at, key))
+                self._expired += dropped
+                done = popped < EXPIRE_BATCH
+            removed += dropped
+        if removed:
+            logger.debug("cache_expired_swept", count=removed)
+        return removed
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        """Yield copies of the unexpired entries with decoded values.
+
+        The entries are copied under the lock in one pass and decoded
+        while iterating, so writers are only blocked for the copy.
+        """
+        now = time.time()
         with self._lock:
-            if len(self._cache) >= self._max_size:
-                self._evict_oldest()
-            self._cache[key] = CacheEntry.create(value, ttl)
-            logger.debug("cache_set", key=key, ttl=ttl)
+            live = [
+                (key, replace(entry))
+                for key, entry in self._cache.items()
+                if entry.expires_at > now
+            ]
+        for key, entry in live:
+            entry.data = self._unpack(entry.data)
+            yield key, entry
+
+    def _notify_evicted(self, evicted: list[tuple[str, CacheEntry]]) -> None:
+        """Hand evicted entries that are still fresh to ``on_evict``."""
+        assert self.on_evict is not None
+        now = time.time()
+        for key, entry in evicted:
+            if entry.expires_at > now:
+                entry.data = self._unpack(entry.data)
+                self.on_evict(key, entry)
+
+    def _pack(self, value: Any, size: int | None = None) -> tuple[Any, int]:
+        """Return the value to store and its size in bytes.
+
+        ``size`` is the value's body length when the caller knows it.
+        Otherwise the value is only encoded to measure it when it may be
+        compressed or counts against a byte budget; unbudgeted entries of
+        unknown size count as zero bytes.
+        """
+        threshold = self._compress_threshold
+        if threshold is not None and not isinstance(
+            value, bytes | bytearray | str
+        ):
+            if size is not None and size < threshold:
+                return value, size
+            body = _json_body(value)
+            if body is not None:
+                if len(body) < threshold:
+                    return value, len(body)
+                blob = zlib.compress(body, self._compress_level)
+                return _Compressed(blob), len(blob)
+        if size is None:
+            size = 0 if self._max_bytes is None else _estimate_size(value)
+        return value, size
+
+    @staticmethod
+    def _unpack(data: Any) -> Any:
+        """Return the stored ``data`` decoded, timing any decompression."""
+        if not isinstance(data, _Compressed):
+            return data
+        start = time.perf_counter()
+        value = data.decode()
+        get_collector().record_cache_decode(
+            (time.perf_counter() - start) * 1000
+        )
+        return value
+
+    def _over_budget(self, added_bytes: int, *, new_entry: bool) -> bool:
+        """Whether adding ``added_bytes`` (and an entry) needs an eviction."""
+        if new_entry and len(self._cache) >= self._max_size:
+            return True
+        return (
+            self._max_bytes is not None
+            and self._bytes + added_bytes > self._max_bytes
+        )
+
+    def _remove(self, key: str) -> bool:
+        """Drop ``key`` and its accounting; return whether it was cached."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        self._policy.on_remove(key)
+        return True
 
     def delete(self, key: str) -> None:
         """Delete a value from the cache."""
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                logger.debug("cache_delete", key=key)
+            removed = self._remove(key)
+        if removed:
+            logger.debug("cache_delete", key=key)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._expiry.clear()
+            self._bytes = 0
+            self._policy.clear()
             self._hits = 0
             self._misses = 0
             self._evictions = 0
-            logger.info("cache_cleared")
+            self._expired = 0
+        logger.info("cache_cleared")
 
     def stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -87,23 +357,31 @@ class MemoryCache(BaseCache):
             return {
                 "size": len(self._cache),
                 "max_size": self._max_size,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "compressed_entries": sum(
+                    isinstance(entry.data, _Compressed)
+                    for entry in self._cache.values()
+                ),
                 "hits": self._hits,
                 "misses": self._misses,
                 "evictions": self._evictions,
+                "expired": self._expired,
                 "hit_rate": hit_rate,
                 "total_requests": total_requests,
+                "eviction_policy": self._policy.name,
+                "policy": self._policy.stats(),
             }
 
-    def _evict_oldest(self) -> None:
-        """Evict the oldest entry when cache is full."""
-        if not self._cache:
-            return
-        oldest_key = min(
-            self._cache.keys(), key=lambda k: self._cache[k].created_at
-        )
-        del self._cache[oldest_key]
+    def _evict(self) -> tuple[str, CacheEntry] | None:
+        """Evict the entry chosen by the eviction policy, if any."""
+        key = self._policy.victim()
+        if key is None:
+            return None
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
         self._evictions += 1
-        logger.debug("cache_evicted", key=oldest_key)
+        return key, entry
 
 
 class SmartMemoryCache(MemoryCache):
@@ -115,37 +393,76 @@ class SmartMemoryCache(MemoryCache):
         base_ttl: float = 300.0,
         ttl_multiplier: float = 1.5,
         max_ttl: float = 3600.0,
+        policy: str = "lru",
+        max_bytes: int | None = None,
+        compress_threshold: int | None = None,
     ) -> None:
         """Initialize smart cache with adaptive TTL."""
-        super().__init__(max_size)
+        super().__init__(max_size, policy, max_bytes, compress_threshold)
         self._base_ttl = base_ttl
         self._ttl_multiplier = ttl_multiplier
         self._max_ttl = max_ttl
+        # Adaptive TTLs of the cached keys, dropped with their entries
         self._key_ttls: dict[str, float] = {}
 
-    def get(self, key: str) -> Any | None:
-        """Get value and potentially extend TTL based on access patterns."""
-        result = super().get(key)
-        if result is not None:
-            # Extend TTL for frequently accessed items
-            with self._lock:
-                entry = self._cache.get(key)
-                if entry and entry.hit_count > 2:
-                    current_ttl = self._key_ttls.get(key, self._base_ttl)
-                    new_ttl = min(
-                        current_ttl * self._ttl_multiplier, self._max_ttl
-                    )
-                    self._key_ttls[key] = new_ttl
-                    entry.expires_at = time.time() + new_ttl
-                    logger.debug("cache_ttl_extended", key=key, new_ttl=new_ttl)
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get entry and potentially extend TTL based on access patterns.
+
+        Extensions only ever push expiry later, so entries stored with a
+        TTL beyond ``max_ttl`` keep it. Entries caching a not-found answer
+        keep their short negative TTL.
+        """
+        result = super().get_entry(key)
+        if result is None:
+            return None
+        # Extend TTL for frequently accessed items
+        new_ttl = None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and entry.hit_count > 2 and entry.data != NOT_FOUND:
+                current_ttl = self._key_ttls.get(key, self._base_ttl)
+                new_ttl = max(
+                    current_ttl,
+                    min(current_ttl * self._ttl_multiplier, self._max_ttl),
+                )
+                self._key_ttls[key] = new_ttl
+                # expire() reschedules the entry when its old record is due
+                expires_at = time.time() + new_ttl
+                if expires_at > entry.expires_at:
+                    entry.expires_at = result.expires_at = expires_at
+                    entry.extended = result.extended = True
+        if new_ttl is not None:
+            logger.debug("cache_ttl_extended", key=key, new_ttl=new_ttl)
         return result
 
-    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        validators: dict[str, str] | None = None,
+    ) -> None:
         """Set value with adaptive TTL."""
-        if ttl is None:
-            ttl = self._key_ttls.get(key, self._base_ttl)
-        super().set(key, value, ttl)
-        self._key_ttls[key] = ttl
+        with self._lock:
+            if ttl is None:
+                ttl = self._key_ttls.get(key, self._base_ttl)
+        super().set(key, value, ttl, validators)
+        with self._lock:
+            # The entry may be too large, or already evicted again
+            if key in self._cache:
+                self._key_ttls[key] = ttl
+
+    def _remove(self, key: str) -> bool:
+        """Drop ``key`` with its adaptive TTL; call with the lock held."""
+        self._key_ttls.pop(key, None)
+        return super()._remove(key)
+
+    def _evict(self) -> tuple[str, CacheEntry] | None:
+        """Evict an entry with its adaptive TTL; call with the lock held."""
+        victim = super()._evict()
+        if victim is not None:
+            self._key_ttls.pop(victim[0], None)
+        return victim
 
     def clear(self) -> None:
         """Clear cache and TTL history."""
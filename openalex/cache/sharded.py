@@ -0,0 +1,158 @@
+"""Sharded memory cache and striped locks for multi-threaded use."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+from .base import BaseCache, CacheEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    from .memory import MemoryCache
+
+__all__ = ["ShardedMemoryCache", "StripedLock"]
+
+DEFAULT_STRIPES: Final = 256
+
+
+class StripedLock:
+    """A fixed table of re-entrant locks shared by hashing keys onto it.
+
+    Unlike a lock per key, the table never grows; two keys on the same
+    stripe merely serialize with each other.
+    """
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES) -> None:
+        self._locks = tuple(threading.RLock() for _ in range(stripes))
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def for_key(self, key: str) -> threading.RLock:
+        """Return the lock guarding ``key``."""
+        return self._locks[hash(key) % len(self._locks)]
+
+
+class ShardedMemoryCache(BaseCache):
+    """Memory cache split into independently locked segments.
+
+    Each key lives in the segment picked by its hash, so threads working
+    on different keys rarely contend for the same lock. Size and byte
+    budgets, eviction and adaptive TTLs apply per segment.
+    """
+
+    def __init__(self, segments: Sequence[MemoryCache]) -> None:
+        """Shard keys over ``segments`` (at least one)."""
+        if not segments:
+            msg = "ShardedMemoryCache needs at least one segment"
+            raise ValueError(msg)
+        self.segments = tuple(segments)
+
+    @classmethod
+    def create(
+        cls,
+        factory: Callable[..., MemoryCache],
+        shards: int,
+        max_size: int,
+        max_bytes: int | None = None,
+        **kwargs: Any,
+    ) -> ShardedMemoryCache:
+        """Build ``shards`` segments sharing ``max_size`` and ``max_bytes``.
+
+        ``factory`` is the segment class (e.g. ``SmartMemoryCache``); extra
+        keyword arguments are passed to it unchanged.
+        """
+        size = -(-max_size // shards)
+        budget = None if max_bytes is None else -(-max_bytes // shards)
+        return cls(
+            [
+                factory(max_size=size, max_bytes=budget, **kwargs)
+                for _ in range(shards)
+            ]
+        )
+
+    def segment_for(self, key: str) -> MemoryCache:
+        """Return the segment holding ``key``."""
+        return self.segments[hash(key) % len(self.segments)]
+
+    @property
+    def on_evict(self) -> Callable[[str, CacheEntry], None] | None:
+        """Callback receiving entries evicted from any segment."""
+        return self.segments[0].on_evict
+
+    @on_evict.setter
+    def on_evict(
+        self, callback: Callable[[str, CacheEntry], None] | None
+    ) -> None:
+        for segment in self.segments:
+            segment.on_evict = callback
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the key's segment."""
+        return self.segment_for(key).get(key)
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get a value together with its expiry metadata."""
+        return self.segment_for(key).get_entry(key)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Set a value in the key's segment with TTL in seconds."""
+        self.segment_for(key).set(key, value, ttl, validators)
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` in the key's segment as it is."""
+        self.segment_for(key).set_entry(key, entry)
+
+    def delete(self, key: str) -> None:
+        """Delete a value from the key's segment."""
+        self.segment_for(key).delete(key)
+
+    def expire(self) -> int:
+        """Drop expired entries from every segment."""
+        return sum(segment.expire() for segment in self.segments)
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        """Yield the unexpired entries of each segment in turn."""
+        for segment in self.segments:
+            yield from segment.entries()
+
+    def clear(self) -> None:
+        """Clear every segment."""
+        for segment in self.segments:
+            segment.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get statistics summed over the segments."""
+        per_segment = [segment.stats() for segment in self.segments]
+        totals = {
+            name: sum(stats[name] for stats in per_segment)
+            for name in (
+                "size",
+                "max_size",
+                "bytes",
+                "compressed_entries",
+                "hits",
+                "misses",
+                "evictions",
+                "expired",
+                "total_requests",
+            )
+        }
+        budgets = [stats["max_bytes"] for stats in per_segment]
+        hits, total_requests = totals["hits"], totals["total_requests"]
+        return {
+            **totals,
+            "backend": "sharded",
+            "shards": len(self.segments),
+            "max_bytes": None if None in budgets else sum(budgets),
+            "hit_rate": hits / total_requests if total_requests > 0 else 0,
+            "eviction_policy": per_segment[0]["eviction_policy"],
+        }
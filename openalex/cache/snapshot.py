@@ -0,0 +1,240 @@
+"""Binary snapshots of cache contents for warm starts.
+
+A snapshot is a fixed header followed by one zlib stream of records::
+
+    header  magic b"OACS" | version u16 | written_at f64
+    record  ttl f64 | age f64 | key u32 | value u32 | validators u32 | bytes...
+
+All integers are little-endian. ``ttl`` is the entry's remaining lifetime
+and ``age`` the time since it was created, both when the snapshot was
+written; readers shift them by the time elapsed since ``written_at``, so a
+snapshot never extends an entry's life or makes it look newer. Values and
+validators are compact JSON. A record with an empty key ends the stream,
+so truncated files are detected.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Final
+
+from structlog import get_logger
+
+from .base import CacheEntry
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "iter_snapshot",
+    "read_snapshot",
+    "write_snapshot",
+]
+
+logger = get_logger(__name__)
+
+SNAPSHOT_MAGIC: Final = b"OACS"
+SNAPSHOT_VERSION: Final = 2
+DEFAULT_COMPRESS_LEVEL: Final = 6
+#: Compressed bytes read from disk at a time
+READ_CHUNK: Final = 1 << 16
+
+_HEADER: Final = struct.Struct("<4sHd")
+_RECORD: Final = struct.Struct("<ddIII")
+_END: Final = _RECORD.pack(0.0, 0.0, 0, 0, 0)
+
+
+def write_snapshot(
+    path: str | os.PathLike[str],
+    entries: Iterable[tuple[str, CacheEntry]],
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+) -> int:
+    """Write the unexpired ``entries`` to ``path``; return how many.
+
+    The file is written to a uniquely named temporary file next to
+    ``path`` and renamed into place, so readers never see a partial
+    snapshot and concurrent writers do not share a file. Entries whose
+    value is not JSON-serializable are skipped.
+    """
+    path = Path(path)
+    now = time.time()
+    compressor = zlib.compressobj(compress_level)
+    written = 0
+    f = tempfile.NamedTemporaryFile(  # noqa: SIM115 - closed before rename
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    tmp = Path(f.name)
+    try:
+        with f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, now))
+            for key, entry in entries:
+                record = _encode_record(key, entry, now)
+                if record is not None:
+                    f.write(compressor.compress(record))
+                    written += 1
+            f.write(compressor.compress(_END))
+            f.write(compressor.flush())
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return written
+
+
+def _encode_record(key: str, entry: CacheEntry, now: float) -> bytes | None:
+    """Return the record of a live, JSON-serializable entry."""
+    ttl = entry.expires_at - now
+    if ttl <= 0:
+        return None
+    try:
+        value = json.dumps(entry.data, separators=(",", ":")).encode()
+    except (TypeError, ValueError):
+        logger.debug("cache_snapshot_skipped", key=key)
+        return None
+    validators = (
+        json.dumps(entry.validators).encode() if entry.validators else b""
+    )
+    key_bytes = key.encode()
+    header = _RECORD.pack(
+        ttl,
+        max(now - entry.created_at, 0.0),
+        len(key_bytes),
+        len(value),
+        len(validators),
+    )
+    return header + key_bytes + value + validators
+
+
+class _Decompressor:
+    """Read exact byte counts from a zlib stream, a chunk at a time."""
+
+    def __init__(self, f: IO[bytes]) -> None:
+        self._f = f
+        self._zlib = zlib.decompressobj()
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def _decompress(self, chunk: bytes) -> bytes:
+        try:
+            return self._zlib.decompress(chunk) if chunk else self._zlib.flush()
+        except zlib.error as e:
+            msg = f"corrupt cache snapshot: {e}"
+            raise ValueError(msg) from e
+
+    def read(self, size: int) -> bytes:
+        while len(self._buffer) - self._pos < size:
+            chunk = self._f.read(READ_CHUNK)
+            data = self._decompress(chunk)
+            if not chunk and not data:
+                msg = "truncated cache snapshot"
+                raise ValueError(msg)
+            if self._pos:
+                del self._buffer[: self._pos]
+                self._pos = 0
+            self._buffer += data
+        start = self._pos
+        self._pos += size
+        return bytes(self._buffer[start : self._pos])
+
+    def finish(self) -> None:
+        """Read to the end of the zlib stream, verifying its checksum."""
+        while not self._zlib.eof:
+            chunk = self._f.read(READ_CHUNK)
+            if not chunk:
+                msg = "truncated cache snapshot"
+                raise ValueError(msg)
+            self._decompress(chunk)
+
+
+def _open_stream(f: IO[bytes]) -> tuple[float, _Decompressor]:
+    """Check the header of ``f``; return its write time and record stream."""
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        msg = "not a cache snapshot"
+        raise ValueError(msg)
+    magic, version, written_at = _HEADER.unpack(header)
+    if magic != SNAPSHOT_MAGIC:
+        msg = "not a cache snapshot"
+        raise ValueError(msg)
+    if version != SNAPSHOT_VERSION:
+        msg = f"unsupported cache snapshot version {version}"
+        raise ValueError(msg)
+    return written_at, _Decompressor(f)
+
+
+def _records(
+    stream: _Decompressor,
+) -> Iterator[tuple[float, float, bytes, bytes, bytes]]:
+    """Yield ``(ttl, age, key, value, validators)`` up to the end marker."""
+    while True:
+        ttl, age, key_len, value_len, validators_len = _RECORD.unpack(
+            stream.read(_RECORD.size)
+        )
+        if not key_len:
+            return
+        yield (
+            ttl,
+            age,
+            stream.read(key_len),
+            stream.read(value_len),
+            stream.read(validators_len),
+        )
+
+
+def iter_snapshot(
+    path: str | os.PathLike[str],
+) -> Iterator[tuple[str, CacheEntry]]:
+    """Yield ``(key, entry)`` for each live entry of the snapshot.
+
+    The file is read twice. The first pass checks the header, the end
+    marker and the zlib checksum without decoding any value, so a file
+    that is not a snapshot, has an unknown version, or is truncated or
+    corrupt raises ``ValueError`` before the first entry is yielded. The
+    second pass decodes one record at a time, so memory use is bounded by
+    the largest entry rather than by the snapshot.
+
+    Expiry and creation times are shifted by the time elapsed since the
+    snapshot was written; entries that expired in the meantime are
+    skipped, and each entry's ``size`` is its JSON body length.
+    """
+    with Path(path).open("rb") as f:
+        _, stream = _open_stream(f)
+        for _ in _records(stream):
+            pass
+        stream.finish()
+
+        f.seek(0)
+        written_at, stream = _open_stream(f)
+        now = time.time()
+        elapsed = max(now - written_at, 0.0)
+        for ttl, age, key, value, validators in _records(stream):
+            remaining = ttl - elapsed
+            if remaining <= 0:
+                continue
+            yield (
+                key.decode(),
+                CacheEntry(
+                    data=json.loads(value),
+                    expires_at=now + remaining,
+                    created_at=now - age - elapsed,
+                    size=len(value),
+                    validators=json.loads(validators) if validators else None,
+                ),
+            )
+
+
+def read_snapshot(
+    path: str | os.PathLike[str],
+) -> list[tuple[str, CacheEntry]]:
+    """Return every live ``(key, entry)`` of the snapshot as a list.
+
+    See :func:`iter_snapshot`, which avoids holding all entries at once.
+    """
+    return list(iter_snapshot(path))
@@ -0,0 +1,323 @@
+"""Persistent SQLite cache shared between processes."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from structlog import get_logger
+
+from .base import BaseCache, CacheEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ["SQLiteCache", "default_cache_path"]
+
+logger = get_logger(__name__)
+
+DEFAULT_COMPRESS_LEVEL: Final = 6
+#: Rows :meth:`SQLiteCache.entries` reads per query
+ENTRIES_PAGE: Final = 500
+#: Most inserts between two size checks (see :meth:`SQLiteCache._evict`)
+EVICT_INTERVAL: Final = 100
+BUSY_TIMEOUT: Final = 30.0
+
+
+def default_cache_path() -> Path:
+    """Return ``$XDG_CACHE_HOME/openalex/cache.db`` (``~/.cache`` default)."""
+    root = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "openalex" / "cache.db"
+
+
+class SQLiteCache(BaseCache):
+    """Cache persisted in a SQLite database.
+
+    Entries are stored as zlib-compressed JSON with an absolute expiry time,
+    keyed by the ``CacheKeyBuilder`` key (the table's primary key). The
+    database runs in WAL mode, so several processes can read and write the
+    same file; each process opens its own connection, re-opened after a
+    fork. Hit and miss counters are per process.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        max_size: int = 1000,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    ) -> None:
+        """Open (or create) the cache database at ``path``."""
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        # At most a tenth of max_size, so overshoot stays proportional
+        self._evict_interval = max(1, min(EVICT_INTERVAL, max_size // 10))
+        self._unchecked_inserts = 0
+        self._compress_level = compress_level
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        with self._lock, self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, created_at REAL NOT NULL, "
+                "validators TEXT)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_created_at "
+                "ON cache (created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_expires_at "
+                "ON cache (expires_at)"
+            )
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(cache)")
+            }
+            if "validators" not in columns:
+                # Files written before validators were stored
+                self._add_validators_column(conn)
+
+    @staticmethod
+    def _add_validators_column(conn: sqlite3.Connection) -> None:
+        """Upgrade an old file; another process may be doing the same."""
+        try:
+            conn.execute("ALTER TABLE cache ADD COLUMN validators TEXT")
+        except sqlite3.OperationalError as exc:
+            if "duplicate column" not in str(exc):
+                raise
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this process's connection, opening it on first use."""
+        if self._conn is None or self._pid != os.getpid():
+            # A connection inherited through fork must not be reused
+            self._conn = sqlite3.connect(
+                str(self.path),
+                timeout=BUSY_TIMEOUT,
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._conn
+
+    def _encode(self, value: Any) -> bytes:
+        payload = json.dumps(value, separators=(",", ":")).encode()
+        return zlib.compress(payload, self._compress_level)
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        return json.loads(zlib.decompress(blob))
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache."""
+        entry = self.get_entry(key)
+        return None if entry is None else entry.data
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get a value together with its expiry metadata."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at, created_at, validators "
+                "FROM cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                logger.debug("cache_miss", key=key)
+                return None
+            value, expires_at, created_at, validators = row
+            if time.time() > expires_at:
+                with conn:
+                    conn.execute(
+                        "DELETE FROM cache WHERE key = ? AND expires_at = ?",
+                        (key, expires_at),
+                    )
+                self._misses += 1
+                logger.debug("cache_expired", key=key)
+                return None
+            self._hits += 1
+            logger.debug("cache_hit", key=key)
+        return CacheEntry(
+            data=self._decode(value),
+            expires_at=expires_at,
+            created_at=created_at,
+            validators=json.loads(validators) if validators else None,
+        )
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Set a value in the cache with TTL in seconds."""
+        now = time.time()
+        self._write(key, value, now + ttl, now, validators)
+        logger.debug("cache_set", key=key, ttl=ttl)
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` keeping its creation and expiry times."""
+        self._write(
+            key,
+            entry.data,
+            entry.expires_at,
+            entry.created_at,
+            entry.validators,
+        )
+        logger.debug("cache_set", key=key, expires_at=entry.expires_at)
+
+    def _write(
+        self,
+        key: str,
+        value: Any,
+        expires_at: float,
+        created_at: float,
+        validators: dict[str, str] | None,
+    ) -> None:
+        blob = self._encode(value)
+        with self._lock, self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(key, value, expires_at, created_at, validators) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    blob,
+                    expires_at,
+                    created_at,
+                    json.dumps(validators) if validators else None,
+                ),
+            )
+            self._unchecked_inserts += 1
+            if self._unchecked_inserts >= self._evict_interval:
+                self._unchecked_inserts = 0
+                self._evict(conn, time.time())
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the oldest ones, beyond ``max_size``.
+
+        Counting rows scans the table, so this runs once every few inserts
+        rather than on each one; in between, every process may add up to
+        that many rows past ``max_size``.
+        """
+        (size,) = conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if size <= self._max_size:
+            return
+        evicted = conn.execute(
+            "DELETE FROM cache WHERE expires_at < ?", (now,)
+        ).rowcount
+        excess = size - evicted - self._max_size
+        if excess > 0:
+            evicted += conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY created_at LIMIT ?)",
+                (excess,),
+            ).rowcount
+        self._evictions += evicted
+
+    def expire(self) -> int:
+        """Delete expired rows; return how many were deleted."""
+        with self._lock, self._connection() as conn:
+            removed = conn.execute(
+                "DELETE FROM cache WHERE expires_at < ?", (time.time(),)
+            ).rowcount
+        if removed:
+            logger.debug("cache_expired_swept", count=removed)
+        return removed
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        """Yield the unexpired rows in key order, ``ENTRIES_PAGE`` at a time.
+
+        Each page is a separate query, so writers are never blocked for
+        the whole iteration.
+        """
+        last_key = ""
+        while True:
+            with self._lock:
+                rows = (
+                    self._connection()
+                    .execute(
+                        "SELECT key, value, expires_at, created_at, validators "
+                        "FROM cache WHERE key > ? AND expires_at > ? "
+                        "ORDER BY key LIMIT ?",
+                        (last_key, time.time(), ENTRIES_PAGE),
+                    )
+                    .fetchall()
+                )
+            for key, value, expires_at, created_at, validators in rows:
+                yield (
+                    key,
+                    CacheEntry(
+                        data=self._decode(value),
+                        expires_at=expires_at,
+                        created_at=created_at,
+                        validators=json.loads(validators)
+                        if validators
+                        else None,
+                    ),
+                )
+            if len(rows) < ENTRIES_PAGE:
+                return
+            last_key = rows[-1][0]
+
+    def delete(self, key: str) -> None:
+        """Delete a value from the cache."""
+        with self._lock, self._connection() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        logger.debug("cache_delete", key=key)
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock, self._connection() as conn:
+            conn.execute("DELETE FROM cache")
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+        logger.info("cache_cleared")
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            size, stored_bytes = (
+                self._connection()
+                .execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) "
+                    "FROM cache"
+                )
+                .fetchone()
+            )
+            total_requests = self._hits + self._misses
+            hit_rate = self._hits / total_requests if total_requests > 0 else 0
+            return {
+                "backend": "sqlite",
+                "path": str(self.path),
+                "size": size,
+                "max_size": self._max_size,
+                "bytes": stored_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": hit_rate,
+                "total_requests": total_requests,
+            }
+
+    def close(self) -> None:
+        """Close this process's database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,125 @@
+"""Background expiry of cache entries."""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING
+
+from structlog import get_logger
+
+if TYPE_CHECKING:
+    from .base import BaseCache
+
+__all__ = ["ExpirySweeper"]
+
+logger = get_logger(__name__)
+
+
+class _SweepScheduler:
+    """One daemon thread running every started sweeper when it is due.
+
+    The thread starts with the first sweeper and exits once none is left,
+    so any number of caches costs at most one thread.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        # Started sweeper -> monotonic time of its next sweep
+        self._due: dict[ExpirySweeper, float] = {}
+        self._active: ExpirySweeper | None = None
+        self._thread: threading.Thread | None = None
+
+    def add(self, sweeper: ExpirySweeper) -> None:
+        with self._cond:
+            self._due[sweeper] = time.monotonic() + sweeper.interval
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="openalex-cache-sweeper", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def remove(self, sweeper: ExpirySweeper, timeout: float | None) -> None:
+        """Unschedule ``sweeper``, waiting up to ``timeout`` for its sweep."""
+        with self._cond:
+            self._due.pop(sweeper, None)
+            self._cond.notify_all()
+            if threading.current_thread() is not self._thread:
+                self._cond.wait_for(
+                    lambda: self._active is not sweeper, timeout
+                )
+
+    def scheduled(self, sweeper: ExpirySweeper) -> bool:
+        with self._cond:
+            return sweeper in self._due
+
+    def _next(self) -> ExpirySweeper | None:
+        """Wait for the next due sweeper; ``None`` once none is left."""
+        with self._cond:
+            self._active = None
+            self._cond.notify_all()
+            while self._due:
+                sweeper = min(self._due, key=self._due.__getitem__)
+                now = time.monotonic()
+                if self._due[sweeper] <= now:
+                    self._due[sweeper] = now + sweeper.interval
+                    self._active = sweeper
+                    return sweeper
+                self._cond.wait(self._due[sweeper] - now)
+            self._thread = None
+            return None
+
+    def _run(self) -> None:
+        while (sweeper := self._next()) is not None:
+            sweeper.sweep()
+
+
+_scheduler = _SweepScheduler()
+
+
+class ExpirySweeper:
+    """Periodic :meth:`BaseCache.expire` calls every ``interval`` seconds.
+
+    Expired entries are otherwise only dropped when a read touches them,
+    so a cache filled once and rarely read keeps its expired payloads
+    until eviction pressure arrives. All started sweepers share one daemon
+    thread. The sweeper holds the cache weakly and stops once the cache is
+    garbage collected.
+    """
+
+    def __init__(self, cache: BaseCache, interval: float) -> None:
+        """Prepare a sweeper for ``cache``; :meth:`start` runs it."""
+        self._cache = weakref.ref(cache)
+        self.interval = interval
+        self.sweeps = 0
+        self.expired = 0
+
+    @property
+    def running(self) -> bool:
+        return _scheduler.scheduled(self)
+
+    def start(self) -> None:
+        """Schedule sweeps on the shared sweeper thread (once)."""
+        if not self.running:
+            _scheduler.add(self)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop sweeping and wait up to ``timeout`` for a running sweep."""
+        _scheduler.remove(self, timeout)
+
+    def sweep(self) -> int:
+        """Expire entries once; return how many were dropped."""
+        cache = self._cache()
+        if cache is None:
+            self.stop()
+            return 0
+        try:
+            removed = cache.expire()
+        except Exception as e:  # pragma: no cover - keep sweeping
+            logger.warning("cache_sweep_failed", error=str(e))
+            return 0
+        self.sweeps += 1
+        self.expired += removed
+        return removed
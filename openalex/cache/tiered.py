@@ -0,0 +1,164 @@
+"""Two-tier cache: a small memory L1 in front of a large L2."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from structlog import get_logger
+
+from .base import BaseCache, CacheEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .memory import MemoryCache
+    from .sharded import ShardedMemoryCache
+
+__all__ = ["TieredCache"]
+
+logger = get_logger(__name__)
+
+
+class TieredCache(BaseCache):
+    """Cache composed of a fast L1 memory cache and a large L2 backend.
+
+    An L1 miss that hits L2 promotes the entry into L1 as it is (creation
+    time, expiry and validators included), so the working set can far
+    exceed what L1 holds while hot keys are served at dictionary speed.
+    With ``write_through`` (the default) writes go to both tiers, so L1
+    evictions are already in L2; without it writes only go to L1 and
+    entries evicted from L1 are demoted to L2.
+    """
+
+    def __init__(
+        self,
+        l1: MemoryCache | ShardedMemoryCache,
+        l2: BaseCache,
+        *,
+        write_through: bool = True,
+    ) -> None:
+        """Compose ``l1`` and ``l2``."""
+        self.l1 = l1
+        self.l2 = l2
+        self.write_through = write_through
+        if not write_through:
+            l1.on_evict = self._demote
+        self._lock = threading.Lock()
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
+        self._promotions = 0
+        self._demotions = 0
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from L1, falling back to (and promoting from) L2."""
+        entry = self.get_entry(key)
+        return None if entry is None else entry.data
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get a value together with its expiry metadata."""
+        entry = self.l1.get_entry(key)
+        if entry is not None:
+            with self._lock:
+                self._l1_hits += 1
+            return entry
+
+        entry = self.l2.get_entry(key)
+        if entry is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        if entry.expires_at > time.time():
+            self.l1.set_entry(key, entry)
+        with self._lock:
+            self._l2_hits += 1
+            self._promotions += 1
+        logger.debug("cache_promoted", key=key)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Write a value to L1, and through to L2 with ``write_through``."""
+        if self.write_through:
+            self.l2.set(key, value, ttl, validators)
+        self.l1.set(key, value, ttl, validators)
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry as it is, like :meth:`set`."""
+        if self.write_through:
+            self.l2.set_entry(key, entry)
+        self.l1.set_entry(key, entry)
+
+    def _demote(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry evicted from L1 in L2."""
+        self.l2.set_entry(key, entry)
+        with self._lock:
+            self._demotions += 1
+        logger.debug("cache_demoted", key=key)
+
+    def delete(self, key: str) -> None:
+        """Delete a value from both tiers."""
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def expire(self) -> int:
+        """Drop expired entries from both tiers."""
+        return self.l1.expire() + self.l2.expire()
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        """Yield the L1 entries, then the L2 entries not also held in L1."""
+        seen: set[str] = set()
+        for key, entry in self.l1.entries():
+            seen.add(key)
+            yield key, entry
+        for key, entry in self.l2.entries():
+            if key not in seen:
+                yield key, entry
+
+    def clear(self) -> None:
+        """Clear both tiers and the tier counters."""
+        self.l1.clear()
+        self.l2.clear()
+        with self._lock:
+            self._l1_hits = 0
+            self._l2_hits = 0
+            self._misses = 0
+            self._promotions = 0
+            self._demotions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get combined statistics with a per-tier breakdown."""
+        l1_stats = self.l1.stats()
+        l2_stats = self.l2.stats()
+        with self._lock:
+            hits = self._l1_hits + self._l2_hits
+            total_requests = hits + self._misses
+            hit_rate = hits / total_requests if total_requests > 0 else 0
+            return {
+                "backend": "tiered",
+                "size": l2_stats.get("size", l1_stats["size"]),
+                "hits": hits,
+                "misses": self._misses,
+                "hit_rate": hit_rate,
+                "total_requests": total_requests,
+                "l1_hits": self._l1_hits,
+                "l2_hits": self._l2_hits,
+                "promotions": self._promotions,
+                "demotions": self._demotions,
+                "l1": l1_stats,
+                "l2": l2_stats,
+            }
+
+    def close(self) -> None:
+        """Close the L2 backend if it holds resources."""
+        close = getattr(self.l2, "close", None)
+        if close is not None:
+            close()
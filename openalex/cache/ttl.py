@@ -0,0 +1,151 @@
+"""Volatility-aware cache TTL policies."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
+
+from ..constants import Resource
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from ..config import OpenAlexConfig
+
+__all__ = [
+    "OPERATIONS",
+    "STABLE_ENTITY_TTLS",
+    "TTLPolicy",
+    "validate_ttl_rules",
+]
+
+#: Operations a TTL rule can target
+OPERATIONS: Final = ("get", "list", "autocomplete", "group_by")
+#: Payload field read by :meth:`TTLPolicy.for_payload`
+UPDATED_FIELD: Final = "updated_date"
+
+_HOUR: Final = 3600.0
+_DAY: Final = 24 * _HOUR
+_ENDPOINTS: Final = frozenset(r.value for r in Resource)
+
+#: Opt-in ``cache_ttl_rules`` for entities that rarely change
+STABLE_ENTITY_TTLS: Final[Mapping[str, float]] = MappingProxyType(
+    {
+        "concepts": 30 * _DAY,
+        "publishers": 7 * _DAY,
+        "funders": 7 * _DAY,
+        "topics": 7 * _DAY,
+        "keywords": 7 * _DAY,
+        "institutions": _DAY,
+        "sources": _DAY,
+        "*:autocomplete": _HOUR,
+    }
+)
+
+
+def validate_ttl_rules(rules: Mapping[str, float]) -> None:
+    """Raise ``ValueError`` for malformed ``cache_ttl_rules`` entries."""
+    for rule, ttl in rules.items():
+        endpoint, _, operation = rule.partition(":")
+        if endpoint == "*" and not operation:
+            msg = f"TTL rule {rule!r} needs an operation after '*:'"
+            raise ValueError(msg)
+        if endpoint != "*" and endpoint not in _ENDPOINTS:
+            msg = f"TTL rule {rule!r} names an unknown endpoint"
+            raise ValueError(msg)
+        if operation and operation not in OPERATIONS:
+            msg = (
+                f"TTL rule {rule!r} names an unknown operation; "
+                f"expected one of {', '.join(OPERATIONS)}"
+            )
+            raise ValueError(msg)
+        if ttl < 0:
+            msg = f"TTL rule {rule!r} must not be negative"
+            raise ValueError(msg)
+
+
+def _updated_at(value: Any) -> float | None:
+    """Return an ``updated_date`` value as a timestamp (UTC if naive)."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+class TTLPolicy:
+    """Choose how long a cache entry lives.
+
+    ``rules`` map ``"<endpoint>:<operation>"``, ``"*:<operation>"`` or
+    ``"<endpoint>"`` to seconds. The most specific matching rule wins, in
+    that order; ``default`` applies otherwise.
+
+    With ``age_factor`` above zero, payloads carrying ``updated_date`` are
+    kept ``age_factor`` times the time since that update, but never less
+    than the rule's TTL nor more than ``max_ttl``. An entity last changed a
+    year ago then stays cached far longer than one changed yesterday.
+    """
+
+    __slots__ = ("_ttls", "age_factor", "default", "max_ttl", "rules")
+
+    def __init__(
+        self,
+        default: float,
+        rules: Mapping[str, float] | None = None,
+        age_factor: float = 0.0,
+        max_ttl: float | None = None,
+    ) -> None:
+        """Build a policy; raises ``ValueError`` for malformed rules."""
+        self.rules = dict(rules or {})
+        validate_ttl_rules(self.rules)
+        self.default = float(default)
+        self.age_factor = age_factor
+        self.max_ttl = max_ttl
+        self._ttls: dict[tuple[str, str], float] = {}
+
+    @classmethod
+    def from_config(cls, config: OpenAlexConfig) -> TTLPolicy:
+        return cls(
+            config.cache_ttl,
+            config.cache_ttl_rules,
+            config.cache_ttl_age_factor,
+            config.cache_ttl_max,
+        )
+
+    def ttl(self, endpoint: str, operation: str = "get") -> float:
+        """Return the TTL of ``operation`` results from ``endpoint``."""
+        key = (endpoint, operation)
+        ttl = self._ttls.get(key)
+        if ttl is None:
+            ttl = self.default
+            for rule in (f"{endpoint}:{operation}", f"*:{operation}", endpoint):
+                if rule in self.rules:
+                    ttl = float(self.rules[rule])
+                    break
+            self._ttls[key] = ttl
+        return ttl
+
+    def for_payload(
+        self, ttl: float, payload: Any, stored_at: float | None = None
+    ) -> float:
+        """Return ``ttl`` extended by ``payload``'s stability.
+
+        ``stored_at`` is when the payload was cached (now by default), so
+        an entry's lifetime does not grow while it sits in the cache.
+        """
+        if not self.age_factor or not isinstance(payload, dict):
+            return ttl
+        updated = _updated_at(payload.get(UPDATED_FIELD))
+        if updated is None:
+            return ttl
+        now = time.time() if stored_at is None else stored_at
+        derived = max(now - updated, 0.0) * self.age_factor
+        if self.max_ttl is not None:
+            derived = min(derived, self.max_ttl)
+        return max(ttl, derived)
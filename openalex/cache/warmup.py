@@ -0,0 +1,340 @@
+"""Parallel cache warm-up from a manifest file.
+
+A manifest holds one item per line:
+
+* an OpenAlex ID or URL (``W2741809807``,
+  ``https://openalex.org/A5023888391``); the endpoint is inferred from the
+  ID prefix;
+* ``<endpoint> <id>``, for example ``keywords machine-learning``;
+* a saved list query as a JSON object, e.g.
+  ``{"endpoint": "works", "filter": {"publication_year": 2024}, "pages": 2}``.
+
+Blank lines and lines starting with ``#`` are ignored. IDs are fetched with
+batched ``openalex_id`` filters (see :meth:`BaseEntity.warm_ids`), saved
+queries page by page, all on a bounded thread pool; entries that are still
+cached are skipped. With a SQLite or tiered backend the warmed entries land
+in the shared cache file, so one run serves every process using it::
+
+    python -m openalex.cache.warmup hot.txt --cache-path /srv/openalex.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from structlog import get_logger
+
+from ..constants import Resource
+from ..utils.common import extract_entity_type
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Sequence
+
+    from ..config import OpenAlexConfig
+    from ..entities import BaseEntity
+
+__all__ = [
+    "Manifest",
+    "SavedQuery",
+    "WarmupReport",
+    "load_manifest",
+    "main",
+    "parse_manifest",
+    "warm_manifest",
+]
+
+logger = get_logger(__name__)
+
+_ENDPOINTS = frozenset(r.value for r in Resource)
+
+
+@dataclass(slots=True)
+class WarmupReport:
+    """Progress counters of a cache warm-up."""
+
+    requested: int = 0
+    fresh: int = 0
+    fetched: int = 0
+    missing: int = 0
+    failed: int = 0
+    invalid: int = 0
+    requests: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def done(self) -> int:
+        """Entries handled so far (skipped, fetched, missing or failed)."""
+        return self.fresh + self.fetched + self.missing + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Entries handled per second."""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.done}/{self.requested} entries "
+            f"({self.fresh} fresh, {self.fetched} fetched, "
+            f"{self.missing} missing, {self.failed} failed) "
+            f"in {self.requests} requests, {self.elapsed:.1f}s, "
+            f"{self.throughput:,.0f}/s"
+        )
+
+
+@dataclass(slots=True)
+class SavedQuery:
+    """A list query to warm, ``pages`` pages deep."""
+
+    endpoint: str
+    params: dict[str, Any]
+    pages: int = 1
+
+
+@dataclass(slots=True)
+class Manifest:
+    """IDs grouped by endpoint plus saved list queries."""
+
+    ids: dict[str, list[str]] = field(default_factory=dict)
+    queries: list[SavedQuery] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.ids.values())) + sum(
+            q.pages for q in self.queries
+        )
+
+
+def _check_endpoint(endpoint: str, line_no: int) -> str:
+    if endpoint not in _ENDPOINTS:
+        msg = f"line {line_no}: unknown endpoint {endpoint!r}"
+        raise ValueError(msg)
+    return endpoint
+
+
+def _parse_query(text: str, line_no: int) -> SavedQuery:
+    try:
+        spec = json.loads(text)
+    except json.JSONDecodeError as e:
+        msg = f"line {line_no}: invalid saved query: {e}"
+        raise ValueError(msg) from e
+    if not isinstance(spec, dict) or "endpoint" not in spec:
+        msg = f"line {line_no}: saved query needs an 'endpoint'"
+        raise ValueError(msg)
+    endpoint = _check_endpoint(str(spec.pop("endpoint")), line_no)
+    pages = int(spec.pop("pages", 1))
+    return SavedQuery(endpoint, spec, max(pages, 1))
+
+
+def parse_manifest(lines: Sequence[str]) -> Manifest:
+    """Parse manifest ``lines``; raises ``ValueError`` on bad entries."""
+    manifest = Manifest()
+    for line_no, raw in enumerate(lines, 1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            manifest.queries.append(_parse_query(line, line_no))
+            continue
+        endpoint, _, entity_id = line.partition(" ")
+        if entity_id:
+            _check_endpoint(endpoint, line_no)
+            entity_id = entity_id.strip()
+        else:
+            entity_id = line
+            entity_type = extract_entity_type(line)
+            if entity_type is None:
+                msg = f"line {line_no}: cannot infer endpoint of {line!r}"
+                raise ValueError(msg)
+            endpoint = f"{entity_type}s"
+        manifest.ids.setdefault(endpoint, []).append(entity_id)
+    return manifest
+
+
+def load_manifest(path: str | os.PathLike[str]) -> Manifest:
+    """Read and parse the manifest file at ``path``."""
+    with Path(path).open(encoding="utf-8") as f:
+        return parse_manifest(f.readlines())
+
+
+def _entity(endpoint: str, config: OpenAlexConfig) -> BaseEntity[Any, Any]:
+    from .. import entities
+
+    entity_cls: type[BaseEntity[Any, Any]] = getattr(
+        entities, endpoint.capitalize()
+    )
+    return entity_cls(config=config)
+
+
+def _warm_queries(
+    queries: list[SavedQuery],
+    config: OpenAlexConfig,
+    concurrency: int,
+    report: WarmupReport,
+    progress: Callable[[WarmupReport], None] | None,
+) -> None:
+    import concurrent.futures
+
+    from ..query import Query
+    from ..templates import _list_ttl_operation
+    from .base import CacheKeyBuilder
+    from .manager import get_cache_manager
+
+    manager = get_cache_manager(config)
+
+    def warm(query: Query[Any, Any]) -> bool:
+        endpoint = query.entity.endpoint
+        key = CacheKeyBuilder.list_key(endpoint, query.fingerprint)
+        ttl = manager.get_ttl_for_endpoint(
+            endpoint, _list_ttl_operation(query.normalized_params)
+        )
+        if manager.is_fresh(key, ttl):
+            return False
+        if manager.cache is not None:
+            # A stale page would be served again instead of refetched
+            manager.cache.delete(key)
+        query.entity.list_query(query)
+        return True
+
+    entities = {q.endpoint: _entity(q.endpoint, config) for q in queries}
+    pending = [
+        Query(entities[saved.endpoint], {**saved.params, "page": page})
+        for saved in queries
+        for page in range(1, saved.pages + 1)
+    ]
+    report.requested += len(pending)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency
+    ) as executor:
+        futures = [executor.submit(warm, query) for query in pending]
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                if future.result():
+                    report.fetched += 1
+                    report.requests += 1
+                else:
+                    report.fresh += 1
+            except Exception as e:
+                logger.warning("warmup_query_failed", error=str(e))
+                report.failed += 1
+            if progress is not None:
+                progress(report)
+
+
+def warm_manifest(
+    manifest: Manifest | str | os.PathLike[str],
+    config: OpenAlexConfig | None = None,
+    concurrency: int = 10,
+    progress: Callable[[WarmupReport], None] | None = None,
+) -> WarmupReport:
+    """Warm the cache of ``config`` with every entry of ``manifest``.
+
+    ``concurrency`` bounds the requests in flight; ``progress`` is called
+    with the running :class:`WarmupReport` after each request.
+    """
+    from ..config import OpenAlexConfig
+
+    if not isinstance(manifest, Manifest):
+        manifest = load_manifest(manifest)
+    config = config or OpenAlexConfig(cache_enabled=True)
+    report = WarmupReport()
+    for endpoint, ids in manifest.ids.items():
+        _entity(endpoint, config).warm_ids(
+            ids, concurrency, progress=progress, report=report
+        )
+    if manifest.queries:
+        _warm_queries(manifest.queries, config, concurrency, report, progress)
+    logger.info(
+        "cache_warmup_finished",
+        requested=report.requested,
+        fresh=report.fresh,
+        fetched=report.fetched,
+        missing=report.missing,
+        failed=report.failed,
+        requests=report.requests,
+        elapsed=round(report.elapsed, 3),
+    )
+    return report
+
+
+class _ProgressPrinter:
+    """Print the report at most every ``interval`` seconds."""
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self.interval = interval
+        self._last = 0.0
+
+    def __call__(self, report: WarmupReport) -> None:
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            print(report.summary(), file=sys.stderr)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    from ..config import OpenAlexConfig
+
+    parser = argparse.ArgumentParser(
+        prog="openalex-warm",
+        description="Warm the OpenAlex client cache from a manifest file.",
+    )
+    parser.add_argument("manifest", type=Path)
+    parser.add_argument(
+        "--backend", choices=("sqlite", "tiered"), default="tiered"
+    )
+    parser.add_argument("--cache-path", type=Path, default=None)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--max-entries",
+        type=int,
+        default=None,
+        help="Entries kept by the SQLite file (the persistent tier)",
+    )
+    parser.add_argument("--email", default=None)
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    options: dict[str, Any] = {
+        "cache_enabled": True,
+        "cache_backend": args.backend,
+    }
+    for name in ("cache_path", "email", "api_key"):
+        if (value := getattr(args, name)) is not None:
+            options[name] = value
+    if args.max_entries is not None:
+        size_option = (
+            "cache_sqlite_maxsize"
+            if args.backend == "sqlite"
+            else "cache_l2_maxsize"
+        )
+        options[size_option] = args.max_entries
+    try:
+        manifest = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"openalex-warm: {e}", file=sys.stderr)
+        return 2
+
+    report = warm_manifest(
+        manifest,
+        OpenAlexConfig(**options),
+        concurrency=max(args.concurrency, 1),
+        progress=None if args.quiet else _ProgressPrinter(),
+    )
+    print(report.summary())
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
 __all__ = ["OpenAlexConfig"]
 
@@ -29,6 +30,7 @@ from .constants import (
     HEADER_ACCEPT_ENCODING,
     HEADER_AUTHORIZATION,
     HEADER_USER_AGENT,
+    MAX_OR_FILTER_VALUES,
 )
 from .middleware import Middleware
 from .utils.rate_limit import DEFAULT_BUFFER
@@ -85,12 +87,101 @@ class OpenAlexConfig(BaseModel):
         ge=1,
         le=10000,
     )
+    cache_max_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Memory cache budget in bytes of cached response bodies",
+    )
+    cache_compress_threshold: int | None = Field(
+        default=None,
+        ge=0,
+        description="Store cached bodies of at least this many bytes "
+        "zlib-compressed",
+    )
     cache_ttl: float = Field(
         default=DEFAULT_CACHE_TTL,
         description="Default cache TTL in seconds",
         ge=0.0,
         le=86400.0,
     )
+    cache_ttl_rules: dict[str, float] = Field(
+        default_factory=dict,
+        description="TTLs in seconds by 'endpoint', 'endpoint:operation' or "
+        "'*:operation' (operations: get, list, autocomplete, group_by); "
+        "0 turns caching off",
+    )
+    cache_ttl_age_factor: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Cache entities this many times the time since their "
+        "updated_date, when longer than their TTL (0 disables)",
+    )
+    cache_ttl_max: float = Field(
+        default=30 * 86400.0,
+        ge=0.0,
+        description="Upper bound of TTLs derived from updated_date",
+    )
+    cache_stale_ttl: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds an expired entry is still served while it is "
+        "refreshed in the background",
+    )
+    cache_revalidate_ttl: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds an expired entry with ETag/Last-Modified "
+        "validators is kept for conditional revalidation",
+    )
+    cache_negative_ttl: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds to remember 404s and IDs missing from batch "
+        "lookups (0 disables negative caching)",
+    )
+    cache_sweep_interval: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds between background sweeps dropping expired "
+        "cache entries (0 expires entries only when read)",
+    )
+    cache_list_results: bool = Field(
+        default=False,
+        description="Also cache each full result of list and stream pages "
+        "as a single entity",
+    )
+    cache_shards: int = Field(
+        default=1,
+        ge=1,
+        le=256,
+        description="Split the memory cache into this many independently "
+        "locked segments for multi-threaded use",
+    )
+    cache_eviction_policy: Literal["lru", "lfu", "tinylfu"] = Field(
+        default="lru",
+        description="Memory cache eviction policy: lru, lfu or tinylfu",
+    )
+    cache_backend: Literal["memory", "sqlite", "tiered"] = Field(
+        default="memory",
+        description="Cache storage: per-process memory, a shared SQLite file "
+        "or a memory L1 in front of a SQLite L2",
+    )
+    cache_sqlite_maxsize: int = Field(
+        default=100_000,
+        ge=1,
+        description="Maximum number of entries in the SQLite cache backend",
+    )
+    cache_l2_maxsize: int = Field(
+        default=100_000,
+        ge=1,
+        description="Maximum number of entries in the tiered cache's L2",
+    )
+    cache_path: Path | None = Field(
+        default_factory=lambda: (
+            Path(path) if (path := os.getenv("OPENALEX_CACHE_PATH")) else None
+        ),
+        description="SQLite cache file (defaults to ~/.cache/openalex)",
+    )
     rate_limit_buffer: float = Field(
         default=DEFAULT_BUFFER,
         ge=0,
@@ -102,6 +193,23 @@ class OpenAlexConfig(BaseModel):
         description="Enable metrics collection",
     )
 
+    get_batching_enabled: bool = Field(
+        default=False,
+        description="Batch concurrent async single-entity gets",
+    )
+    get_batch_window: float = Field(
+        default=0.005,
+        ge=0.0,
+        le=1.0,
+        description="Seconds to collect async gets before dispatching",
+    )
+    get_batch_max_size: int = Field(
+        default=MAX_OR_FILTER_VALUES,
+        ge=1,
+        le=MAX_OR_FILTER_VALUES,
+        description="Dispatch a batch early once it holds this many IDs",
+    )
+
     middleware: Middleware = Field(
         default_factory=Middleware,
         description="Request/response middleware stack",
@@ -143,6 +251,10 @@ class OpenAlexConfig(BaseModel):
     circuit_breaker_recovery_timeout: int = Field(default=60)
     request_queue_enabled: bool = Field(default=True)
     request_queue_max_size: int = Field(default=1000)
+    request_coalescing_enabled: bool = Field(
+        default=True,
+        description="Share one response among identical concurrent GETs",
+    )
 
     @field_validator("base_url")
     @classmethod
@@ -150,6 +262,15 @@ class OpenAlexConfig(BaseModel):
         """Ensure base URL doesn't have trailing slash."""
         return HttpUrl(str(v).rstrip("/"))
 
+    @field_validator("cache_ttl_rules")
+    @classmethod
+    def validate_cache_ttl_rules(cls, v: dict[str, float]) -> dict[str, float]:
+        """Reject rules naming unknown endpoints or operations."""
+        from .cache.ttl import validate_ttl_rules
+
+        validate_ttl_rules(v)
+        return v
+
     @property
     def headers(self) -> dict[str, str]:
         """Get default headers for requests."""
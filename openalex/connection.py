@@ -5,7 +5,7 @@ import time
 import weakref
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import httpx
 from structlog import get_logger
@@ -19,7 +19,10 @@ __all__ = [
 ]
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .config import OpenAlexConfig
+from .constants import HTTP_METHOD_GET
 from .exceptions import (
     APIError,
     NetworkError,
@@ -27,11 +30,60 @@ from .exceptions import (
     ServerError,
     TemporaryError,
     TimeoutError,
+    raise_for_status,
 )
+from .resilience.async_coalescer import AsyncRequestCoalescer
+from .resilience.coalescer import RequestCoalescer, request_key
 from .utils.retry import RetryConfig
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+def _coalesce_key(
+    coalescer: RequestCoalescer | AsyncRequestCoalescer | None,
+    method: str,
+    url: str,
+    params: dict[str, Any],
+    kwargs: dict[str, Any],
+) -> str | None:
+    """Return the coalescing key for a request, or ``None`` to bypass.
+
+    Only plain GET requests are shared; anything carrying extra request
+    options (headers, bodies, ...) is sent on its own.
+    """
+    if coalescer is None or method.upper() != HTTP_METHOD_GET:
+        return None
+    if set(kwargs) - {"timeout"}:
+        return None
+    return request_key(method, url, params)
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    return response.json()
+
+
+def _decode_json_sized(response: httpx.Response) -> tuple[Any, int]:
+    return response.json(), len(response.content)
+
+
+def _decoded_key(
+    coalescer: RequestCoalescer | AsyncRequestCoalescer | None,
+    url: str,
+    config: OpenAlexConfig,
+    params: dict[str, Any] | None,
+    decode: Callable[[httpx.Response], Any],
+) -> str | None:
+    """Return the coalescing key of a decoded GET, or ``None`` to bypass.
+
+    The key names the decoder, so callers of ``request`` and of each
+    decoding method never receive each other's results.
+    """
+    merged = {**config.params, **(params or {})}
+    key = _coalesce_key(coalescer, HTTP_METHOD_GET, url, merged, {})
+    return None if key is None else f"{key} {decode.__name__}"
+
 
 class Connection:
     """Synchronous connection to OpenAlex API."""
@@ -40,6 +92,9 @@ class Connection:
         self._config = config
         self._client: httpx.Client | None = None
         self._retry = RetryConfig()
+        self._coalescer = (
+            RequestCoalescer() if config.request_coalescing_enabled else None
+        )
 
     def __enter__(self) -> Connection:
         self.open()
@@ -63,12 +118,19 @@ class Connection:
             self._client = None
             logger.debug("connection_closed")
 
+    @property
+    def coalescer(self) -> RequestCoalescer | None:
+        """Coalescer sharing identical in-flight GET requests, if enabled."""
+        return self._coalescer
+
     def request(
         self,
         method: str,
         url: str,
         params: dict[str, Any] | None = None,
         operation: str | None = None,
+        *,
+        coalesce: bool = True,
         **kwargs: Any,
     ) -> httpx.Response:
         if self._client is None:
@@ -120,10 +182,24 @@ class Connection:
             start_time = time.time()
             endpoint = url.split("/")[-2] if "/" in url else "unknown"
 
-        try:
-            response = self._make_request_with_retry(
+        def send() -> httpx.Response:
+            return self._make_request_with_retry(
                 method, url, merged_params, **kwargs
             )
+
+        try:
+            key = (
+                _coalesce_key(
+                    self._coalescer, method, url, merged_params, kwargs
+                )
+                if coalesce
+                else None
+            )
+            if key is not None:
+                assert self._coalescer is not None
+                response = self._coalescer.do(key, send)
+            else:
+                response = send()
         except httpx.TimeoutException as e:
             if metrics is not None:
                 duration = time.time() - start_time
@@ -152,6 +228,53 @@ class Connection:
                 )
             return response
 
+    def get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        operation: str | None = None,
+    ) -> Any:
+        """GET ``url`` and return its decoded JSON body.
+
+        Identical concurrent calls share one request and one decode, so
+        every caller receives the payload. Error statuses raise as in
+        :func:`raise_for_status`.
+        """
+        return self._get_decoded(url, params, operation, _decode_json)
+
+    def get_json_sized(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        operation: str | None = None,
+    ) -> tuple[Any, int]:
+        """:meth:`get_json` returning the body length in bytes too."""
+        return self._get_decoded(url, params, operation, _decode_json_sized)
+
+    def _get_decoded(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        operation: str | None,
+        decode: Callable[[httpx.Response], T],
+    ) -> T:
+        def fetch() -> T:
+            response = self.request(
+                HTTP_METHOD_GET,
+                url,
+                params=params,
+                operation=operation,
+                coalesce=False,
+            )
+            raise_for_status(response)
+            return decode(response)
+
+        key = _decoded_key(self._coalescer, url, self._config, params, decode)
+        if key is None:
+            return fetch()
+        assert self._coalescer is not None
+        return self._coalescer.do(key, fetch)
+
     def _make_request_with_retry(
         self,
         method: str,
@@ -302,6 +425,11 @@ class AsyncConnection:
         self._config = config
         self._client: httpx.AsyncClient | None = None
         self._retry = RetryConfig()
+        self._coalescer = (
+            AsyncRequestCoalescer()
+            if config.request_coalescing_enabled
+            else None
+        )
 
     async def __aenter__(self) -> AsyncConnection:
         await self.open()
@@ -327,11 +455,19 @@ class AsyncConnection:
             self._client = None
             logger.debug("async_connection_closed")
 
+    @property
+    def coalescer(self) -> AsyncRequestCoalescer | None:
+        """Coalescer sharing identical in-flight GET requests, if enabled."""
+        return self._coalescer
+
     async def request(
         self,
         method: str,
         url: str,
         params: dict[str, Any] | None = None,
+        operation: str | None = None,
+        *,
+        coalesce: bool = True,
         **kwargs: Any,
     ) -> httpx.Response:
         if self._client is None:
@@ -343,10 +479,31 @@ class AsyncConnection:
         if params:
             merged_params.update(params)
 
-        try:
-            response = await self._make_request_with_retry(
+        if operation is not None and "timeout" not in kwargs:
+            kwargs["timeout"] = httpx.Timeout(
+                self._config.operation_timeouts.get(
+                    operation, self._config.timeout
+                )
+            )
+
+        async def send() -> httpx.Response:
+            return await self._make_request_with_retry(
                 method, url, merged_params, **kwargs
             )
+
+        try:
+            key = (
+                _coalesce_key(
+                    self._coalescer, method, url, merged_params, kwargs
+                )
+                if coalesce
+                else None
+            )
+            if key is not None:
+                assert self._coalescer is not None
+                response = await self._coalescer.do(key, send)
+            else:
+                response = await send()
         except httpx.TimeoutException as e:
             msg = f"Request timed out after {self._config.timeout}s"
             raise TimeoutError(msg) from e
@@ -359,6 +516,50 @@ class AsyncConnection:
         else:
             return response
 
+    async def get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        operation: str | None = None,
+    ) -> Any:
+        """Async :meth:`Connection.get_json`."""
+        return await self._get_decoded(url, params, operation, _decode_json)
+
+    async def get_json_sized(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        operation: str | None = None,
+    ) -> tuple[Any, int]:
+        """Async :meth:`Connection.get_json_sized`."""
+        return await self._get_decoded(
+            url, params, operation, _decode_json_sized
+        )
+
+    async def _get_decoded(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        operation: str | None,
+        decode: Callable[[httpx.Response], T],
+    ) -> T:
+        async def fetch() -> T:
+            response = await self.request(
+                HTTP_METHOD_GET,
+                url,
+                params=params,
+                operation=operation,
+                coalesce=False,
+            )
+            raise_for_status(response)
+            return decode(response)
+
+        key = _decoded_key(self._coalescer, url, self._config, params, decode)
+        if key is None:
+            return await fetch()
+        assert self._coalescer is not None
+        return await self._coalescer.do(key, fetch)
+
     async def _make_request_with_retry(
         self,
         method: str,
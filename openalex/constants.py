@@ -13,6 +13,7 @@ DOI_URL_PREFIX = "https://doi.org/"
 PMID_PREFIX = "pmid:"
 MAG_PREFIX = "mag:"
 ROR_URL_PREFIX = "https://ror.org/"
+DOI_PATTERN = r"^10\.\d{4,9}/[-._;()/:\w]+$"
 
 SECONDS_PER_MINUTE = 60
 MINUTES_PER_HOUR = 60
@@ -23,6 +24,11 @@ DEFAULT_TIMEOUT = 30.0
 DEFAULT_PER_PAGE = 200
 DEFAULT_CACHE_TTL = 3600
 DEFAULT_CONCURRENCY = 5
+MAX_OR_FILTER_VALUES = 100
+# Batch misses looked up one by one before the rest are cached as missing
+MAX_CONFIRMED_MISSES = 5
+DEFAULT_MAX_PARTITION_SIZE = 1_000_000
+MAX_PAGED_RESULTS = 10_000
 FIRST_PAGE = 1
 SINGLE_PER_PAGE = 1
 FILTER_DEFAULT_PER_PAGE = 25
@@ -33,6 +39,10 @@ HEADER_ACCEPT = "Accept"
 HEADER_ACCEPT_ENCODING = "Accept-Encoding"
 HEADER_AUTHORIZATION = "Authorization"
 HEADER_USER_AGENT = "User-Agent"
+HEADER_ETAG = "ETag"
+HEADER_LAST_MODIFIED = "Last-Modified"
+HEADER_IF_NONE_MATCH = "If-None-Match"
+HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
 ACCEPT_JSON = "application/json"
 ACCEPT_ENCODING_GZIP = "gzip, deflate"
 PARAM_Q = "q"
@@ -70,6 +80,7 @@ GOVERNMENT_KEYWORDS = [
 HTTP_TOO_MANY_REQUESTS = HTTPStatus.TOO_MANY_REQUESTS
 HTTP_UNAUTHORIZED = HTTPStatus.UNAUTHORIZED
 HTTP_NOT_FOUND = HTTPStatus.NOT_FOUND
+HTTP_NOT_MODIFIED = HTTPStatus.NOT_MODIFIED
 HTTP_SERVER_ERROR_BOUNDARY = HTTPStatus.INTERNAL_SERVER_ERROR
 
 __all__ = [
@@ -79,9 +90,11 @@ __all__ = [
     "DEFAULT_BASE_URL",
     "DEFAULT_CACHE_TTL",
     "DEFAULT_CONCURRENCY",
+    "DEFAULT_MAX_PARTITION_SIZE",
     "DEFAULT_PER_PAGE",
     "DEFAULT_RATE_LIMIT",
     "DEFAULT_TIMEOUT",
+    "DOI_PATTERN",
     "DOI_URL_PREFIX",
     "FILTER_DEFAULT_PER_PAGE",
     "FIRST_PAGE",
@@ -89,13 +102,21 @@ __all__ = [
     "HEADER_ACCEPT",
     "HEADER_ACCEPT_ENCODING",
     "HEADER_AUTHORIZATION",
+    "HEADER_ETAG",
+    "HEADER_IF_MODIFIED_SINCE",
+    "HEADER_IF_NONE_MATCH",
+    "HEADER_LAST_MODIFIED",
     "HEADER_USER_AGENT",
     "HTTP_METHOD_GET",
     "HTTP_NOT_FOUND",
+    "HTTP_NOT_MODIFIED",
     "HTTP_SERVER_ERROR_BOUNDARY",
     "HTTP_TOO_MANY_REQUESTS",
     "HTTP_UNAUTHORIZED",
     "MAG_PREFIX",
+    "MAX_CONFIRMED_MISSES",
+    "MAX_OR_FILTER_VALUES",
+    "MAX_PAGED_RESULTS",
     "MAX_SECONDS_IN_MINUTE",
     "MINUTES_PER_HOUR",
     "OPENALEX_ID_PREFIX",
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .models.base import ListResult
     from .models.work import Ngram
 
@@ -47,10 +49,42 @@ from .models import (
 )
 from .models.filters import BaseFilter
 from .templates import AsyncEntityTemplate, SyncEntityTemplate
+from .utils.common import (
+    normalize_doi,
+    normalize_issn,
+    normalize_orcid,
+    normalize_pmid,
+    normalize_ror,
+)
 
 logger = get_logger(__name__)
 
 
+def _ids(item: dict[str, Any]) -> dict[str, Any]:
+    return item.get("ids") or {}
+
+
+def _work_dois(item: dict[str, Any]) -> tuple[str | None]:
+    return (normalize_doi(item.get("doi") or _ids(item).get("doi")),)
+
+
+def _work_pmids(item: dict[str, Any]) -> tuple[str | None]:
+    return (normalize_pmid(_ids(item).get("pmid")),)
+
+
+def _author_orcids(item: dict[str, Any]) -> tuple[str | None]:
+    return (normalize_orcid(item.get("orcid") or _ids(item).get("orcid")),)
+
+
+def _institution_rors(item: dict[str, Any]) -> tuple[str | None]:
+    return (normalize_ror(item.get("ror") or _ids(item).get("ror")),)
+
+
+def _source_issns(item: dict[str, Any]) -> list[str | None]:
+    issns = [item.get("issn_l"), *(item.get("issn") or [])]
+    return [normalize_issn(issn) for issn in issns]
+
+
 # Sync Entity Classes using the template - use the template directly as BaseEntity
 BaseEntity = SyncEntityTemplate
 
@@ -63,6 +97,22 @@ class Works(BaseEntity[Work, BaseFilter]):
         self.endpoint = "works"
         self.model_class = Work
 
+    def resolve_dois(
+        self, dois: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Work | None]:
+        """Resolve DOIs in bulk via batched ``doi`` filters."""
+        return self._resolve_identifiers(
+            dois, "doi", normalize_doi, _work_dois, max_concurrent
+        )
+
+    def resolve_pmids(
+        self, pmids: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Work | None]:
+        """Resolve PubMed IDs in bulk via batched ``ids.pmid`` filters."""
+        return self._resolve_identifiers(
+            pmids, "ids.pmid", normalize_pmid, _work_pmids, max_concurrent
+        )
+
     def ngrams(self, work_id: str, **params: Any) -> ListResult[Ngram]:
         """Get n-grams for a specific work."""
         from pydantic import ValidationError
@@ -124,6 +174,14 @@ class Authors(BaseEntity[Author, BaseFilter]):
         self.endpoint = "authors"
         self.model_class = Author
 
+    def resolve_orcids(
+        self, orcids: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Author | None]:
+        """Resolve ORCID iDs in bulk via batched ``orcid`` filters."""
+        return self._resolve_identifiers(
+            orcids, "orcid", normalize_orcid, _author_orcids, max_concurrent
+        )
+
 
 class Institutions(BaseEntity[Institution, BaseFilter]):
     """Access institutions entity with full API."""
@@ -133,6 +191,14 @@ class Institutions(BaseEntity[Institution, BaseFilter]):
         self.endpoint = "institutions"
         self.model_class = Institution
 
+    def resolve_rors(
+        self, rors: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Institution | None]:
+        """Resolve ROR IDs in bulk via batched ``ror`` filters."""
+        return self._resolve_identifiers(
+            rors, "ror", normalize_ror, _institution_rors, max_concurrent
+        )
+
 
 class Sources(BaseEntity[Source, BaseFilter]):
     """Access sources entity with full API."""
@@ -142,6 +208,14 @@ class Sources(BaseEntity[Source, BaseFilter]):
         self.endpoint = "sources"
         self.model_class = Source
 
+    def resolve_issns(
+        self, issns: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Source | None]:
+        """Resolve ISSNs in bulk via batched ``issn`` filters."""
+        return self._resolve_identifiers(
+            issns, "issn", normalize_issn, _source_issns, max_concurrent
+        )
+
 
 class Topics(BaseEntity[Topic, BaseFilter]):
     """Access topics entity with full API."""
@@ -200,6 +274,22 @@ class AsyncWorks(AsyncBaseEntity[Work, BaseFilter]):
         self.endpoint = "works"
         self.model_class = Work
 
+    async def resolve_dois(
+        self, dois: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Work | None]:
+        """Resolve DOIs in bulk via batched ``doi`` filters."""
+        return await self._resolve_identifiers(
+            dois, "doi", normalize_doi, _work_dois, max_concurrent
+        )
+
+    async def resolve_pmids(
+        self, pmids: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Work | None]:
+        """Resolve PubMed IDs in bulk via batched ``ids.pmid`` filters."""
+        return await self._resolve_identifiers(
+            pmids, "ids.pmid", normalize_pmid, _work_pmids, max_concurrent
+        )
+
     async def ngrams(self, work_id: str, **params: Any) -> ListResult[Ngram]:
         """Get n-grams for a specific work asynchronously."""
         from pydantic import ValidationError
@@ -261,6 +351,14 @@ class AsyncAuthors(AsyncBaseEntity[Author, BaseFilter]):
         self.endpoint = "authors"
         self.model_class = Author
 
+    async def resolve_orcids(
+        self, orcids: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Author | None]:
+        """Resolve ORCID iDs in bulk via batched ``orcid`` filters."""
+        return await self._resolve_identifiers(
+            orcids, "orcid", normalize_orcid, _author_orcids, max_concurrent
+        )
+
 
 class AsyncInstitutions(AsyncBaseEntity[Institution, BaseFilter]):
     """Access institutions entity with full async API."""
@@ -270,6 +368,14 @@ class AsyncInstitutions(AsyncBaseEntity[Institution, BaseFilter]):
         self.endpoint = "institutions"
         self.model_class = Institution
 
+    async def resolve_rors(
+        self, rors: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Institution | None]:
+        """Resolve ROR IDs in bulk via batched ``ror`` filters."""
+        return await self._resolve_identifiers(
+            rors, "ror", normalize_ror, _institution_rors, max_concurrent
+        )
+
 
 class AsyncSources(AsyncBaseEntity[Source, BaseFilter]):
     """Access sources entity with full async API."""
@@ -279,6 +385,14 @@ class AsyncSources(AsyncBaseEntity[Source, BaseFilter]):
         self.endpoint = "sources"
         self.model_class = Source
 
+    async def resolve_issns(
+        self, issns: Iterable[str], max_concurrent: int = 10
+    ) -> dict[str, Source | None]:
+        """Resolve ISSNs in bulk via batched ``issn`` filters."""
+        return await self._resolve_identifiers(
+            issns, "issn", normalize_issn, _source_issns, max_concurrent
+        )
+
 
 class AsyncTopics(AsyncBaseEntity[Topic, BaseFilter]):
     """Access topics entity with full async API."""
@@ -167,6 +167,10 @@ def configure_logging(
 
     structlog.configure(
         processors=processors,
+        # Drop calls below ``level`` before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(level.upper())
+        ),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
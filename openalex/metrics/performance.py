@@ -47,6 +47,7 @@ class PerformanceMetrics:
     rate_limit_hits: int = 0
 
     response_times: list[float] = field(default_factory=lambda: [])
+    cache_decode_times: list[float] = field(default_factory=lambda: [])
     errors_by_type: dict[str, int] = field(
         default_factory=lambda: defaultdict(int)
     )
@@ -80,6 +81,15 @@ class PerformanceMetrics:
             else 0.0
         )
 
+    @property
+    def avg_cache_decode_time(self) -> float:
+        """Average time to decode a compressed cache entry in milliseconds."""
+        return (
+            sum(self.cache_decode_times) / len(self.cache_decode_times)
+            if self.cache_decode_times
+            else 0.0
+        )
+
     @property
     def p95_response_time(self) -> float:
         """Calculate 95th percentile response time."""
@@ -112,6 +122,8 @@ class PerformanceMetrics:
                 "hits": self.cache_hits,
                 "misses": self.cache_misses,
                 "hit_rate": f"{self.cache_hit_rate:.2%}",
+                "decodes": len(self.cache_decode_times),
+                "avg_decode_time_ms": f"{self.avg_cache_decode_time:.3f}",
             },
             "performance": {
                 "avg_response_time_ms": f"{self.avg_response_time:.2f}",
@@ -169,6 +181,17 @@ class MetricsCollector:
         with self._lock:
             self._metrics.cache_misses += 1
 
+    def record_cache_decode(self, decode_time: float) -> None:
+        """Record the time in milliseconds spent decoding a cache entry."""
+        if not self._enabled:
+            return
+        with self._lock:
+            self._metrics.cache_decode_times.append(decode_time)
+            if len(self._metrics.cache_decode_times) > 1000:
+                self._metrics.cache_decode_times = (
+                    self._metrics.cache_decode_times[-1000:]
+                )
+
     def record_retry(self) -> None:
         """Record a retry attempt."""
         if not self._enabled:
@@ -202,6 +225,7 @@ class MetricsCollector:
                 total_retries=self._metrics.total_retries,
                 rate_limit_hits=self._metrics.rate_limit_hits,
                 response_times=self._metrics.response_times.copy(),
+                cache_decode_times=self._metrics.cache_decode_times.copy(),
                 errors_by_type=dict(self._metrics.errors_by_type),
                 requests_by_endpoint=dict(self._metrics.requests_by_endpoint),
                 start_time=self._metrics.start_time,
@@ -10,6 +10,7 @@ from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from ..constants import DOI_PATTERN
 from ..utils.text import invert_abstract
 
 __all__ = [
@@ -369,8 +370,7 @@ class Work(OpenAlexEntity):
         elif v.startswith("http://doi.org/"):
             normalized = v[15:]
 
-        doi_pattern = r"^10\.\d{4,9}/[-._;()/:\w]+$"
-        if not re.match(doi_pattern, normalized):
+        if not re.match(DOI_PATTERN, normalized):
             msg = f"Invalid DOI format: {v}"
             raise ValueError(msg)
 
@@ -3,18 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, cast
 
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
+    import os
+    from collections.abc import AsyncIterator, Iterator, Sequence
 
     from .config import OpenAlexConfig
     from .entities import AsyncBaseEntity, BaseEntity
     from .models.base import ListResult
+    from .streaming.checkpoint import CheckpointStore
+    from .streaming.partition import Partition
     from .streaming.stream import AsyncStreamingPaginator, StreamingPaginator
 
+from .constants import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_PARTITION_SIZE,
+    DEFAULT_RATE_LIMIT,
+)
 from .models import BaseFilter, GroupByResult
 from .utils.pagination import MAX_PER_PAGE, AsyncPaginator, Paginator
 
@@ -96,7 +105,7 @@ def _build_list_result(data: dict[str, Any], model: type[T]) -> ListResult[T]:
 class Query(Generic[T, F]):
     """Fluent interface for building API queries."""
 
-    __slots__ = ("entity", "params")
+    __slots__ = ("_fingerprint", "_normalized", "entity", "params")
 
     def __init__(
         self,
@@ -105,6 +114,42 @@ class Query(Generic[T, F]):
     ) -> None:
         self.entity = entity
         self.params: dict[str, Any] = params or {}
+        self._normalized: dict[str, Any] | None = None
+        self._fingerprint: str | None = None
+
+    @property
+    def normalized_params(self) -> dict[str, Any]:
+        """This query's parameters as sent to the API (computed once)."""
+        if self._normalized is None:
+            from .utils.params import normalize_params
+
+            self._normalized = normalize_params(self.params)
+        return self._normalized
+
+    @property
+    def fingerprint(self) -> str:
+        """Canonical fingerprint of this query's request (computed once).
+
+        Shared by the list cache key and stream checkpoints; see
+        :func:`~openalex.utils.fingerprint.request_fingerprint`.
+        """
+        if self._fingerprint is None:
+            from .utils.fingerprint import request_fingerprint
+
+            self._fingerprint = request_fingerprint(
+                self.entity.endpoint, self.normalized_params
+            )
+        return self._fingerprint
+
+    def _fingerprint_with(self, kwargs: dict[str, Any]) -> str:
+        """Return the fingerprint of this query extended by ``kwargs``."""
+        if not kwargs:
+            return self.fingerprint
+        from .streaming.checkpoint import query_fingerprint
+
+        return query_fingerprint(
+            self.entity.endpoint, {**self.params, **kwargs}
+        )
 
     def __getitem__(self, record_id: str | list[str]) -> T | ListResult[T]:
         """Get entity by ID or list of IDs."""
@@ -281,9 +326,10 @@ class Query(Generic[T, F]):
     # --- execution methods -----------------------------------------------
     def get(self, **kwargs: Any) -> ListResult[T]:
         """Execute query and return results (alias for list())."""
-        params = {**self.params, **kwargs}
-        filter_param = params.pop("filter", None)
-        return self.entity.list(filter=filter_param, **params)
+        query = (
+            Query(self.entity, {**self.params, **kwargs}) if kwargs else self
+        )
+        return self.entity.list_query(query)
 
     def list(self, **kwargs: Any) -> ListResult[T]:
         """Alias for :meth:`get`."""
@@ -293,15 +339,20 @@ class Query(Generic[T, F]):
         self,
         per_page: int = MAX_PER_PAGE,
         max_results: int | None = None,
+        prefetch: int = 0,
         **kwargs: Any,
     ) -> Paginator[T]:
-        """Return a paginator for this query."""
+        """Return a paginator for this query.
+
+        ``prefetch`` pages are fetched ahead in a background thread.
+        """
         params = {**self.params, **kwargs}
         filter_param = params.pop("filter", None)
         return self.entity.paginate(
             filter=filter_param,
             per_page=per_page,
             max_results=max_results,
+            prefetch=prefetch,
             **params,
         )
 
@@ -309,26 +360,159 @@ class Query(Generic[T, F]):
         self,
         per_page: int = 200,
         max_results: int | None = None,
+        prefetch: int = 0,
+        checkpoint: CheckpointStore | str | os.PathLike[str] | None = None,
+        checkpoint_key: str | None = None,
         **kwargs: Any,
     ) -> StreamingPaginator[T]:
-        """Return a memory-efficient streaming paginator."""
+        """Return a memory-efficient streaming paginator.
+
+        ``prefetch`` cursor pages are fetched ahead in a background thread.
+        With ``checkpoint`` (a store, or a JSON/SQLite path) progress is
+        saved after each page and an interrupted stream of the same query
+        resumes after its last fully consumed page.
+        """
         from .streaming import StreamingPaginator
 
         params = {**self.params, **kwargs}
-        filter_param = params.pop("filter", None)
+        fingerprint = self._fingerprint_with(kwargs)
 
         def fetch_page(page_params: dict[str, Any]) -> ListResult[T]:
-            return self.entity.list(
-                filter=filter_param, **{**params, **page_params}
-            )
+            # Cursor pages are read once, so they bypass the list cache
+            data = self.entity.get_list(**{**params, **page_params})
+            return self.entity.parse_list_response(data)
 
         return StreamingPaginator(
             fetch_func=fetch_page,
             params=params,
             per_page=per_page,
             max_results=max_results,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            checkpoint_key=checkpoint_key,
+            fingerprint=fingerprint,
+        )
+
+    def partitions(
+        self,
+        partition_by: str | Sequence[str],
+        max_partition_size: int = DEFAULT_MAX_PARTITION_SIZE,
+    ) -> list[Partition]:
+        """Split the query into disjoint slices using ``group_by`` probes.
+
+        Slices with more than ``max_partition_size`` results are split again
+        on the next field of ``partition_by``.
+        """
+        from .streaming.partition import plan_partitions
+
+        fields = (
+            [partition_by]
+            if isinstance(partition_by, str)
+            else list(partition_by)
+        )
+        return plan_partitions(
+            self._probe_groups, fields, self.count(), max_partition_size
+        )
+
+    def harvest(
+        self,
+        partition_by: str | Sequence[str],
+        per_page: int = 200,
+        max_workers: int = DEFAULT_CONCURRENCY,
+        max_partition_size: int = DEFAULT_MAX_PARTITION_SIZE,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        *,
+        deduplicate: bool = False,
+        checkpoint: CheckpointStore | str | os.PathLike[str] | None = None,
+        checkpoint_key: str | None = None,
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        """Harvest every result with one cursor per partition in parallel.
+
+        Page requests from all workers share one rate limiter. Results
+        arrive in no particular order; ``deduplicate`` drops repeated IDs
+        but keeps every ID seen in memory for the whole harvest.
+        With ``checkpoint`` each partition's cursor is saved under its own
+        key, so a restarted harvest skips finished partitions and resumes
+        the others.
+        """
+        from .streaming import StreamingPaginator, harvest_partitions
+        from .streaming.checkpoint import (
+            open_checkpoint_store,
+            query_fingerprint,
+        )
+        from .utils.rate_limit import RateLimiter
+
+        limiter = RateLimiter(
+            rate_limit, buffer=self.entity.config.rate_limit_buffer
+        )
+        endpoint = self.entity.endpoint
+        store = (
+            open_checkpoint_store(checkpoint)
+            if checkpoint is not None
+            else None
+        )
+        base_key = checkpoint_key or self._fingerprint_with(kwargs)
+
+        def open_stream(partition: Partition) -> StreamingPaginator[T]:
+            params = {**self._restrict(partition.filters).params, **kwargs}
+            fingerprint = query_fingerprint(endpoint, params)
+
+            def fetch_page(page_params: dict[str, Any]) -> ListResult[T]:
+                with limiter:
+                    data = self.entity.get_list(**{**params, **page_params})
+                return self.entity.parse_list_response(data)
+
+            return StreamingPaginator(
+                fetch_func=fetch_page,
+                params=params,
+                per_page=per_page,
+                checkpoint=store,
+                checkpoint_key=f"{base_key}/{partition.key}",
+                fingerprint=fingerprint,
+            )
+
+        yield from harvest_partitions(
+            self.partitions(partition_by, max_partition_size),
+            open_stream,
+            max_workers=max_workers,
+            deduplicate=deduplicate,
+        )
+
+    def _restrict(self, filters: dict[str, Any]) -> Query[T, F]:
+        """Return a copy of the query limited to a partition's filters."""
+        from .streaming.partition import apply_partition
+
+        return Query(
+            self.entity,
+            {
+                **self.params,
+                "filter": apply_partition(self.params.get("filter"), filters),
+            },
         )
 
+    def _probe_groups(
+        self, filters: dict[str, Any], field: str
+    ) -> list[tuple[Any, int]]:
+        """Return ``(filter value, count)`` for each ``field`` bucket."""
+        from .streaming.partition import group_filter_value
+
+        query = self._restrict(filters)
+        groups: list[tuple[Any, int]] = []
+        cursor: str | None = "*"
+        while cursor:
+            result = query.get(
+                group_by=f"{field}:include_unknown",
+                per_page=MAX_PER_PAGE,
+                cursor=cursor,
+            )
+            groups.extend(
+                (group_filter_value(group.key), group.count)
+                for group in result.group_by or []
+            )
+            cursor = result.meta.next_cursor
+        return groups
+
     def all(
         self,
         per_page: int = 1,
@@ -389,6 +573,54 @@ class AsyncQuery(Generic[T, F]):
         self._model_class = model_class
         self._config = config
         self._params: dict[str, Any] = {}
+        self._normalized: dict[str, Any] | None = None
+        self._fingerprint: str | None = None
+
+    @property
+    def normalized_params(self) -> dict[str, Any]:
+        """This query's parameters as sent to the API.
+
+        Computed once and reset whenever a builder method changes the
+        parameters.
+        """
+        if self._normalized is None:
+            from .utils.params import normalize_params
+
+            self._normalized = normalize_params(self._params)
+        return self._normalized
+
+    @property
+    def fingerprint(self) -> str:
+        """Canonical fingerprint of this query's request (see
+        :attr:`Query.fingerprint`)."""
+        if self._fingerprint is None:
+            from .utils.fingerprint import request_fingerprint
+
+            self._fingerprint = request_fingerprint(
+                self._entity.endpoint, self.normalized_params
+            )
+        return self._fingerprint
+
+    def _fingerprint_with(self, kwargs: dict[str, Any]) -> str:
+        """Return the fingerprint of this query extended by ``kwargs``."""
+        if not kwargs:
+            return self.fingerprint
+        from .streaming.checkpoint import query_fingerprint
+
+        return query_fingerprint(
+            self._entity.endpoint, {**self._params, **kwargs}
+        )
+
+    def _invalidate(self) -> AsyncQuery[T, F]:
+        """Forget the normalized params and fingerprint after a change."""
+        self._normalized = None
+        self._fingerprint = None
+        return self
+
+    def _with_params(self, params: dict[str, Any]) -> AsyncQuery[T, F]:
+        """Return a copy of this query with ``params`` added."""
+        query = AsyncQuery(self._entity, self._model_class, self._config)
+        return query.update_params(**self._params, **params)
 
     def filter(self, **kwargs: Any) -> AsyncQuery[T, F]:
         current = self._params.get("filter")
@@ -398,7 +630,7 @@ class AsyncQuery(Generic[T, F]):
             self._params["filter"] = current_dict
         else:
             self._params["filter"] = kwargs
-        return self
+        return self._invalidate()
 
     def filter_or(self, **kwargs: Any) -> AsyncQuery[T, F]:
         current = self._params.get("filter")
@@ -411,7 +643,7 @@ class AsyncQuery(Generic[T, F]):
             self._params["filter"] = new_filter
         else:
             self._params["filter"] = or_(kwargs)
-        return self
+        return self._invalidate()
 
     def filter_not(self, **kwargs: Any) -> AsyncQuery[T, F]:
         return self.filter(**{k: not_(v) for k, v in kwargs.items()})
@@ -430,49 +662,56 @@ class AsyncQuery(Generic[T, F]):
 
     def search(self, query: str) -> AsyncQuery[T, F]:
         self._params["search"] = query
-        return self
+        return self._invalidate()
 
     def search_filter(self, **kwargs: Any) -> AsyncQuery[T, F]:
         if "filter" not in self._params:
             self._params["filter"] = {}
         for field, value in kwargs.items():
             self._params["filter"][f"{field}.search"] = value
-        return self
+        return self._invalidate()
 
     def sort(self, **kwargs: str) -> AsyncQuery[T, F]:
         sort_parts = [f"{k}:{v}" for k, v in kwargs.items()]
         self._params["sort"] = ",".join(sort_parts)
-        return self
+        return self._invalidate()
 
     def group_by(self, field: str) -> AsyncQuery[T, F]:
         self._params["group_by"] = field
-        return self
+        return self._invalidate()
 
     def select(self, fields: list[str] | str) -> AsyncQuery[T, F]:
         if isinstance(fields, str):
             self._params["select"] = fields
         else:
             self._params["select"] = ",".join(fields)
-        return self
+        return self._invalidate()
 
     def sample(self, n: int, seed: int | None = None) -> AsyncQuery[T, F]:
         """Sample random results."""
         self._params["sample"] = n
         if seed is not None:
             self._params["seed"] = seed
-        return self
+        return self._invalidate()
 
     def update_params(self, **params: Any) -> AsyncQuery[T, F]:
         """Update query parameters."""
         self._params.update(params)
-        return self
+        return self._invalidate()
 
     def paginate(
         self,
         per_page: int = MAX_PER_PAGE,
         max_results: int | None = None,
+        prefetch: int = 0,
+        partition_by: str | Sequence[str] | None = None,
         **kwargs: Any,
     ) -> AsyncPaginator[T]:
+        """Return an async paginator.
+
+        ``partition_by`` lets :meth:`AsyncPaginator.gather` split result sets
+        beyond the numbered-page limit into concurrent cursor walks.
+        """
         params = {**self._params, **kwargs}
 
         async def fetch_page(page_params: dict[str, Any]) -> ListResult[T]:
@@ -485,15 +724,28 @@ class AsyncQuery(Generic[T, F]):
             params=params,
             per_page=per_page,
             max_results=max_results,
+            prefetch=prefetch,
+            partitioner=(
+                None
+                if partition_by is None
+                else partial(self._partition_params, partition_by, kwargs)
+            ),
         )
 
     async def stream(
         self,
         per_page: int = 200,
         max_results: int | None = None,
+        prefetch: int = 0,
+        checkpoint: CheckpointStore | str | os.PathLike[str] | None = None,
+        checkpoint_key: str | None = None,
         **kwargs: Any,
     ) -> AsyncStreamingPaginator[T]:
-        """Return a memory-efficient async streaming paginator."""
+        """Return a memory-efficient async streaming paginator.
+
+        ``prefetch`` cursor pages are fetched ahead in a background task;
+        ``checkpoint`` works as in :meth:`Query.stream`.
+        """
         from .streaming import AsyncStreamingPaginator
 
         params = {**self._params, **kwargs}
@@ -508,25 +760,157 @@ class AsyncQuery(Generic[T, F]):
             params=params,
             per_page=per_page,
             max_results=max_results,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            checkpoint_key=checkpoint_key,
+            fingerprint=self._fingerprint_with(kwargs),
+        )
+
+    async def partitions(
+        self,
+        partition_by: str | Sequence[str],
+        max_partition_size: int = DEFAULT_MAX_PARTITION_SIZE,
+    ) -> list[Partition]:
+        """Split the query into disjoint slices using ``group_by`` probes."""
+        from .streaming.partition import async_plan_partitions
+
+        fields = (
+            [partition_by]
+            if isinstance(partition_by, str)
+            else list(partition_by)
+        )
+        return await async_plan_partitions(
+            self._probe_groups, fields, await self.count(), max_partition_size
+        )
+
+    async def harvest(
+        self,
+        partition_by: str | Sequence[str],
+        per_page: int = 200,
+        max_workers: int = DEFAULT_CONCURRENCY,
+        max_partition_size: int = DEFAULT_MAX_PARTITION_SIZE,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        *,
+        deduplicate: bool = False,
+        checkpoint: CheckpointStore | str | os.PathLike[str] | None = None,
+        checkpoint_key: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[T]:
+        """Harvest every result with one cursor per partition concurrently.
+
+        ``checkpoint`` works as in :meth:`Query.harvest`.
+        """
+        from .streaming import AsyncStreamingPaginator, async_harvest_partitions
+        from .streaming.checkpoint import (
+            open_checkpoint_store,
+            query_fingerprint,
         )
+        from .utils.rate_limit import AsyncRateLimiter
+
+        limiter = AsyncRateLimiter(
+            rate_limit, buffer=self._config.rate_limit_buffer
+        )
+        endpoint = self._entity.endpoint
+        store = (
+            open_checkpoint_store(checkpoint)
+            if checkpoint is not None
+            else None
+        )
+        base_key = checkpoint_key or self._fingerprint_with(kwargs)
+
+        def open_stream(partition: Partition) -> AsyncStreamingPaginator[T]:
+            params = {**self._restricted_params(partition.filters), **kwargs}
+
+            async def fetch_page(page_params: dict[str, Any]) -> ListResult[T]:
+                async with limiter:
+                    data = await self._entity.get_list(
+                        **{**params, **page_params}
+                    )
+                return _build_list_result(data, self._model_class)
+
+            return AsyncStreamingPaginator(
+                fetch_func=fetch_page,
+                params=params,
+                per_page=per_page,
+                checkpoint=store,
+                checkpoint_key=f"{base_key}/{partition.key}",
+                fingerprint=query_fingerprint(endpoint, params),
+            )
+
+        partitions = await self.partitions(partition_by, max_partition_size)
+        async for item in async_harvest_partitions(
+            partitions,
+            open_stream,
+            max_workers=max_workers,
+            deduplicate=deduplicate,
+        ):
+            yield item
+
+    async def _partition_params(
+        self,
+        partition_by: str | Sequence[str],
+        extra: dict[str, Any],
+        max_partition_size: int,
+    ) -> list[dict[str, Any]]:
+        """Return the query parameters of each partition."""
+        partitions = await self.partitions(partition_by, max_partition_size)
+        return [
+            {**self._restricted_params(partition.filters), **extra}
+            for partition in partitions
+        ]
+
+    def _restricted_params(self, filters: dict[str, Any]) -> dict[str, Any]:
+        """Return query parameters limited to a partition's filters."""
+        from .streaming.partition import apply_partition
+
+        params = self._params.copy()
+        restricted = apply_partition(params.get("filter"), filters)
+        if restricted:
+            params["filter"] = restricted
+        return params
+
+    async def _probe_groups(
+        self, filters: dict[str, Any], field: str
+    ) -> list[tuple[Any, int]]:
+        """Return ``(filter value, count)`` for each ``field`` bucket."""
+        from .streaming.partition import group_filter_value
+
+        params = self._restricted_params(filters)
+        groups: list[tuple[Any, int]] = []
+        cursor: str | None = "*"
+        while cursor:
+            data = await self._entity.get_list(
+                **{
+                    **params,
+                    "group_by": f"{field}:include_unknown",
+                    "per_page": MAX_PER_PAGE,
+                    "cursor": cursor,
+                }
+            )
+            groups.extend(
+                (group_filter_value(str(group["key"])), int(group["count"]))
+                for group in data.get("group_by") or []
+            )
+            cursor = data.get("meta", {}).get("next_cursor")
+        return groups
 
     async def get(
         self,
         page: int | None = None,
         per_page: int | None = None,
     ) -> ListResult[T] | GroupByResult:
-        params = self._params.copy()
+        params: dict[str, Any] = {}
         if page is not None:
             params["page"] = page
         if per_page is not None:
             params["per_page"] = per_page
 
-        data = await self._entity.get_list(**params)
-
         if "group_by" in self._params:
+            data = await self._entity.get_list(**self._params, **params)
             return GroupByResult(**data)
 
-        return _build_list_result(data, self._model_class)
+        query = self._with_params(params) if params else self
+        return await self._entity.list_query(query)
 
     async def all(self) -> AsyncIterator[T]:
         """Iterate over all results using proper pagination."""
@@ -1,12 +1,17 @@
 from .async_circuit_breaker import AsyncCircuitBreaker
+from .async_coalescer import AsyncRequestCoalescer
 from .async_queue import AsyncRequestQueue
 from .circuit_breaker import CircuitBreaker, CircuitState
+from .coalescer import RequestCoalescer, request_key
 from .request_queue import RequestQueue
 
 __all__ = [
     "AsyncCircuitBreaker",
+    "AsyncRequestCoalescer",
     "AsyncRequestQueue",
     "CircuitBreaker",
     "CircuitState",
+    "RequestCoalescer",
     "RequestQueue",
+    "request_key",
 ]
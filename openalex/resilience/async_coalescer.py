@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+__all__ = ["AsyncRequestCoalescer"]
+
+T = TypeVar("T")
+
+
+class _LeaderCancelledError(Exception):
+    """The call being awaited was cancelled; followers should retry."""
+
+
+class AsyncRequestCoalescer:
+    """Async version of :class:`RequestCoalescer`.
+
+    When the task running a call is cancelled, the tasks waiting on it are
+    not: the first of them retries the call as the new leader and the rest
+    wait on that.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Await ``func`` for ``key`` unless an identical call is in flight."""
+        loop = asyncio.get_running_loop()
+        while (
+            future := self._in_flight.get(key)
+        ) is not None and future.get_loop() is loop:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelledError:
+                continue
+
+        future = loop.create_future()
+        self._in_flight[key] = future
+        self._executed += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelledError())
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def stats(self) -> dict[str, int]:
+        """Return execution and coalescing counters."""
+        return {
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._in_flight),
+        }
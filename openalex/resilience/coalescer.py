@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from structlog import get_logger
+
+from ..utils.fingerprint import request_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["RequestCoalescer", "request_key"]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def request_key(
+    method: str, url: str, params: dict[str, Any] | None = None
+) -> str:
+    """Return a stable key for a request (method and request fingerprint)."""
+    return f"{method.upper()} {request_fingerprint(url, params)}"
+
+
+@dataclass(slots=True)
+class _InFlightCall(Generic[T]):
+    """A request currently being executed by a leader thread."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: T | None = None
+    error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Collapse identical concurrent calls into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, _InFlightCall[Any]] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """Run ``func`` for ``key`` unless an identical call is in flight."""
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if call is None:
+                call = _InFlightCall[Any]()
+                self._in_flight[key] = call
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict[str, int]:
+        """Return execution and coalescing counters."""
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._in_flight),
+            }
@@ -1,3 +1,26 @@
+from .checkpoint import (
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    open_checkpoint_store,
+)
+from .partition import (
+    Partition,
+    async_harvest_partitions,
+    harvest_partitions,
+)
 from .stream import AsyncStreamingPaginator, StreamingPaginator
 
-__all__ = ["AsyncStreamingPaginator", "StreamingPaginator"]
+__all__ = [
+    "AsyncStreamingPaginator",
+    "Checkpoint",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "Partition",
+    "SQLiteCheckpointStore",
+    "StreamingPaginator",
+    "async_harvest_partitions",
+    "harvest_partitions",
+    "open_checkpoint_store",
+]
@@ -0,0 +1,235 @@
+"""Durable cursor checkpoints for resumable harvests."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from structlog import get_logger
+
+from ..utils.fingerprint import request_fingerprint
+from ..utils.params import normalize_params
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = [
+    "Checkpoint",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+    "open_checkpoint_store",
+    "query_fingerprint",
+]
+
+logger = get_logger(__name__)
+
+SQLITE_SUFFIXES: Final = frozenset({".db", ".sqlite", ".sqlite3"})
+
+
+def query_fingerprint(endpoint: str, params: dict[str, Any]) -> str:
+    """Return the request fingerprint of a query's endpoint and parameters.
+
+    ``params`` are normalized first, so this matches
+    :attr:`~openalex.query.Query.fingerprint`.
+    """
+    return request_fingerprint(endpoint, normalize_params(params))
+
+
+@dataclass(slots=True)
+class Checkpoint:
+    """Progress of a cursor stream after its last fully consumed page."""
+
+    fingerprint: str
+    cursor: str | None
+    yielded: int
+    done: bool = False
+    updated_at: float = field(default_factory=time.time)
+
+
+class CheckpointStore(ABC):
+    """Abstract storage for :class:`Checkpoint` records."""
+
+    @abstractmethod
+    def load(self, key: str) -> Checkpoint | None:
+        """Return the checkpoint stored under ``key``, if any."""
+
+    @abstractmethod
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """Persist ``checkpoint`` under ``key``."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the checkpoint stored under ``key``."""
+
+    def resume(self, key: str, fingerprint: str) -> Checkpoint | None:
+        """Return the checkpoint for ``key`` if it matches ``fingerprint``."""
+        checkpoint = self.load(key)
+        if checkpoint is None:
+            return None
+        if checkpoint.fingerprint != fingerprint:
+            logger.warning(
+                "checkpoint_fingerprint_mismatch", key=key, action="restart"
+            )
+            return None
+        logger.info(
+            "checkpoint_resumed",
+            key=key,
+            yielded=checkpoint.yielded,
+            done=checkpoint.done,
+        )
+        return checkpoint
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive OS lock on ``path``, shared by all processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as handle:
+        fd = handle.fileno()
+        if sys.platform == "win32":
+            import msvcrt
+
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoints kept in a JSON file, rewritten atomically on each save.
+
+    Saves and deletes hold an OS lock on a ``.lock`` file next to the JSON
+    file, so several stores or processes can share one path without losing
+    each other's updates.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("checkpoint_file_unreadable", path=str(self.path))
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, data: dict[str, dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            record = self._read().get(key)
+        return Checkpoint(**record) if record else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock, _file_lock(self._lock_path):
+            data = self._read()
+            data[key] = asdict(checkpoint)
+            self._write(data)
+
+    def delete(self, key: str) -> None:
+        with self._lock, _file_lock(self._lock_path):
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoints kept in a SQLite database, one row per stream."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, "
+                "cursor TEXT, yielded INTEGER NOT NULL, "
+                "done INTEGER NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, cursor, yielded, done, updated_at "
+                "FROM checkpoints WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        fingerprint, cursor, yielded, done, updated_at = row
+        return Checkpoint(fingerprint, cursor, yielded, bool(done), updated_at)
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    checkpoint.fingerprint,
+                    checkpoint.cursor,
+                    checkpoint.yielded,
+                    int(checkpoint.done),
+                    checkpoint.updated_at,
+                ),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM checkpoints WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def open_checkpoint_store(
+    target: CheckpointStore | str | os.PathLike[str],
+) -> CheckpointStore:
+    """Return ``target`` as a store, opening a path by its suffix.
+
+    ``.db``, ``.sqlite`` and ``.sqlite3`` paths use SQLite; any other path
+    is treated as a JSON file.
+    """
+    if isinstance(target, CheckpointStore):
+        return target
+    path = Path(target)
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        return SQLiteCheckpointStore(path)
+    return FileCheckpointStore(path)
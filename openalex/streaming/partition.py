@@ -0,0 +1,292 @@
+"""Partitioned parallel harvesting of large result sets."""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final, TypeVar
+
+from structlog import get_logger
+
+from ..constants import DEFAULT_CONCURRENCY
+from ..query import or_
+from ..utils.params import flatten_filter_dict
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Generator,
+        Iterable,
+        Sequence,
+    )
+
+__all__ = [
+    "Partition",
+    "apply_partition",
+    "async_harvest_partitions",
+    "async_plan_partitions",
+    "group_filter_value",
+    "harvest_partitions",
+    "plan_partitions",
+]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+UNKNOWN_GROUP_KEY: Final = "unknown"
+_DONE: Final = object()
+_BUFFER_PER_WORKER: Final = 200
+_PUT_POLL_INTERVAL: Final = 0.1
+
+GroupCounts = list[tuple[Any, int]]
+
+
+@dataclass(frozen=True, slots=True)
+class Partition:
+    """A disjoint slice of a query, described by extra filters."""
+
+    filters: dict[str, Any] = field(default_factory=dict)
+    count: int = 0
+
+    @property
+    def key(self) -> str:
+        """Stable identifier such as ``publication_year=2020,type=article``."""
+        return ",".join(
+            f"{k}={'null' if v is None else v}" for k, v in self.filters.items()
+        )
+
+
+def apply_partition(current: Any, filters: dict[str, Any]) -> Any:
+    """Return the ``current`` filter restricted to ``filters``."""
+    if not filters:
+        return current
+    if isinstance(current, or_):
+        msg = "Partitioned harvests do not support OR filters"
+        raise TypeError(msg)
+    if not current:
+        return dict(filters)
+    if isinstance(current, str):
+        return f"{current},{flatten_filter_dict(filters)}"
+
+    merged: dict[str, Any] = dict(current)
+    for key, value in filters.items():
+        # A tuple serializes as repeated ``key:value`` AND conditions
+        merged[key] = (merged[key], value) if key in merged else value
+    return merged
+
+
+def group_filter_value(key: str) -> str | None:
+    """Return the filter value selecting a ``group_by`` bucket ``key``.
+
+    ``unknown`` maps to ``None`` (``null``) and entity URLs to their last
+    path segment (``I123``, ``article``).
+    """
+    if key == UNKNOWN_GROUP_KEY:
+        return None
+    return key.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _check_coverage(filters: dict[str, Any], count: int, covered: int) -> None:
+    if covered < count:
+        logger.warning(
+            "partition_gap",
+            filters=filters,
+            expected=count,
+            covered=covered,
+        )
+
+
+def plan_partitions(
+    probe: Callable[[dict[str, Any], str], GroupCounts],
+    fields: Sequence[str],
+    total: int,
+    max_size: int,
+) -> list[Partition]:
+    """Split a result set of ``total`` items into disjoint partitions.
+
+    ``probe(filters, field)`` returns ``(value, count)`` pairs for ``field``
+    within ``filters``. Partitions larger than ``max_size`` are split again
+    on the next field; the last field's buckets are kept as they are.
+    """
+
+    def split(
+        filters: dict[str, Any], count: int, depth: int
+    ) -> list[Partition]:
+        if count <= max_size or depth >= len(fields):
+            return [Partition(filters, count)]
+
+        name = fields[depth]
+        parts: list[Partition] = []
+        covered = 0
+        for value, group_count in probe(filters, name):
+            covered += group_count
+            parts.extend(
+                split({**filters, name: value}, group_count, depth + 1)
+            )
+        _check_coverage(filters, count, covered)
+        return parts
+
+    return split({}, total, 0)
+
+
+async def async_plan_partitions(
+    probe: Callable[[dict[str, Any], str], Awaitable[GroupCounts]],
+    fields: Sequence[str],
+    total: int,
+    max_size: int,
+) -> list[Partition]:
+    """Async version of :func:`plan_partitions`."""
+
+    async def split(
+        filters: dict[str, Any], count: int, depth: int
+    ) -> list[Partition]:
+        if count <= max_size or depth >= len(fields):
+            return [Partition(filters, count)]
+
+        name = fields[depth]
+        parts: list[Partition] = []
+        covered = 0
+        for value, group_count in await probe(filters, name):
+            covered += group_count
+            parts.extend(
+                await split({**filters, name: value}, group_count, depth + 1)
+            )
+        _check_coverage(filters, count, covered)
+        return parts
+
+    return await split({}, total, 0)
+
+
+class _SeenIds:
+    """Drop items whose ``id`` was already yielded."""
+
+    __slots__ = ("_enabled", "_seen")
+
+    def __init__(self, *, enabled: bool) -> None:
+        self._enabled = enabled
+        self._seen: set[Any] = set()
+
+    def is_new(self, item: Any) -> bool:
+        item_id = getattr(item, "id", None) if self._enabled else None
+        if item_id is None:
+            return True
+        if item_id in self._seen:
+            return False
+        self._seen.add(item_id)
+        return True
+
+
+def harvest_partitions(
+    partitions: Sequence[Partition],
+    open_stream: Callable[[Partition], Iterable[T]],
+    *,
+    max_workers: int = DEFAULT_CONCURRENCY,
+    deduplicate: bool = False,
+) -> Generator[T, None, None]:
+    """Stream every partition concurrently and merge the results.
+
+    Each partition is iterated in a worker thread; items are yielded in
+    arrival order. Partitions are disjoint, so items are not deduplicated
+    by default; ``deduplicate`` yields items sharing an ``id`` once, at the
+    cost of keeping every yielded ID in memory until the harvest ends. The
+    first error from any partition is re-raised and stops the remaining
+    workers.
+    """
+    buffer: queue.Queue[tuple[Any, BaseException | None]] = queue.Queue(
+        maxsize=max_workers * _BUFFER_PER_WORKER
+    )
+    stop = threading.Event()
+
+    def put(entry: tuple[Any, BaseException | None]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=_PUT_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def work(partition: Partition) -> None:
+        if stop.is_set():
+            return
+        try:
+            for item in open_stream(partition):
+                if not put((item, None)):
+                    return
+        except Exception as exc:
+            put((_DONE, exc))
+            return
+        put((_DONE, None))
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="openalex-harvest"
+    )
+    for partition in partitions:
+        executor.submit(work, partition)
+
+    seen = _SeenIds(enabled=deduplicate)
+    remaining = len(partitions)
+    try:
+        while remaining:
+            item, error = buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                remaining -= 1
+            elif seen.is_new(item):
+                yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_harvest_partitions(
+    partitions: Sequence[Partition],
+    open_stream: Callable[[Partition], AsyncIterator[T]],
+    *,
+    max_workers: int = DEFAULT_CONCURRENCY,
+    deduplicate: bool = False,
+) -> AsyncGenerator[T, None]:
+    """Async version of :func:`harvest_partitions` using worker tasks."""
+    buffer: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue(
+        maxsize=max_workers * _BUFFER_PER_WORKER
+    )
+    pending = list(partitions)
+
+    async def work() -> None:
+        try:
+            while pending:
+                async for item in open_stream(pending.pop(0)):
+                    await buffer.put((item, None))
+        except Exception as exc:
+            await buffer.put((_DONE, exc))
+            return
+        await buffer.put((_DONE, None))
+
+    workers = [
+        asyncio.create_task(work())
+        for _ in range(min(max_workers, len(pending)))
+    ]
+
+    seen = _SeenIds(enabled=deduplicate)
+    remaining = len(workers)
+    try:
+        while remaining:
+            item, error = await buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                remaining -= 1
+            elif seen.is_new(item):
+                yield item
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -1,20 +1,88 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+)
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from structlog import get_logger
 
+from ..utils.pagination import async_prefetch_iter, prefetch_iter
+from .checkpoint import Checkpoint, open_checkpoint_store, query_fingerprint
+
 if TYPE_CHECKING:
+    import os
+
     from ..models import ListResult
+    from .checkpoint import CheckpointStore
 
 T = TypeVar("T")
 
 logger = get_logger(__name__)
 
 
-class StreamingPaginator(Iterator[T]):
-    """Memory-efficient streaming paginator."""
+class _Checkpointed:
+    """Cursor checkpointing shared by the streaming paginators.
+
+    After each fully consumed page the next cursor and the number of items
+    yielded are saved, so a new paginator with the same key and fingerprint
+    resumes right after that page.
+    """
+
+    _cursor: str | None
+    _total_yielded: int
+    _exhausted: bool
+
+    def _init_checkpoint(
+        self,
+        params: dict[str, Any],
+        checkpoint: CheckpointStore | str | os.PathLike[str] | None,
+        checkpoint_key: str | None,
+        fingerprint: str | None,
+    ) -> None:
+        self._checkpoint = (
+            open_checkpoint_store(checkpoint)
+            if checkpoint is not None
+            else None
+        )
+        self._fingerprint = fingerprint or query_fingerprint("", params)
+        self._checkpoint_key = checkpoint_key or self._fingerprint
+        if self._checkpoint is None:
+            return
+
+        state = self._checkpoint.resume(self._checkpoint_key, self._fingerprint)
+        if state is not None:
+            self._cursor = None if state.done else state.cursor
+            self._total_yielded = state.yielded
+            self._exhausted = state.done
+
+    def _save_checkpoint(self, *, done: bool = False) -> None:
+        if self._checkpoint is None:
+            return
+        self._checkpoint.save(
+            self._checkpoint_key,
+            Checkpoint(
+                fingerprint=self._fingerprint,
+                cursor=self._cursor,
+                yielded=self._total_yielded,
+                done=done,
+            ),
+        )
+
+
+class StreamingPaginator(_Checkpointed, Iterator[T]):
+    """Memory-efficient streaming paginator.
+
+    With ``prefetch`` > 0, up to that many cursor pages are fetched ahead in
+    a background thread while the current page is consumed. With a
+    ``checkpoint`` store (or path), progress is saved after every page and a
+    later paginator for the same query resumes where this one stopped.
+    """
 
     def __init__(
         self,
@@ -22,16 +90,25 @@ class StreamingPaginator(Iterator[T]):
         params: dict[str, Any],
         per_page: int = 200,
         max_results: int | None = None,
+        prefetch: int = 0,
+        checkpoint: CheckpointStore | str | os.PathLike[str] | None = None,
+        checkpoint_key: str | None = None,
+        fingerprint: str | None = None,
     ) -> None:
         self._fetch_func = fetch_func
         self._params = params.copy()
         self._per_page = per_page
         self._max_results = max_results
+        self._prefetch = prefetch
         self._cursor: str | None = "*"
+        self._pages: Generator[ListResult[T], None, None] | None = None
         self._current_page: ListResult[T] | None = None
         self._current_index = 0
         self._total_yielded = 0
         self._exhausted = False
+        self._init_checkpoint(
+            self._params, checkpoint, checkpoint_key, fingerprint
+        )
 
     def __iter__(self) -> Iterator[T]:
         return self
@@ -45,6 +122,9 @@ class StreamingPaginator(Iterator[T]):
             and self._total_yielded >= self._max_results
         ):
             self._exhausted = True
+            if self._pages is not None:
+                # Stop any background prefetching
+                self._pages.close()
             raise StopIteration
 
         if self._current_page is None or self._current_index >= len(
@@ -62,37 +142,57 @@ class StreamingPaginator(Iterator[T]):
         return result
 
     def _fetch_next_page(self) -> None:
-        if self._cursor is None:
-            self._exhausted = True
-            return
-
-        if self._cursor == "":
-            self._exhausted = True
-            return
+        if self._pages is None:
+            self._pages = prefetch_iter(self._iter_pages(), self._prefetch)
 
-        params = {
-            **self._params,
-            "per_page": self._per_page,
-            "cursor": self._cursor,
-        }
+        if self._current_page is not None:
+            # The previous page has been fully consumed
+            self._save_checkpoint()
 
         try:
-            self._current_page = self._fetch_func(params)
-        except Exception as e:
-            logger.exception(
-                "streaming_fetch_error", error=str(e), cursor=self._cursor
-            )
+            page = next(self._pages)
+        except StopIteration:
+            self._current_page = None
+            self._exhausted = True
+            self._save_checkpoint(done=True)
+            return
+        except Exception:
             self._exhausted = True
             raise
+        self._current_page = page
         self._current_index = 0
-        self._cursor = self._current_page.meta.next_cursor
-
-        if self._cursor == "":
-            self._cursor = None
-
-
-class AsyncStreamingPaginator(AsyncIterator[T]):
-    """Async memory-efficient streaming paginator."""
+        self._cursor = page.meta.next_cursor or None
+
+    def _iter_pages(self) -> Iterator[ListResult[T]]:
+        cursor = self._cursor
+        fetched = self._total_yielded
+        while cursor:
+            if self._max_results is not None and fetched >= self._max_results:
+                return
+
+            params = {
+                **self._params,
+                "per_page": self._per_page,
+                "cursor": cursor,
+            }
+            try:
+                page = self._fetch_func(params)
+            except Exception as e:
+                logger.exception(
+                    "streaming_fetch_error", error=str(e), cursor=cursor
+                )
+                raise
+            fetched += len(page.results)
+            yield page
+            cursor = page.meta.next_cursor
+
+
+class AsyncStreamingPaginator(_Checkpointed, AsyncIterator[T]):
+    """Async memory-efficient streaming paginator.
+
+    Supports the same ``prefetch`` and ``checkpoint`` options as
+    :class:`StreamingPaginator`, prefetching in a background task.
+    """
 
     def __init__(
         self,
@@ -100,16 +200,25 @@ class AsyncStreamingPaginator(AsyncIterator[T]):
         params: dict[str, Any],
         per_page: int = 200,
         max_results: int | None = None,
+        prefetch: int = 0,
+        checkpoint: CheckpointStore | str | os.PathLike[str] | None = None,
+        checkpoint_key: str | None = None,
+        fingerprint: str | None = None,
     ) -> None:
         self._fetch_func = fetch_func
         self._params = params.copy()
         self._per_page = per_page
         self._max_results = max_results
+        self._prefetch = prefetch
         self._cursor: str | None = "*"
+        self._pages: AsyncGenerator[ListResult[T], None] | None = None
         self._current_page: ListResult[T] | None = None
         self._current_index = 0
         self._total_yielded = 0
         self._exhausted = False
+        self._init_checkpoint(
+            self._params, checkpoint, checkpoint_key, fingerprint
+        )
 
     def __aiter__(self) -> AsyncIterator[T]:
         return self
@@ -123,6 +232,9 @@ class AsyncStreamingPaginator(AsyncIterator[T]):
             and self._total_yielded >= self._max_results
         ):
             self._exhausted = True
+            if self._pages is not None:
+                # Stop any background prefetching
+                await self._pages.aclose()
             raise StopAsyncIteration
 
         if self._current_page is None or self._current_index >= len(
@@ -140,30 +252,48 @@ class AsyncStreamingPaginator(AsyncIterator[T]):
         return result
 
     async def _fetch_next_page(self) -> None:
-        if self._cursor is None:
-            self._exhausted = True
-            return
-
-        if self._cursor == "":
-            self._exhausted = True
-            return
+        if self._pages is None:
+            self._pages = async_prefetch_iter(
+                self._iter_pages(), self._prefetch
+            )
 
-        params = {
-            **self._params,
-            "per_page": self._per_page,
-            "cursor": self._cursor,
-        }
+        if self._current_page is not None:
+            # The previous page has been fully consumed
+            self._save_checkpoint()
 
         try:
-            self._current_page = await self._fetch_func(params)
-        except Exception as e:
-            logger.exception(
-                "streaming_fetch_error", error=str(e), cursor=self._cursor
-            )
+            page = await anext(self._pages)
+        except StopAsyncIteration:
+            self._current_page = None
+            self._exhausted = True
+            self._save_checkpoint(done=True)
+            return
+        except Exception:
             self._exhausted = True
             raise
+        self._current_page = page
         self._current_index = 0
-        self._cursor = self._current_page.meta.next_cursor
-
-        if self._cursor == "":
-            self._cursor = None
+        self._cursor = page.meta.next_cursor or None
+
+    async def _iter_pages(self) -> AsyncIterator[ListResult[T]]:
+        cursor = self._cursor
+        fetched = self._total_yielded
+        while cursor:
+            if self._max_results is not None and fetched >= self._max_results:
+                return
+
+            params = {
+                **self._params,
+                "per_page": self._per_page,
+                "cursor": cursor,
+            }
+            try:
+                page = await self._fetch_func(params)
+            except Exception as e:
+                logger.exception(
+                    "streaming_fetch_error", error=str(e), cursor=cursor
+                )
+                raise
+            fetched += len(page.results)
+            yield page
+            cursor = page.meta.next_cursor
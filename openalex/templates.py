@@ -2,34 +2,45 @@
 
 from __future__ import annotations
 
-import hashlib
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from .metrics import MetricsReport
     from .query import AsyncQuery, Query
 
 from pydantic import BaseModel, ValidationError
 from structlog import get_logger
 
+from .cache.base import CacheEntry, FetchResult, validators_from_headers
 from .cache.manager import get_cache_manager
+from .cache.warmup import WarmupReport
 from .constants import (
     AUTOCOMPLETE_PATH,
+    DEFAULT_PER_PAGE,
     HTTP_METHOD_GET,
+    HTTP_NOT_MODIFIED,
+    MAX_CONFIRMED_MISSES,
+    MAX_OR_FILTER_VALUES,
     PARAM_Q,
     RANDOM_PATH,
 )
-from .exceptions import raise_for_status
+from .exceptions import NotFoundError, raise_for_status
 from .models import (
     AutocompleteResult,
     BaseFilter,
     ListResult,
     Meta,
 )
+from .utils.batch import AsyncMicroBatcher, chunk_list
+from .utils.fingerprint import request_fingerprint
 from .utils.params import normalize_params
 from .utils.validation import validate_entity_id
 
 if TYPE_CHECKING:
+    import httpx
+
     from .config import OpenAlexConfig
 
 T = TypeVar("T", bound=BaseModel)
@@ -38,6 +49,11 @@ F = TypeVar("F", bound=BaseFilter)
 logger = get_logger(__name__)
 
 
+def _list_ttl_operation(norm_params: dict[str, Any]) -> str:
+    """Return the TTL policy operation of a list request."""
+    return "group_by" if "group-by" in norm_params else "list"
+
+
 class EntityLogicBase(Generic[T, F]):
     """Shared business logic for entity operations (not abstract)."""
 
@@ -137,6 +153,17 @@ class EntityLogicBase(Generic[T, F]):
                 group_by=data.get("group_by"),
             )
 
+    @staticmethod
+    def _validated_result(response: httpx.Response) -> FetchResult:
+        """Wrap a response with its ``ETag``/``Last-Modified`` validators."""
+        validators = validators_from_headers(response.headers)
+        if response.status_code == HTTP_NOT_MODIFIED:
+            return FetchResult(validators=validators, not_modified=True)
+        raise_for_status(response)
+        return FetchResult(
+            response.json(), validators or None, size=len(response.content)
+        )
+
     def _normalize_and_validate_id(self, entity_id: str) -> str:
         """Validate and normalize entity ID."""
         return validate_entity_id(entity_id, self.endpoint.rstrip("s"))
@@ -147,6 +174,211 @@ class EntityLogicBase(Generic[T, F]):
         """Normalize parameters for API request."""
         return normalize_params(params or {})
 
+    def _validate_ids(self, ids: Iterable[str]) -> list[str]:
+        """Validate IDs for a batch lookup, skipping invalid ones."""
+        validated_ids: list[str] = []
+        for entity_id in ids:
+            try:
+                valid_id = self._normalize_and_validate_id(entity_id)
+                validated_ids.append(valid_id)
+            except ValueError as e:
+                # Try to use the entities logger for consistency with tests
+                try:
+                    from .entities import logger as entities_logger
+
+                    entities_logger.warning(
+                        "Skipping invalid ID %s: %s", entity_id, e
+                    )
+                except ImportError:
+                    logger.warning("Skipping invalid ID %s: %s", entity_id, e)
+        return validated_ids
+
+    def _log_fetch_failure(self, values: list[str]) -> None:
+        """Log a failed batch fetch for ``values``."""
+        label = ", ".join(values)
+        try:
+            from .entities import logger as entities_logger
+
+            entities_logger.exception("Failed to fetch %s", label)
+        except (ImportError, TypeError):
+            logger.exception("Failed to fetch %s", label)
+
+    def _batch_id_value(self, valid_id: str) -> str:
+        """Return the ``openalex_id`` filter value for a validated ID."""
+        if self.endpoint == "keywords":
+            return f"keywords/{valid_id}"
+        return valid_id
+
+    @staticmethod
+    def _result_id_key(item: dict[str, Any]) -> str | None:
+        """Return the short form of a result's ``id`` (``W123``, slug, ...)."""
+        item_id = item.get("id")
+        if not item_id:
+            return None
+        return str(item_id).rstrip("/").rsplit("/", 1)[-1]
+
+    def _batch_params(
+        self, filter_key: str, values: list[str]
+    ) -> dict[str, Any]:
+        """Build list parameters for an OR-filter lookup of ``values``."""
+        return self._prepare_params(
+            {"filter": {filter_key: values}, "per_page": DEFAULT_PER_PAGE}
+        )
+
+    @staticmethod
+    def _index_results(
+        data: dict[str, Any],
+        key_func: Callable[[dict[str, Any]], Iterable[str | None]],
+    ) -> dict[str, dict[str, Any]]:
+        """Index raw list results under every key ``key_func`` yields."""
+        indexed: dict[str, dict[str, Any]] = {}
+        for item in data.get("results", []):
+            for key in key_func(item):
+                if key is not None:
+                    indexed[key] = item
+        return indexed
+
+    def _cache_list_results(
+        self, params: dict[str, Any], data: dict[str, Any]
+    ) -> None:
+        """Write list results into the per-entity cache, if configured."""
+        entries = self._list_entries_to_cache(params, data)
+        if entries:
+            get_cache_manager(self._config).set_many(self.endpoint, entries)
+
+    def _list_entries_to_cache(
+        self, params: dict[str, Any], data: dict[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        """Return the list results to cache as entities, keyed by ID.
+
+        Results trimmed by ``select`` are not complete entities and are
+        skipped.
+        """
+        if not self._config.cache_list_results or params.get("select"):
+            return {}
+        return self._index_results(data, lambda i: (self._result_id_key(i),))
+
+    def _cache_misses(
+        self,
+        values: Iterable[str],
+        found: dict[str, Any],
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Negatively cache ``values`` a successful lookup did not return."""
+        missing = [value for value in values if value not in found]
+        if missing:
+            get_cache_manager(self._config).set_missing(
+                self.endpoint, missing, params
+            )
+
+    async def _acache_misses(
+        self,
+        values: Iterable[str],
+        found: dict[str, Any],
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Async :meth:`_cache_misses`."""
+        missing = [value for value in values if value not in found]
+        if missing:
+            await get_cache_manager(self._config).aset_missing(
+                self.endpoint, missing, params
+            )
+
+    async def _acache_list_results(
+        self, params: dict[str, Any], data: dict[str, Any]
+    ) -> None:
+        """Async :meth:`_cache_list_results`."""
+        entries = self._list_entries_to_cache(params, data)
+        if entries:
+            await get_cache_manager(self._config).aset_many(
+                self.endpoint, entries
+            )
+
+    def _prepare_identifiers(
+        self,
+        identifiers: Iterable[str],
+        normalize: Callable[[str], str | None],
+    ) -> dict[str, str | None]:
+        """Map each input identifier to its normalized form (or ``None``)."""
+        normalized: dict[str, str | None] = {}
+        for identifier in identifiers:
+            if identifier in normalized:
+                continue
+            value = normalize(identifier)
+            if value is None or "|" in value or "," in value:
+                logger.warning("Skipping invalid identifier %s", identifier)
+                value = None
+            normalized[identifier] = value
+        return normalized
+
+    def _assemble_resolved(
+        self, normalized: dict[str, str | None], found: dict[str, Any]
+    ) -> dict[str, T | None]:
+        """Parse resolved payloads keyed by input identifier."""
+        parsed: dict[str, T] = {}
+        resolved: dict[str, T | None] = {}
+        for identifier, value in normalized.items():
+            data = found.get(value) if value is not None else None
+            if value is None or data is None:
+                resolved[identifier] = None
+                continue
+            if value not in parsed:
+                parsed[value] = (
+                    data
+                    if isinstance(data, self.model_class)
+                    else self._parse_response(data)
+                )
+            resolved[identifier] = parsed[value]
+        return resolved
+
+    def _begin_warmup(
+        self, ids: Iterable[str], report: WarmupReport | None
+    ) -> tuple[WarmupReport, list[str]]:
+        """Validate ``ids`` for a warm-up and count them into ``report``."""
+        ids = list(ids)
+        validated_ids = self._validate_ids(ids)
+        unique_ids = list(dict.fromkeys(validated_ids))
+        report = report if report is not None else WarmupReport()
+        report.requested += len(unique_ids)
+        report.invalid += len(ids) - len(validated_ids)
+        return report, unique_ids
+
+    @staticmethod
+    def _record_warm_batch(
+        report: WarmupReport,
+        batch: list[str],
+        found: dict[str, Any] | None,
+    ) -> None:
+        """Count one warm-up request; ``found`` is ``None`` if it failed."""
+        report.requests += 1
+        if found is None:
+            report.failed += len(batch)
+            return
+        fetched = sum(1 for value in batch if value in found)
+        report.fetched += fetched
+        report.missing += len(batch) - fetched
+
+    def _assemble_many(
+        self, validated_ids: list[str], found: dict[str, Any]
+    ) -> list[T]:
+        """Parse ``found`` payloads in input order and report misses."""
+        results: list[T] = []
+        missing: list[str] = []
+        for valid_id in validated_ids:
+            data = found.get(valid_id)
+            if data is None:
+                missing.append(valid_id)
+            elif isinstance(data, self.model_class):
+                results.append(data)
+            else:
+                results.append(self._parse_response(data))
+
+        if missing:
+            logger.warning(
+                "Entities not found: %s", ", ".join(dict.fromkeys(missing))
+            )
+        return results
+
     def clear_cache(self) -> None:
         """Clear the cache for this entity."""
         cache_manager = get_cache_manager(self._config)
@@ -193,86 +425,266 @@ class SyncEntityTemplate(EntityLogicBase[T, F]):
     def _execute_request(
         self, url: str, params: dict[str, Any], operation: str | None = None
     ) -> dict[str, Any]:
-        """Execute a single HTTP request."""
+        """Execute a single HTTP request and return its decoded body."""
+        return cast(
+            "dict[str, Any]",
+            self._connection.get_json(url, params, operation=operation),
+        )
+
+    def _execute_cached_request(
+        self, url: str, params: dict[str, Any], operation: str | None = None
+    ) -> FetchResult:
+        """Execute a request whose payload is about to be cached.
+
+        Under a cache byte budget the body length comes along, so memory
+        caches size the entry without encoding the payload again.
+        """
+        if self._config.cache_max_bytes is None:
+            return FetchResult(
+                self._execute_request(url, params, operation=operation)
+            )
+        data, size = self._connection.get_json_sized(
+            url, params, operation=operation
+        )
+        return FetchResult(data, size=size)
+
+    def _execute_validated_request(
+        self,
+        url: str,
+        params: dict[str, Any],
+        headers: dict[str, str] | None = None,
+        operation: str | None = None,
+    ) -> FetchResult:
+        """Execute a request, keeping the response's cache validators.
+
+        ``headers`` make it a conditional request; a ``304`` answer comes
+        back as a not-modified result.
+        """
+        kwargs: dict[str, Any] = {"headers": headers} if headers else {}
         response = self._connection.request(
             HTTP_METHOD_GET,
             url,
             params=params,
             operation=operation,
+            **kwargs,
         )
-        raise_for_status(response)
-        return cast("dict[str, Any]", response.json())
+        return self._validated_result(response)
 
     def _get_single_entity(
         self, entity_id: str, params: dict[str, Any] | None = None
     ) -> T:
-        """Get a single entity by ID."""
+        """Get a single entity by ID.
+
+        With ``cache_revalidate_ttl`` set, expired entries are refreshed
+        with a conditional request on their ``ETag``/``Last-Modified``.
+        """
         valid_id = self._normalize_and_validate_id(entity_id)
         norm_params = self._prepare_params(params)
         url = self._build_url(valid_id)
 
         cache_manager = get_cache_manager(self._config)
 
-        def fetch() -> dict[str, Any]:
-            return self._execute_request(url, norm_params, operation="get")
+        def revalidate(headers: dict[str, str]) -> FetchResult:
+            return self._execute_validated_request(
+                url, norm_params, headers, operation="get"
+            )
+
+        def fetch() -> FetchResult:
+            if self._config.cache_revalidate_ttl:
+                return revalidate({})
+            return self._execute_cached_request(
+                url, norm_params, operation="get"
+            )
 
         data = cache_manager.get_or_fetch(
             endpoint=self.endpoint,
             fetch_func=fetch,
-            entity_id=entity_id,
-            params=params or {},
+            entity_id=valid_id,
+            params=norm_params,
+            revalidate_func=revalidate,
         )
         if isinstance(data, self.model_class):
             return data
         return self._parse_response(data)
 
-    def get_many(self, ids: list[str], max_concurrent: int = 10) -> list[T]:
-        """Fetch multiple entities efficiently using concurrent requests."""
-        import concurrent.futures
+    def _fetch_filter_batch(
+        self,
+        filter_key: str,
+        values: list[str],
+        key_func: Callable[[dict[str, Any]], Iterable[str | None]],
+    ) -> dict[str, Any]:
+        """Fetch one OR-filter page and index it with ``key_func``.
 
-        # Validate all IDs first
-        validated_ids: list[str] = []
-        for entity_id in ids:
+        Every returned entity is also written to the per-entity cache.
+        """
+        params = self._batch_params(filter_key, values)
+        data = self._execute_request(
+            self._build_url(), params, operation="list"
+        )
+        get_cache_manager(self._config).set_many(
+            self.endpoint,
+            self._index_results(data, lambda i: (self._result_id_key(i),)),
+        )
+        return self._index_results(data, key_func)
+
+    def _fetch_id_batch(self, valid_ids: list[str]) -> dict[str, Any]:
+        """Fetch up to ``MAX_OR_FILTER_VALUES`` entities in one request."""
+        found = self._fetch_filter_batch(
+            "openalex_id",
+            [self._batch_id_value(v) for v in valid_ids],
+            lambda item: (self._result_id_key(item),),
+        )
+        self._confirm_missing(valid_ids, found)
+        return found
+
+    def _confirm_missing(
+        self, valid_ids: list[str], found: dict[str, Any]
+    ) -> None:
+        """Look up the IDs an ``openalex_id`` batch did not return.
+
+        Merged IDs come back under their canonical ID, so a batch miss is
+        not proof of absence. The first ``MAX_CONFIRMED_MISSES`` misses are
+        looked up one by one, a ``404`` being cached as not found by the
+        cache manager; the rest are cached as not found for the short
+        ``cache_negative_ttl`` without a request, so one batch costs at most
+        that many extra requests.
+        """
+        unmatched = [v for v in valid_ids if v not in found]
+        for valid_id in unmatched[:MAX_CONFIRMED_MISSES]:
             try:
-                valid_id = self._normalize_and_validate_id(entity_id)
-                validated_ids.append(valid_id)
-            except ValueError as e:
-                # Try to use the entities logger for consistency with tests
+                found[valid_id] = self._get_single_entity(valid_id)
+            except NotFoundError:
+                continue
+            except Exception as e:
+                logger.warning("Could not look up %s: %s", valid_id, e)
+        self._cache_misses(unmatched[MAX_CONFIRMED_MISSES:], found)
+
+    def _resolve_identifiers(
+        self,
+        identifiers: Iterable[str],
+        filter_key: str,
+        normalize: Callable[[str], str | None],
+        key_func: Callable[[dict[str, Any]], Iterable[str | None]],
+        max_concurrent: int = 10,
+    ) -> dict[str, T | None]:
+        """Resolve external identifiers with batched ``filter_key`` lookups.
+
+        Returns a mapping from each input identifier to its entity, or
+        ``None`` when the identifier is invalid or not found.
+        """
+        import concurrent.futures
+
+        normalized = self._prepare_identifiers(identifiers, normalize)
+        candidates = list(dict.fromkeys(v for v in normalized.values() if v))
+        # Identifiers the API did not know are cached per filter key
+        miss_params = {"filter": filter_key}
+        _, known_missing = get_cache_manager(self._config).lookup_many(
+            self.endpoint, candidates, miss_params
+        )
+        pending = [v for v in candidates if v not in known_missing]
+
+        found: dict[str, Any] = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent
+        ) as executor:
+            future_to_batch = {
+                executor.submit(
+                    self._fetch_filter_batch, filter_key, batch, key_func
+                ): batch
+                for batch in chunk_list(pending, MAX_OR_FILTER_VALUES)
+            }
+
+            for future in concurrent.futures.as_completed(future_to_batch):
+                batch = future_to_batch[future]
                 try:
-                    from .entities import logger as entities_logger
+                    batch_found = future.result()
+                except Exception:
+                    self._log_fetch_failure(batch)
+                else:
+                    found.update(batch_found)
+                    self._cache_misses(batch, batch_found, miss_params)
 
-                    entities_logger.warning(
-                        "Skipping invalid ID %s: %s", entity_id, e
-                    )
-                except ImportError:
-                    logger.warning("Skipping invalid ID %s: %s", entity_id, e)
+        return self._assemble_resolved(normalized, found)
+
+    def get_many(self, ids: list[str], max_concurrent: int = 10) -> list[T]:
+        """Fetch multiple entities using batched ``openalex_id`` filters.
+
+        IDs are packed into OR-filter list requests of up to
+        ``MAX_OR_FILTER_VALUES`` values which run concurrently. Results are
+        returned in input order; IDs the API does not return are logged and
+        omitted.
+        """
+        import concurrent.futures
+
+        validated_ids = self._validate_ids(ids)
+        unique_ids = list(dict.fromkeys(validated_ids))
+
+        cache_manager = get_cache_manager(self._config)
+        found, missing = cache_manager.lookup_many(self.endpoint, unique_ids)
+        pending = [
+            vid for vid in unique_ids if vid not in found and vid not in missing
+        ]
 
-        results: list[T] = []
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=max_concurrent
         ) as executor:
-            future_to_id = {
-                executor.submit(self.get, vid): vid for vid in validated_ids
+            future_to_batch = {
+                executor.submit(self._fetch_id_batch, batch): batch
+                for batch in chunk_list(pending, MAX_OR_FILTER_VALUES)
             }
 
-            for future in concurrent.futures.as_completed(future_to_id):
-                vid = future_to_id[future]
+            for future in concurrent.futures.as_completed(future_to_batch):
                 try:
-                    result = future.result()
-                    # get() returns T | ListResult[T], but with ID it should always be T
-                    if isinstance(result, ListResult):
-                        # This shouldn't happen, but handle gracefully
-                        continue
-                    results.append(result)
+                    found.update(future.result())
                 except Exception:
-                    try:
-                        from .entities import logger as entities_logger
+                    self._log_fetch_failure(future_to_batch[future])
 
-                        entities_logger.exception("Failed to fetch %s", vid)
-                    except (ImportError, TypeError):
-                        logger.exception("Failed to fetch %s", vid)
+        return self._assemble_many(validated_ids, found)
 
-        return results
+    def warm_ids(
+        self,
+        ids: Iterable[str],
+        max_concurrent: int = 10,
+        progress: Callable[[WarmupReport], None] | None = None,
+        report: WarmupReport | None = None,
+    ) -> WarmupReport:
+        """Cache ``ids`` using batched ``openalex_id`` filters.
+
+        IDs that are cached, or cached as not found, are skipped. The rest
+        are fetched ``MAX_OR_FILTER_VALUES`` per request on up to
+        ``max_concurrent`` threads. ``progress`` is called with the report
+        after every request; pass ``report`` to accumulate several calls.
+        """
+        import concurrent.futures
+
+        report, unique_ids = self._begin_warmup(ids, report)
+        found, missing = get_cache_manager(self._config).lookup_many(
+            self.endpoint, unique_ids
+        )
+        report.fresh += len(found) + len(missing)
+        pending = [
+            vid for vid in unique_ids if vid not in found and vid not in missing
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent
+        ) as executor:
+            future_to_batch = {
+                executor.submit(self._fetch_id_batch, batch): batch
+                for batch in chunk_list(pending, MAX_OR_FILTER_VALUES)
+            }
+            for future in concurrent.futures.as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                try:
+                    batch_found: dict[str, Any] | None = future.result()
+                except Exception:
+                    self._log_fetch_failure(batch)
+                    batch_found = None
+                self._record_warm_batch(report, batch, batch_found)
+                if progress is not None:
+                    progress(report)
+
+        return report
 
     def get(self, id: str | None = None, **params: Any) -> T | ListResult[T]:
         """Retrieve a single entity or list results."""
@@ -282,7 +694,17 @@ class SyncEntityTemplate(EntityLogicBase[T, F]):
 
     def list(self, **params: Any) -> ListResult[T]:
         """Get a list of entities with parameters."""
-        norm_params = self._prepare_params(params)
+        return self._list_prepared(self._prepare_params(params))
+
+    def list_query(self, query: Query[T, F]) -> ListResult[T]:
+        """List ``query``'s results, reusing its normalized params and
+        fingerprint."""
+        return self._list_prepared(query.normalized_params, query.fingerprint)
+
+    def _list_prepared(
+        self, norm_params: dict[str, Any], fingerprint: str | None = None
+    ) -> ListResult[T]:
+        """List with normalized parameters and their request fingerprint."""
         url = self._build_url()
 
         # Determine operation based on parameters
@@ -302,34 +724,39 @@ class SyncEntityTemplate(EntityLogicBase[T, F]):
         if cache_manager.enabled:
             from .cache.base import CacheKeyBuilder
 
-            # Use a special entity_id for list operations that includes parameters
-            params_str = str(sorted(norm_params.items()))
-            list_key = (
-                f"list_{hashlib.md5(params_str.encode()).hexdigest()[:8]}"
-            )
-            cache_key = CacheKeyBuilder.build_key(
-                self.endpoint, list_key, norm_params
+            fingerprint = fingerprint or request_fingerprint(
+                self.endpoint, norm_params
             )
+            cache_key = CacheKeyBuilder.list_key(self.endpoint, fingerprint)
 
             # Try cache first
             cache = cache_manager.cache
             cached_data = cache.get(cache_key) if cache is not None else None
             if cached_data is not None:
                 logger.debug(
-                    "cache_hit", endpoint=self.endpoint, list_key=list_key
+                    "cache_hit", endpoint=self.endpoint, fingerprint=fingerprint
                 )
                 return self._parse_list_response(cached_data)
 
             # Fetch and cache
-            response_data = self._execute_request(
+            fetched = self._execute_cached_request(
                 url, norm_params, operation=operation
             )
-            ttl = cache_manager.get_ttl_for_endpoint(self.endpoint)
-            cache = cache_manager.cache
-            if cache is not None:
+            response_data = fetched.data
+            self._cache_list_results(norm_params, response_data)
+            ttl = cache_manager.get_ttl_for_endpoint(
+                self.endpoint, _list_ttl_operation(norm_params)
+            )
+            cache = cache_manager.cache if ttl > 0 else None
+            if cache is not None and fetched.size is not None:
+                cache.set_entry(
+                    cache_key,
+                    CacheEntry.create(response_data, ttl, fetched.size),
+                )
+            elif cache is not None:
                 cache.set(cache_key, response_data, ttl)
             logger.debug(
-                "cache_miss", endpoint=self.endpoint, list_key=list_key
+                "cache_miss", endpoint=self.endpoint, fingerprint=fingerprint
             )
 
             return self._parse_list_response(response_data)
@@ -355,7 +782,9 @@ class SyncEntityTemplate(EntityLogicBase[T, F]):
         ):
             operation = "search"
 
-        return self._execute_request(url, norm_params, operation=operation)
+        data = self._execute_request(url, norm_params, operation=operation)
+        self._cache_list_results(norm_params, data)
+        return data
 
     def query(self) -> Query[T, F]:
         """Return a query builder for this entity."""
@@ -430,7 +859,11 @@ class SyncEntityTemplate(EntityLogicBase[T, F]):
         return self.query().sample(n, seed)
 
     def paginate(
-        self, per_page: int = 25, max_results: int | None = None, **kwargs: Any
+        self,
+        per_page: int = 25,
+        max_results: int | None = None,
+        prefetch: int = 0,
+        **kwargs: Any,
     ):
         """Get paginator for results."""
         from .utils.pagination import Paginator
@@ -446,6 +879,7 @@ class SyncEntityTemplate(EntityLogicBase[T, F]):
             params=params,
             per_page=per_page,
             max_results=max_results,
+            prefetch=prefetch,
         )
 
     def all(
@@ -490,8 +924,17 @@ class SyncEntityTemplate(EntityLogicBase[T, F]):
         base_url = str(self._config.base_url).rstrip("/")
         url = f"{base_url}/{AUTOCOMPLETE_PATH}/{self.endpoint}"
 
-        response_data = self._execute_request(
-            url, params, operation="autocomplete"
+        cache_manager = get_cache_manager(self._config)
+        response_data = cache_manager.get_or_fetch(
+            self.endpoint,
+            lambda: self._execute_request(
+                url, params, operation="autocomplete"
+            ),
+            AUTOCOMPLETE_PATH,
+            params,
+            ttl=cache_manager.get_ttl_for_endpoint(
+                self.endpoint, "autocomplete"
+            ),
         )
 
         # Parse autocomplete results
@@ -584,6 +1027,7 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
     ) -> None:
         super().__init__(email, api_key, config)
         self._connection = None
+        self._get_batcher: AsyncMicroBatcher[str, Any] | None = None
 
     async def _get_connection(self):
         """Get or create async connection."""
@@ -598,111 +1042,304 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
     ) -> dict[str, Any]:
         """Execute a single HTTP request asynchronously."""
         connection = await self._get_connection()
+        return cast(
+            "dict[str, Any]",
+            await connection.get_json(url, params, operation=operation),
+        )
+
+    async def _execute_cached_request(
+        self, url: str, params: dict[str, Any], operation: str | None = None
+    ) -> FetchResult:
+        """Execute a request whose payload is about to be cached."""
+        if self._config.cache_max_bytes is None:
+            return FetchResult(
+                await self._execute_request(url, params, operation=operation)
+            )
+        connection = await self._get_connection()
+        data, size = await connection.get_json_sized(
+            url, params, operation=operation
+        )
+        return FetchResult(data, size=size)
+
+    async def _execute_validated_request(
+        self,
+        url: str,
+        params: dict[str, Any],
+        headers: dict[str, str] | None = None,
+        operation: str | None = None,
+    ) -> FetchResult:
+        """Execute a request, keeping the response's cache validators."""
+        connection = await self._get_connection()
+        kwargs: dict[str, Any] = {"headers": headers} if headers else {}
         response = await connection.request(
             HTTP_METHOD_GET,
             url,
             params=params,
             operation=operation,
+            **kwargs,
         )
-        raise_for_status(response)
-        return cast("dict[str, Any]", response.json())
+        return self._validated_result(response)
 
     async def _get_single_entity(
         self, entity_id: str, params: dict[str, Any] | None = None
     ) -> T:
         """Get a single entity by ID asynchronously."""
+        if self._config.get_batching_enabled and not params:
+            return await self._get_batched_entity(entity_id)
+        return await self._fetch_single_entity(entity_id, params)
+
+    async def _fetch_single_entity(
+        self, entity_id: str, params: dict[str, Any] | None = None
+    ) -> T:
+        """Get a single entity with its own request, never micro-batched."""
         valid_id = self._normalize_and_validate_id(entity_id)
         norm_params = self._prepare_params(params)
         url = self._build_url(valid_id)
 
-        # Simple async cache implementation
         cache_manager = get_cache_manager(self._config)
 
-        if cache_manager.enabled:
-            from .cache.base import CacheKeyBuilder
+        async def revalidate(headers: dict[str, str]) -> FetchResult:
+            return await self._execute_validated_request(
+                url, norm_params, headers, operation="get"
+            )
 
-            cache_key = CacheKeyBuilder.build_key(
-                self.endpoint, entity_id, params or {}
+        async def fetch() -> FetchResult:
+            if self._config.cache_revalidate_ttl:
+                return await revalidate({})
+            return await self._execute_cached_request(
+                url, norm_params, operation="get"
             )
 
-            # Try cache first
-            cache = cache_manager.cache
-            cached_data = cache.get(cache_key) if cache is not None else None
-            if cached_data is not None:
-                logger.debug(
-                    "cache_hit", endpoint=self.endpoint, entity_id=entity_id
+        data = await cache_manager.aget_or_fetch(
+            endpoint=self.endpoint,
+            fetch_func=fetch,
+            entity_id=valid_id,
+            params=norm_params,
+            revalidate_func=revalidate,
+        )
+        if isinstance(data, self.model_class):
+            return data
+        return self._parse_response(data)
+
+    async def _get_batched_entity(self, entity_id: str) -> T:
+        """Get an entity through the micro-batcher.
+
+        Concurrent calls arriving within ``get_batch_window`` seconds are
+        sent as one ``openalex_id`` OR-filter request.
+        """
+        valid_id = self._normalize_and_validate_id(entity_id)
+        cache_manager = get_cache_manager(self._config)
+        cached, missing = await cache_manager.alookup_many(
+            self.endpoint, [valid_id]
+        )
+        data = cached.get(valid_id)
+
+        if data is None and not missing:
+            if self._get_batcher is None:
+                self._get_batcher = AsyncMicroBatcher(
+                    self._fetch_id_batch,
+                    window=self._config.get_batch_window,
+                    max_batch_size=self._config.get_batch_max_size,
                 )
-                if isinstance(cached_data, self.model_class):
-                    return cached_data
-                return self._parse_response(cached_data)
+            data = await self._get_batcher.load(valid_id)
 
-            # Fetch and cache
-            response_data = await self._execute_request(
-                url, norm_params, operation="get"
-            )
-            ttl = cache_manager.get_ttl_for_endpoint(self.endpoint)
-            cache = cache_manager.cache
-            if cache is not None:
-                cache.set(cache_key, response_data, ttl)
-            logger.debug(
-                "cache_miss", endpoint=self.endpoint, entity_id=entity_id
+        if data is None:
+            msg = f"{self.endpoint} entity {valid_id} not found"
+            raise NotFoundError(
+                msg, resource_id=valid_id, resource_type=self.endpoint
             )
+        if isinstance(data, self.model_class):
+            return data
+        return self._parse_response(data)
 
-            return self._parse_response(response_data)
-        # No cache, fetch directly
-        response_data = await self._execute_request(
-            url, norm_params, operation="get"
+    async def _fetch_filter_batch(
+        self,
+        filter_key: str,
+        values: list[str],
+        key_func: Callable[[dict[str, Any]], Iterable[str | None]],
+    ) -> dict[str, Any]:
+        """Fetch one OR-filter page and index it with ``key_func``.
+
+        Every returned entity is also written to the per-entity cache.
+        """
+        params = self._batch_params(filter_key, values)
+        data = await self._execute_request(
+            self._build_url(), params, operation="list"
         )
-        return self._parse_response(response_data)
+        await get_cache_manager(self._config).aset_many(
+            self.endpoint,
+            self._index_results(data, lambda i: (self._result_id_key(i),)),
+        )
+        return self._index_results(data, key_func)
+
+    async def _fetch_id_batch(self, valid_ids: list[str]) -> dict[str, Any]:
+        """Fetch up to ``MAX_OR_FILTER_VALUES`` entities in one request."""
+        found = await self._fetch_filter_batch(
+            "openalex_id",
+            [self._batch_id_value(v) for v in valid_ids],
+            lambda item: (self._result_id_key(item),),
+        )
+        await self._aconfirm_missing(valid_ids, found)
+        return found
+
+    async def _aconfirm_missing(
+        self, valid_ids: list[str], found: dict[str, Any]
+    ) -> None:
+        """Async :meth:`SyncEntityTemplate._confirm_missing`.
+
+        The lookups bypass the micro-batcher and run concurrently.
+        """
+        import asyncio
+
+        async def confirm(valid_id: str) -> None:
+            try:
+                found[valid_id] = await self._fetch_single_entity(valid_id)
+            except NotFoundError:
+                return
+            except Exception as e:
+                logger.warning("Could not look up %s: %s", valid_id, e)
+
+        unmatched = [v for v in valid_ids if v not in found]
+        await asyncio.gather(
+            *[confirm(v) for v in unmatched[:MAX_CONFIRMED_MISSES]]
+        )
+        await self._acache_misses(unmatched[MAX_CONFIRMED_MISSES:], found)
+
+    async def _resolve_identifiers(
+        self,
+        identifiers: Iterable[str],
+        filter_key: str,
+        normalize: Callable[[str], str | None],
+        key_func: Callable[[dict[str, Any]], Iterable[str | None]],
+        max_concurrent: int = 10,
+    ) -> dict[str, T | None]:
+        """Resolve external identifiers with batched ``filter_key`` lookups.
+
+        Returns a mapping from each input identifier to its entity, or
+        ``None`` when the identifier is invalid or not found.
+        """
+        import asyncio
+
+        normalized = self._prepare_identifiers(identifiers, normalize)
+        candidates = list(dict.fromkeys(v for v in normalized.values() if v))
+        # Identifiers the API did not know are cached per filter key
+        miss_params = {"filter": filter_key}
+        _, known_missing = await get_cache_manager(self._config).alookup_many(
+            self.endpoint, candidates, miss_params
+        )
+        pending = [v for v in candidates if v not in known_missing]
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def fetch_with_semaphore(batch: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    batch_found = await self._fetch_filter_batch(
+                        filter_key, batch, key_func
+                    )
+                except Exception:
+                    self._log_fetch_failure(batch)
+                    return {}
+                await self._acache_misses(batch, batch_found, miss_params)
+                return batch_found
+
+        found: dict[str, Any] = {}
+        for batch_found in await asyncio.gather(
+            *[
+                fetch_with_semaphore(batch)
+                for batch in chunk_list(pending, MAX_OR_FILTER_VALUES)
+            ]
+        ):
+            found.update(batch_found)
+
+        return self._assemble_resolved(normalized, found)
 
     async def get_many(
         self, ids: list[str], max_concurrent: int = 10
     ) -> list[T]:
-        """Fetch multiple entities efficiently using concurrent requests."""
+        """Fetch multiple entities using batched ``openalex_id`` filters.
+
+        IDs are packed into OR-filter list requests of up to
+        ``MAX_OR_FILTER_VALUES`` values which run concurrently. Results are
+        returned in input order; IDs the API does not return are logged and
+        omitted.
+        """
         import asyncio
 
-        validated_ids: list[str] = []
-        for entity_id in ids:
-            try:
-                valid_id = self._normalize_and_validate_id(entity_id)
-                validated_ids.append(valid_id)
-            except ValueError as e:
-                # Try to use the entities logger for consistency with tests
-                try:
-                    from .entities import logger as entities_logger
+        validated_ids = self._validate_ids(ids)
+        unique_ids = list(dict.fromkeys(validated_ids))
 
-                    entities_logger.warning(
-                        "Skipping invalid ID %s: %s", entity_id, e
-                    )
-                except ImportError:
-                    logger.warning("Skipping invalid ID %s: %s", entity_id, e)
+        cache_manager = get_cache_manager(self._config)
+        found, missing = await cache_manager.alookup_many(
+            self.endpoint, unique_ids
+        )
+        pending = [
+            vid for vid in unique_ids if vid not in found and vid not in missing
+        ]
 
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def fetch_with_semaphore(entity_id: str) -> T | None:
+        async def fetch_with_semaphore(batch: list[str]) -> dict[str, Any]:
             async with semaphore:
                 try:
-                    result = await self.get(entity_id)
-                    # get() returns T | ListResult[T], but with ID it should always be T
-                    if isinstance(result, ListResult):
-                        # This shouldn't happen, but handle gracefully
-                        return None
-                    return result  # noqa: TRY300
+                    return await self._fetch_id_batch(batch)
                 except Exception:
-                    try:
-                        from .entities import logger as entities_logger
+                    self._log_fetch_failure(batch)
+                    return {}
+
+        batches = await asyncio.gather(
+            *[
+                fetch_with_semaphore(batch)
+                for batch in chunk_list(pending, MAX_OR_FILTER_VALUES)
+            ]
+        )
+        for batch_found in batches:
+            found.update(batch_found)
+
+        return self._assemble_many(validated_ids, found)
+
+    async def warm_ids(
+        self,
+        ids: Iterable[str],
+        max_concurrent: int = 10,
+        progress: Callable[[WarmupReport], None] | None = None,
+        report: WarmupReport | None = None,
+    ) -> WarmupReport:
+        """Async :meth:`SyncEntityTemplate.warm_ids`, with at most
+        ``max_concurrent`` requests in flight."""
+        import asyncio
+
+        report, unique_ids = self._begin_warmup(ids, report)
+        found, missing = await get_cache_manager(self._config).alookup_many(
+            self.endpoint, unique_ids
+        )
+        report.fresh += len(found) + len(missing)
+        pending = [
+            vid for vid in unique_ids if vid not in found and vid not in missing
+        ]
 
-                        entities_logger.exception(
-                            "Failed to fetch %s", entity_id
-                        )
-                    except (ImportError, TypeError):
-                        logger.exception("Failed to fetch %s", entity_id)
-                    return None
+        semaphore = asyncio.Semaphore(max_concurrent)
 
-        results = await asyncio.gather(
-            *[fetch_with_semaphore(vid) for vid in validated_ids]
+        async def warm_batch(batch: list[str]) -> None:
+            async with semaphore:
+                try:
+                    batch_found: (
+                        dict[str, Any] | None
+                    ) = await self._fetch_id_batch(batch)
+                except Exception:
+                    self._log_fetch_failure(batch)
+                    batch_found = None
+            self._record_warm_batch(report, batch, batch_found)
+            if progress is not None:
+                progress(report)
+
+        await asyncio.gather(
+            *[
+                warm_batch(batch)
+                for batch in chunk_list(pending, MAX_OR_FILTER_VALUES)
+            ]
         )
-        return [r for r in results if r is not None]
+        return report
 
     async def get(
         self, id: str | None = None, **params: Any
@@ -720,7 +1357,19 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
 
     async def list(self, **params: Any) -> ListResult[T]:
         """Get a list of entities with parameters."""
-        norm_params = self._prepare_params(params)
+        return await self._list_prepared(self._prepare_params(params))
+
+    async def list_query(self, query: AsyncQuery[T, F]) -> ListResult[T]:
+        """List ``query``'s results, reusing its normalized params and
+        fingerprint."""
+        return await self._list_prepared(
+            query.normalized_params, query.fingerprint
+        )
+
+    async def _list_prepared(
+        self, norm_params: dict[str, Any], fingerprint: str | None = None
+    ) -> ListResult[T]:
+        """List with normalized parameters and their request fingerprint."""
         url = self._build_url()
 
         # Determine operation based on parameters
@@ -740,34 +1389,42 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
         if cache_manager.enabled:
             from .cache.base import CacheKeyBuilder
 
-            # Use a special entity_id for list operations that includes parameters
-            params_str = str(sorted(norm_params.items()))
-            list_key = (
-                f"list_{hashlib.md5(params_str.encode()).hexdigest()[:8]}"
-            )
-            cache_key = CacheKeyBuilder.build_key(
-                self.endpoint, list_key, norm_params
+            fingerprint = fingerprint or request_fingerprint(
+                self.endpoint, norm_params
             )
+            cache_key = CacheKeyBuilder.list_key(self.endpoint, fingerprint)
 
             # Try cache first
-            cache = cache_manager.cache
-            cached_data = cache.get(cache_key) if cache is not None else None
+            cache = cache_manager.acache
+            cached_data = (
+                await cache.aget(cache_key) if cache is not None else None
+            )
             if cached_data is not None:
                 logger.debug(
-                    "cache_hit", endpoint=self.endpoint, list_key=list_key
+                    "cache_hit", endpoint=self.endpoint, fingerprint=fingerprint
                 )
                 return self._parse_list_response(cached_data)
 
             # Fetch and cache
-            response_data = await self._execute_request(
+            fetched = await self._execute_cached_request(
                 url, norm_params, operation=operation
             )
-            ttl = cache_manager.get_ttl_for_endpoint(self.endpoint)
-            cache = cache_manager.cache
-            if cache is not None:
-                cache.set(cache_key, response_data, ttl)
+            response_data = fetched.data
+            await self._acache_list_results(norm_params, response_data)
+            ttl = cache_manager.get_ttl_for_endpoint(
+                self.endpoint, _list_ttl_operation(norm_params)
+            )
+            if ttl <= 0:
+                cache = None
+            if cache is not None and fetched.size is not None:
+                await cache.aset_entry(
+                    cache_key,
+                    CacheEntry.create(response_data, ttl, fetched.size),
+                )
+            elif cache is not None:
+                await cache.aset(cache_key, response_data, ttl)
             logger.debug(
-                "cache_miss", endpoint=self.endpoint, list_key=list_key
+                "cache_miss", endpoint=self.endpoint, fingerprint=fingerprint
             )
 
             return self._parse_list_response(response_data)
@@ -793,9 +1450,11 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
         ):
             operation = "search"
 
-        return await self._execute_request(
+        data = await self._execute_request(
             url, norm_params, operation=operation
         )
+        await self._acache_list_results(norm_params, data)
+        return data
 
     def query(self) -> AsyncQuery[T, F]:
         """Return an async query builder for this entity."""
@@ -833,8 +1492,17 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
         base_url = str(self._config.base_url).rstrip("/")
         url = f"{base_url}/{AUTOCOMPLETE_PATH}/{self.endpoint}"
 
-        response_data = await self._execute_request(
-            url, params, operation="autocomplete"
+        cache_manager = get_cache_manager(self._config)
+        response_data = await cache_manager.aget_or_fetch(
+            self.endpoint,
+            lambda: self._execute_request(
+                url, params, operation="autocomplete"
+            ),
+            AUTOCOMPLETE_PATH,
+            params,
+            ttl=cache_manager.get_ttl_for_endpoint(
+                self.endpoint, "autocomplete"
+            ),
         )
 
         # Parse autocomplete results
@@ -930,7 +1598,11 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
         return self.query().sample(n, seed)
 
     def paginate(
-        self, per_page: int = 25, max_results: int | None = None, **kwargs: Any
+        self,
+        per_page: int = 25,
+        max_results: int | None = None,
+        prefetch: int = 0,
+        **kwargs: Any,
     ):
         """Get async paginator for results."""
         from .utils.pagination import AsyncPaginator
@@ -946,6 +1618,7 @@ class AsyncEntityTemplate(EntityLogicBase[T, F]):
             params=params,
             per_page=per_page,
             max_results=max_results,
+            prefetch=prefetch,
         )
 
     async def all(
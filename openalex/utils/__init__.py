@@ -7,7 +7,7 @@ from ..constants import (
     ORCID_URL_PREFIX,
     PMID_PREFIX,
 )
-from .batch import chunk_list
+from .batch import AsyncMicroBatcher, chunk_list
 from .common import (
     empty_list_result,
     ensure_prefix,
@@ -15,13 +15,24 @@ from .common import (
     id_to_url,
     ids_equal,
     is_openalex_id,
+    normalize_doi,
     normalize_entity_id,
     normalize_id_batch,
+    normalize_issn,
+    normalize_orcid,
+    normalize_pmid,
+    normalize_ror,
     parse_entity_ids,
     strip_id_prefix,
     validate_id_format,
 )
-from .pagination import AsyncPaginator, Paginator
+from .fingerprint import request_fingerprint
+from .pagination import (
+    AsyncPaginator,
+    Paginator,
+    async_prefetch_iter,
+    prefetch_iter,
+)
 from .params import normalize_params
 from .rate_limit import (
     AsyncRateLimiter,
@@ -62,6 +73,7 @@ __all__ = [
     "OPENALEX_ID_PREFIX",
     "ORCID_URL_PREFIX",
     "PMID_PREFIX",
+    "AsyncMicroBatcher",
     "AsyncPaginator",
     "AsyncRateLimiter",
     "Paginator",
@@ -70,6 +82,7 @@ __all__ = [
     "RetryContext",
     "RetryHandler",
     "SlidingWindowRateLimiter",
+    "async_prefetch_iter",
     "async_rate_limited",
     "async_with_retry",
     "chunk_list",
@@ -91,11 +104,18 @@ __all__ = [
     "is_retryable_error",
     "linear_backoff",
     "normalize_author_name",
+    "normalize_doi",
     "normalize_entity_id",
     "normalize_id_batch",
+    "normalize_issn",
+    "normalize_orcid",
     "normalize_params",
+    "normalize_pmid",
+    "normalize_ror",
     "parse_entity_ids",
+    "prefetch_iter",
     "rate_limited",
+    "request_fingerprint",
     "retry_on_error",
     "retry_with_rate_limit",
     "strip_id_prefix",
@@ -1,14 +1,92 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Awaitable, Callable, Hashable, Iterator
 
-__all__ = ["chunk_list"]
+__all__ = ["AsyncMicroBatcher", "chunk_list"]
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
 
 
 def chunk_list(items: list[Any], chunk_size: int) -> Iterator[list[Any]]:
     """Split list into chunks of specified size."""
     for i in range(0, len(items), chunk_size):
         yield items[i : i + chunk_size]
+
+
+class AsyncMicroBatcher(Generic[K, V]):
+    """Collect concurrent single-key loads into batched calls.
+
+    Keys requested within ``window`` seconds of the first queued key, or
+    until ``max_batch_size`` distinct keys are queued, are passed to
+    ``batch_func`` together. Each caller receives the value for its key, or
+    ``None`` when the batch result does not contain it. If ``batch_func``
+    raises, every caller in that batch receives the exception.
+    """
+
+    def __init__(
+        self,
+        batch_func: Callable[[list[K]], Awaitable[dict[K, V]]],
+        window: float = 0.005,
+        max_batch_size: int = 100,
+    ) -> None:
+        self._batch_func = batch_func
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[K, list[asyncio.Future[V | None]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Queue ``key`` for the next batch and wait for its value."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # State from a previous event loop cannot be awaited here
+            self._loop = loop
+            self._pending = {}
+            self._timer = None
+
+        future: asyncio.Future[V | None] = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self._max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending or self._loop is None:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = self._loop.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, batch: dict[K, list[asyncio.Future[V | None]]]
+    ) -> None:
+        try:
+            found = await self._batch_func(list(batch))
+        except Exception as exc:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        for key, futures in batch.items():
+            value = found.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
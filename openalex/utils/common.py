@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any, overload
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
-from ..constants import OPENALEX_ID_PREFIX
+from ..constants import DOI_PATTERN, OPENALEX_ID_PREFIX, PMID_PREFIX
 from ..models import ListResult, Meta
 
 __all__ = [
@@ -18,8 +19,13 @@ __all__ = [
     "id_to_url",
     "ids_equal",
     "is_openalex_id",
+    "normalize_doi",
     "normalize_entity_id",
     "normalize_id_batch",
+    "normalize_issn",
+    "normalize_orcid",
+    "normalize_pmid",
+    "normalize_ror",
     "parse_entity_ids",
     "strip_id_prefix",
     "validate_id_format",
@@ -221,3 +227,80 @@ def ids_equal(id1: str | None, id2: str | None) -> bool:
         return False
 
     return strip_id_prefix(id1).lower() == strip_id_prefix(id2).lower()
+
+
+_DOI_RE = re.compile(DOI_PATTERN)
+_ORCID_RE = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$")
+_ROR_RE = re.compile(r"^0[a-hj-km-np-tv-z0-9]{6}\d{2}$")
+_ISSN_RE = re.compile(r"^(\d{4})-?(\d{3}[\dX])$")
+
+
+def _strip_url(value: str, *hosts: str) -> str:
+    """Remove a leading ``http(s)://`` URL for any of ``hosts``."""
+    lowered = value.lower()
+    for host in hosts:
+        for scheme in ("https://", "http://", ""):
+            prefix = f"{scheme}{host}/"
+            if lowered.startswith(prefix):
+                return value[len(prefix) :]
+    return value
+
+
+def normalize_doi(value: str | None) -> str | None:
+    """Return the bare lowercase DOI (``10.x/y``) or ``None`` if invalid.
+
+    Accepts ``https://doi.org/`` and ``dx.doi.org`` URLs as well as a
+    ``doi:`` prefix.
+    """
+    if not value:
+        return None
+
+    doi = value.strip()
+    if doi.lower().startswith("doi:"):
+        doi = doi[4:].strip()
+    doi = _strip_url(doi, "doi.org", "dx.doi.org").lower()
+    return doi if _DOI_RE.match(doi) else None
+
+
+def normalize_orcid(value: str | None) -> str | None:
+    """Return the bare ORCID iD (``0000-0002-1825-0097``) or ``None``."""
+    if not value:
+        return None
+
+    orcid = _strip_url(value.strip(), "orcid.org").upper()
+    return orcid if _ORCID_RE.match(orcid) else None
+
+
+def normalize_ror(value: str | None) -> str | None:
+    """Return the bare ROR ID (``02mhbdp94``) or ``None`` if invalid."""
+    if not value:
+        return None
+
+    ror = _strip_url(value.strip(), "ror.org").lower()
+    return ror if _ROR_RE.match(ror) else None
+
+
+def normalize_pmid(value: str | None) -> str | None:
+    """Return the numeric PubMed ID or ``None`` if invalid.
+
+    Accepts bare digits, a ``pmid:`` prefix or a PubMed URL.
+    """
+    if not value:
+        return None
+
+    pmid = value.strip()
+    if pmid.lower().startswith(PMID_PREFIX):
+        pmid = pmid[len(PMID_PREFIX) :].strip()
+    pmid = _strip_url(pmid, "pubmed.ncbi.nlm.nih.gov").rstrip("/")
+    return pmid if pmid.isdigit() else None
+
+
+def normalize_issn(value: str | None) -> str | None:
+    """Return an ISSN in ``1234-567X`` form or ``None`` if invalid."""
+    if not value:
+        return None
+
+    match = _ISSN_RE.match(value.strip().upper())
+    if match is None:
+        return None
+    return f"{match.group(1)}-{match.group(2)}"
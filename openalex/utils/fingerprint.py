@@ -0,0 +1,34 @@
+"""Canonical request fingerprints."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import xxhash
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = ["request_fingerprint"]
+
+
+def request_fingerprint(
+    endpoint: str, params: Mapping[str, Any] | None = None
+) -> str:
+    """Return the canonical fingerprint of a request.
+
+    ``params`` should be normalized (see
+    :func:`~openalex.utils.params.normalize_params`). They are serialized
+    as JSON with sorted keys and hashed with 128-bit XXH3, so equal
+    requests get equal fingerprints in every process and Python version.
+    Cache keys, request coalescing and stream checkpoints all use this
+    value.
+    """
+    payload = json.dumps(
+        [endpoint, params or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return xxhash.xxh3_128_hexdigest(payload.encode())
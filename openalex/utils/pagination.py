@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import queue
+import threading
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
 from itertools import repeat
 from typing import TYPE_CHECKING, Any, Final, Generic, TypeVar
 
@@ -12,6 +17,7 @@ from ..constants import (
     DEFAULT_CONCURRENCY,
     DEFAULT_PER_PAGE,
     FIRST_PAGE,
+    MAX_PAGED_RESULTS,
     PARAM_CURSOR,
     PARAM_PAGE,
     PARAM_PER_PAGE,
@@ -21,12 +27,24 @@ from ..constants import (
 __all__ = [
     "AsyncPaginator",
     "Paginator",
+    "async_prefetch_iter",
+    "prefetch_iter",
 ]
 
 from ..exceptions import APIError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterable,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Generator,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
 
     from ..models import ListResult
 
@@ -36,6 +54,105 @@ MAX_PER_PAGE: Final = DEFAULT_PER_PAGE
 
 T = TypeVar("T")
 
+_DONE: Final = object()
+_PUT_POLL_INTERVAL: Final = 0.1
+
+
+def prefetch_iter(
+    iterable: Iterable[T], depth: int
+) -> Generator[T, None, None]:
+    """Iterate ``iterable`` while a background thread fetches ahead.
+
+    At most ``depth`` items wait in the buffer. An exception raised by the
+    source is re-raised after every item produced before it. With
+    ``depth <= 0`` the source is iterated directly.
+    """
+    if depth <= 0:
+        yield from iterable
+        return
+
+    buffer: queue.Queue[tuple[Any, BaseException | None]] = queue.Queue(
+        maxsize=depth
+    )
+    stop = threading.Event()
+
+    def put(entry: tuple[Any, BaseException | None]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=_PUT_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def produce() -> None:
+        # Any exit, KeyboardInterrupt and SystemExit included, must reach
+        # the consumer, or it would wait on the buffer forever
+        error: BaseException | None = None
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as exc:
+            error = exc
+        finally:
+            put((_DONE, error))
+
+    thread = threading.Thread(
+        target=produce, name="openalex-prefetch", daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+async def async_prefetch_iter(
+    iterable: AsyncIterable[T], depth: int
+) -> AsyncGenerator[T, None]:
+    """Async version of :func:`prefetch_iter` using a background task."""
+    if depth <= 0:
+        async for item in iterable:
+            yield item
+        return
+
+    buffer: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue(
+        maxsize=depth
+    )
+
+    async def produce() -> None:
+        error: BaseException | None = None
+        try:
+            async for item in iterable:
+                await buffer.put((item, None))
+        except asyncio.CancelledError:
+            # Only the consumer cancels, and it no longer reads the buffer
+            raise
+        except BaseException as exc:
+            error = exc
+        await buffer.put((_DONE, error))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
 
 def _pad_results(results: list[T], per_page: int | None) -> list[T]:
     """Pad ``results`` list to ``per_page`` length if needed.
@@ -81,6 +198,7 @@ class Paginator(Generic[T]):
         params: dict[str, Any] | None = None,
         per_page: int = MAX_PER_PAGE,
         max_results: int | None = None,
+        prefetch: int = 0,
     ) -> None:
         """Initialize paginator.
 
@@ -89,11 +207,13 @@ class Paginator(Generic[T]):
             params: Query parameters
             per_page: Results per page (max 200)
             max_results: Maximum total results to fetch
+            prefetch: Pages to fetch ahead in a background thread
         """
         self.fetch_func = fetch_func
         self.params = params or {}
         self.per_page = min(per_page, MAX_PER_PAGE)
         self.max_results = max_results
+        self.prefetch = prefetch
         self._total_fetched = 0
 
     @property
@@ -102,14 +222,24 @@ class Paginator(Generic[T]):
         return self._total_fetched
 
     def _page_iterator(self) -> Iterator[ListResult[T]]:
+        for result in prefetch_iter(self._fetch_pages(), self.prefetch):
+            items = _pad_results(result.results, result.meta.per_page)
+            self._total_fetched += len(items)
+            if self.max_results and self._total_fetched > self.max_results:
+                self._total_fetched = self.max_results
+
+            yield result
+
+    def _fetch_pages(self) -> Iterator[ListResult[T]]:
         page: int | None = FIRST_PAGE
         cursor = self.params.get(PARAM_CURSOR)
         base_params = {
             k: v for k, v in self.params.items() if k != PARAM_CURSOR
         }
+        fetched = self._total_fetched
 
         while True:
-            if self.max_results and self._total_fetched >= self.max_results:
+            if self.max_results and fetched >= self.max_results:
                 break
 
             params = _build_params(
@@ -127,10 +257,7 @@ class Paginator(Generic[T]):
                 )
                 raise
 
-            items = _pad_results(result.results, result.meta.per_page)
-            self._total_fetched += len(items)
-            if self.max_results and self._total_fetched > self.max_results:
-                self._total_fetched = self.max_results
+            fetched += len(_pad_results(result.results, result.meta.per_page))
 
             yield result
 
@@ -195,6 +322,9 @@ class AsyncPaginator(Generic[T]):
         per_page: int = MAX_PER_PAGE,
         max_results: int | None = None,
         concurrency: int = DEFAULT_CONCURRENCY,
+        prefetch: int = 0,
+        partitioner: Callable[[int], Awaitable[Sequence[dict[str, Any]]]]
+        | None = None,
     ) -> None:
         """Initialize async paginator.
 
@@ -204,12 +334,18 @@ class AsyncPaginator(Generic[T]):
             per_page: Results per page (max 200)
             max_results: Maximum total results to fetch
             concurrency: Number of concurrent requests
+            prefetch: Pages to fetch ahead in a background task
+            partitioner: Async function returning the parameters of disjoint
+                slices of at most the given size, used by :meth:`gather`
+                beyond ``MAX_PAGED_RESULTS``
         """
         self.fetch_func = fetch_func
         self.params = params or {}
         self.per_page = min(per_page, MAX_PER_PAGE)
         self.max_results = max_results
         self.concurrency = concurrency
+        self.prefetch = prefetch
+        self.partitioner = partitioner
         self._total_fetched = 0
 
     @property
@@ -219,62 +355,55 @@ class AsyncPaginator(Generic[T]):
 
     async def __aiter__(self) -> AsyncIterator[T]:
         """Iterate over all results asynchronously."""
-        page: int | None = FIRST_PAGE
-        cursor = self.params.get(PARAM_CURSOR)
-        base_params = {
-            k: v for k, v in self.params.items() if k != PARAM_CURSOR
-        }
-
-        while True:
-            if self.max_results and self._total_fetched >= self.max_results:
-                break
-
-            params = _build_params(
-                base_params, cursor=cursor, page=page, per_page=self.per_page
-            )
-
-            # Fetch page
-            try:
-                result = await self.fetch_func(params)
-            except APIError as e:
-                logger.exception(
-                    "Error fetching page",
-                    page=page,
-                    cursor=cursor,
-                    error=str(e),
-                )
-                raise
-
-            # Yield results
-            items = _pad_results(result.results, result.meta.per_page)
-
-            for item in items:
-                if self.max_results and self._total_fetched >= self.max_results:
-                    return
-                self._total_fetched += 1
-                yield item
-
-            # Check if there are more pages
-            if result.meta.next_cursor:
-                cursor = result.meta.next_cursor
-                page = None
-            elif len(result.results) == 0:
-                break
-            elif page is not None:
-                page += 1
-            else:
-                # No next_cursor, and page is None: we're at the end, break!
-                break
+        pages = async_prefetch_iter(
+            self._fetch_pages(limited=True), self.prefetch
+        )
+        try:
+            async for result in pages:
+                items = _pad_results(result.results, result.meta.per_page)
+
+                for item in items:
+                    if (
+                        self.max_results
+                        and self._total_fetched >= self.max_results
+                    ):
+                        return
+                    self._total_fetched += 1
+                    yield item
+        finally:
+            await pages.aclose()
 
     async def pages(self) -> AsyncIterator[ListResult[T]]:
         """Iterate over pages instead of individual results."""
+        pages = async_prefetch_iter(
+            self._fetch_pages(limited=False), self.prefetch
+        )
+        try:
+            async for result in pages:
+                yield result
+        finally:
+            await pages.aclose()
+
+    async def _fetch_pages(
+        self, *, limited: bool
+    ) -> AsyncIterator[ListResult[T]]:
+        """Walk pages in order.
+
+        ``limited`` stops once ``max_results`` items have been fetched
+        (item iteration); otherwise a short numbered page ends the walk
+        (page iteration).
+        """
         page: int | None = FIRST_PAGE
         cursor = self.params.get(PARAM_CURSOR)
         base_params = {
             k: v for k, v in self.params.items() if k != PARAM_CURSOR
         }
+        fetched = self._total_fetched
 
         while True:
+            if limited and self.max_results and fetched >= self.max_results:
+                break
+
             params = _build_params(
                 base_params, cursor=cursor, page=page, per_page=self.per_page
             )
@@ -291,6 +420,7 @@ class AsyncPaginator(Generic[T]):
                 )
                 raise
 
+            fetched += len(_pad_results(result.results, result.meta.per_page))
             yield result
 
             # Check if there are more pages
@@ -300,11 +430,11 @@ class AsyncPaginator(Generic[T]):
             elif len(result.results) == 0:
                 break
             elif page is not None:
-                if len(result.results) < self.per_page:
-                    page = None
+                if not limited and len(result.results) < self.per_page:
                     break
                 page += 1
             else:
+                # No next_cursor, and page is None: we're at the end, break!
                 break
 
     async def first(self) -> T | None:
@@ -329,44 +459,200 @@ class AsyncPaginator(Generic[T]):
         result: ListResult[T] = await self.fetch_func(params)
         return result.meta.count
 
-    async def gather(self, pages: int | None = None) -> list[T]:
+    async def gather(
+        self, pages: int | None = None, *, ordered: bool = True
+    ) -> list[T]:
         """Fetch multiple pages concurrently.
 
         Args:
             pages: Number of pages to fetch (None for all)
+            ordered: Return results in page order rather than arrival order
 
         Returns:
             List of all results
         """
-        if pages is not None:
-            total_pages = pages
-        else:
+        results: list[T] = []
+        async for result in self.gather_pages(pages, ordered=ordered):
+            results.extend(result.results)
+
+            if self.max_results and len(results) >= self.max_results:
+                return results[: self.max_results]
+
+        return results
+
+    async def gather_pages(
+        self, pages: int | None = None, *, ordered: bool = False
+    ) -> AsyncIterator[ListResult[T]]:
+        """Fetch pages with a sliding window of ``concurrency`` requests.
+
+        A new request starts as soon as one finishes, so a slow page never
+        holds back the others. Pages are yielded as they complete, or in
+        page order when ``ordered`` is set.
+
+        Numbered pages only reach the first ``MAX_PAGED_RESULTS`` results;
+        larger result sets are walked with cursors instead, one cursor per
+        partition from ``partitioner`` (or a single cursor without one).
+
+        Args:
+            pages: Number of pages to fetch (None for all)
+            ordered: Yield pages in order instead of as they complete
+        """
+        count: int | None = None
+        if pages is None:
             count = await self.count()
-            total_pages = (count + self.per_page - 1) // self.per_page
-
-        # Create tasks for all pages
-        tasks = [
-            self.fetch_func(
-                _build_params(
-                    self.params,
-                    cursor=None,
-                    page=page,
-                    per_page=self.per_page,
+            wanted = count
+        else:
+            wanted = pages * self.per_page
+        if self.max_results:
+            wanted = min(wanted, self.max_results)
+
+        if wanted <= MAX_PAGED_RESULTS:
+            base = {k: v for k, v in self.params.items() if k != PARAM_CURSOR}
+            total_pages = (wanted + self.per_page - 1) // self.per_page
+            requests = [
+                _PageRequest(
+                    lane=page - FIRST_PAGE,
+                    params=_build_params(
+                        base, cursor=None, page=page, per_page=self.per_page
+                    ),
                 )
+                for page in range(FIRST_PAGE, total_pages + FIRST_PAGE)
+            ]
+            window = self._sliding_window(
+                requests, limit=None, follow=False, ordered=ordered
+            )
+        else:
+            lanes = await self._cursor_lanes(count)
+            requests = [
+                _PageRequest(
+                    lane=lane,
+                    params=_build_params(
+                        {k: v for k, v in params.items() if k != PARAM_CURSOR},
+                        cursor="*",
+                        page=None,
+                        per_page=self.per_page,
+                    ),
+                )
+                for lane, params in enumerate(lanes)
+            ]
+            window = self._sliding_window(
+                requests, limit=wanted, follow=True, ordered=ordered
             )
-            for page in range(1, total_pages + 1)
-        ]
 
-        # Limit concurrency
-        results: list[T] = []
-        for i in range(0, len(tasks), self.concurrency):
-            batch = tasks[i : i + self.concurrency]
-            batch_results = await asyncio.gather(*batch)
+        async for result in window:
+            yield result
 
-            for result in batch_results:
-                results.extend(result.results)
+    async def _cursor_lanes(
+        self, count: int | None
+    ) -> Sequence[dict[str, Any]]:
+        """Return the parameters of each cursor walk for a large gather."""
+        if self.partitioner is None:
+            logger.info("gather_cursor_fallback", partitions=1)
+            return [self.params]
+
+        total = count if count is not None else await self.count()
+        # Aim for about one partition per concurrent request
+        size = max(self.per_page, -(-total // self.concurrency))
+        lanes = await self.partitioner(size)
+        logger.info("gather_cursor_fallback", partitions=len(lanes))
+        return lanes
+
+    async def _sliding_window(
+        self,
+        requests: Iterable[_PageRequest],
+        *,
+        limit: int | None,
+        follow: bool,
+        ordered: bool,
+    ) -> AsyncIterator[ListResult[T]]:
+        """Keep up to ``concurrency`` requests in flight until all are done.
+
+        With ``follow`` each page's ``next_cursor`` is queued ahead of new
+        lanes; no further requests start once ``limit`` results are fetched
+        or in flight. Ordered output is released lane by lane, page by page.
+        """
+        pending = deque(requests)
+        in_flight: dict[asyncio.Future[ListResult[T]], _PageRequest] = {}
+        buffered: dict[tuple[int, int], tuple[ListResult[T], bool]] = {}
+        expected = (0, 0)
+        fetched = 0
+
+        try:
+            while pending or in_flight:
+                while (
+                    pending
+                    and len(in_flight) < self.concurrency
+                    and (
+                        limit is None
+                        or fetched + len(in_flight) * self.per_page < limit
+                    )
+                ):
+                    request = pending.popleft()
+                    task = asyncio.ensure_future(
+                        self.fetch_func(request.params)
+                    )
+                    in_flight[task] = request
+                if not in_flight:
+                    break
 
-                if self.max_results and len(results) >= self.max_results:
-                    return results[: self.max_results]
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    request = in_flight.pop(task)
+                    try:
+                        result = task.result()
+                    except APIError as e:
+                        logger.exception(
+                            "Error fetching page",
+                            page=request.params.get(PARAM_PAGE),
+                            cursor=request.params.get(PARAM_CURSOR),
+                            error=str(e),
+                        )
+                        raise
+                    fetched += len(result.results)
+
+                    last = True
+                    if follow and result.results and result.meta.next_cursor:
+                        last = False
+                        pending.appendleft(
+                            _PageRequest(
+                                lane=request.lane,
+                                seq=request.seq + 1,
+                                params={
+                                    **request.params,
+                                    PARAM_CURSOR: result.meta.next_cursor,
+                                },
+                            )
+                        )
+
+                    if not ordered:
+                        yield result
+                        continue
+                    buffered[request.lane, request.seq] = (result, last)
+                    while expected in buffered:
+                        result, last = buffered.pop(expected)
+                        lane, seq = expected
+                        expected = (lane + 1, 0) if last else (lane, seq + 1)
+                        yield result
+
+            # Lanes cut short by ``limit`` leave gaps; release the rest
+            for key in sorted(buffered):
+                yield buffered[key][0]
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+@dataclass(frozen=True, slots=True)
+class _PageRequest:
+    """One page request of a concurrent gather.
+
+    ``lane`` is a numbered page or a cursor walk; ``seq`` orders the pages
+    within a cursor walk.
+    """
 
-        return results
+    params: dict[str, Any]
+    lane: int
+    seq: int = 0
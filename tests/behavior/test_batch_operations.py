@@ -3,21 +3,53 @@ from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
-from openalex import AsyncWorks, Works
+from openalex import AsyncAuthors, AsyncWorks, Authors, OpenAlexConfig, Works
+from openalex.exceptions import NotFoundError
 from openalex.models import Work
 
 
+def _list_response(params):
+    """Build a list response echoing the IDs in an ``openalex_id`` filter.
+
+    Single-entity gets (no filter) answer ``404``.
+    """
+    if "filter" not in params:
+        raise NotFoundError("gone")
+    ids = params["filter"].removeprefix("openalex_id:").split("|")
+    return {
+        "meta": {"count": len(ids), "per_page": 200},
+        "results": [
+            {"id": f"https://openalex.org/{i}", "display_name": i} for i in ids
+        ],
+    }
+
+
+def _doi_response(params):
+    """Build a works response for every DOI but ``10.1234/missing``."""
+    dois = params["filter"].removeprefix("doi:").split("|")
+    return {
+        "meta": {"count": len(dois)},
+        "results": [
+            {
+                "id": f"https://openalex.org/W{i}",
+                "display_name": doi,
+                "doi": f"https://doi.org/{doi}",
+            }
+            for i, doi in enumerate(dois, start=1)
+            if doi != "10.1234/missing"
+        ],
+    }
+
+
 class TestBatchOperations:
     def test_get_many_returns_all_valid_entities(self, mock_work_data):
         works = Works()
         ids = [f"W{i}" for i in range(2000000000, 2000000050)]
 
-        def side_effect(entity_id, params=None):
-            return Work(
-                id=f"https://openalex.org/{entity_id}", display_name="x"
-            )
+        def side_effect(url, params, operation=None):
+            return _list_response(params)
 
-        with patch.object(Works, "_get_single_entity", side_effect=side_effect):
+        with patch.object(Works, "_execute_request", side_effect=side_effect):
             results = works.get_many(ids)
 
         assert len(results) == len(ids)
@@ -27,13 +59,11 @@ class TestBatchOperations:
         works = Works()
         ids = ["W123", "invalid-id", "W456"]
 
-        def side_effect(entity_id, params=None):
-            return Work(
-                id=f"https://openalex.org/{entity_id}", display_name=entity_id
-            )
+        def side_effect(url, params, operation=None):
+            return _list_response(params)
 
         with (
-            patch.object(Works, "_get_single_entity", side_effect=side_effect),
+            patch.object(Works, "_execute_request", side_effect=side_effect),
             patch("openalex.entities.logger.warning") as mock_warn,
         ):
             results = works.get_many(ids)
@@ -43,41 +73,345 @@ class TestBatchOperations:
             "Skipping invalid ID %s: %s", "invalid-id", ANY
         )
 
+    def test_ids_are_batched_into_or_filters(self):
+        works = Works()
+        ids = [f"W{i}" for i in range(1, 251)]
+
+        def side_effect(url, params, operation=None):
+            return _list_response(params)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            results = works.get_many(ids)
+
+        assert mock_request.call_count == 3
+        for call in mock_request.call_args_list:
+            params = call.args[1]
+            assert params["filter"].startswith("openalex_id:")
+            assert len(params["filter"].split("|")) <= 100
+            assert params["per-page"] == "200"
+        assert [w.id for w in results] == [
+            f"https://openalex.org/{i}" for i in ids
+        ]
+
+    def test_results_preserve_input_order_and_skip_missing(self):
+        works = Works()
+        ids = ["W3", "W1", "W2"]
+
+        def side_effect(url, params, operation=None):
+            data = _list_response(params)
+            data["results"] = [
+                r
+                for r in reversed(data["results"])
+                if not r["id"].endswith("2")
+            ]
+            return data
+
+        with patch.object(Works, "_execute_request", side_effect=side_effect):
+            results = works.get_many(ids)
+
+        assert [w.id for w in results] == [
+            "https://openalex.org/W3",
+            "https://openalex.org/W1",
+        ]
+
     def test_concurrent_limit_respected(self):
         works = Works()
-        ids = [f"W{i}" for i in range(4)]
+        ids = [f"W{i}" for i in range(1, 5)]
         call_times: list[float] = []
 
-        def side_effect(entity_id, params=None):
+        def side_effect(url, params, operation=None):
             call_times.append(time.time())
             time.sleep(0.1)
-            return Work(
-                id=f"https://openalex.org/{entity_id}", display_name="x"
-            )
+            return _list_response(params)
 
-        with patch.object(Works, "_get_single_entity", side_effect=side_effect):
+        with (
+            patch.object(Works, "_execute_request", side_effect=side_effect),
+            patch("openalex.templates.MAX_OR_FILTER_VALUES", 1),
+        ):
             start = time.time()
             works.get_many(ids, max_concurrent=2)
             duration = time.time() - start
 
-        assert len(call_times) == len(ids)
+        assert len(call_times) == 4
         assert duration < 0.3
         assert duration > 0.19
 
+    def test_batches_populate_entity_cache(self):
+        works = Works(config=OpenAlexConfig(cache_enabled=True))
+
+        def side_effect(url, params, operation=None):
+            return _list_response(params)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            works.get_many(["W1", "W2"])
+            work = works.get("W1")
+            again = works.get_many(["W2", "W1"])
+
+        assert mock_request.call_count == 1
+        assert work.id == "https://openalex.org/W1"
+        assert [w.id for w in again] == [
+            "https://openalex.org/W2",
+            "https://openalex.org/W1",
+        ]
+
+    def test_single_gets_share_keys_with_batches(self):
+        works = Works(config=OpenAlexConfig(cache_enabled=True))
+
+        with patch.object(
+            Works,
+            "_execute_request",
+            return_value={"id": "https://openalex.org/W1"},
+        ) as mock_request:
+            works.get("https://openalex.org/W1")
+            cached = works.get_many(["W1"])
+
+        assert mock_request.call_count == 1
+        assert [w.id for w in cached] == ["https://openalex.org/W1"]
+
     @pytest.mark.asyncio
     async def test_async_version_works(self):
         works = AsyncWorks()
         ids = [f"W{i}" for i in range(2000000000, 2000000010)]
 
-        async def async_side_effect(entity_id):
-            return Work(
-                id=f"https://openalex.org/{entity_id}", display_name="x"
-            )
+        async def async_side_effect(url, params, operation=None):
+            return _list_response(params)
 
         with patch.object(
-            AsyncWorks, "get", new=AsyncMock(side_effect=async_side_effect)
-        ):
+            AsyncWorks,
+            "_execute_request",
+            new=AsyncMock(side_effect=async_side_effect),
+        ) as mock_request:
             results = await works.get_many(ids)
 
+        assert mock_request.await_count == 1
         assert len(results) == len(ids)
         assert all(isinstance(w, Work) for w in results)
+
+
+class TestIdentifierResolution:
+    def test_resolve_dois_maps_inputs_to_entities(self):
+        works = Works()
+        dois = [
+            "https://doi.org/10.1234/ABC",
+            "10.1234/abc",
+            "doi:10.5555/xyz",
+            "10.1234/missing",
+            "not-a-doi",
+        ]
+
+        def side_effect(url, params, operation=None):
+            return _doi_response(params)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            resolved = works.resolve_dois(dois)
+
+        assert mock_request.call_count == 1
+        params = mock_request.call_args.args[1]
+        assert params["filter"] == "doi:10.1234/abc|10.5555/xyz|10.1234/missing"
+        assert list(resolved) == dois
+        assert (
+            resolved["https://doi.org/10.1234/ABC"].display_name
+            == "10.1234/abc"
+        )
+        assert (
+            resolved["10.1234/abc"] is resolved["https://doi.org/10.1234/ABC"]
+        )
+        assert resolved["doi:10.5555/xyz"].display_name == "10.5555/xyz"
+        assert resolved["10.1234/missing"] is None
+        assert resolved["not-a-doi"] is None
+
+    def test_resolve_dois_batches_large_inputs(self):
+        works = Works()
+        dois = [f"10.1234/{i}" for i in range(250)]
+
+        def side_effect(url, params, operation=None):
+            return _doi_response(params)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            resolved = works.resolve_dois(dois)
+
+        assert mock_request.call_count == 3
+        assert all(work is not None for work in resolved.values())
+
+    def test_resolved_entities_populate_cache(self):
+        works = Works(config=OpenAlexConfig(cache_enabled=True))
+
+        def side_effect(url, params, operation=None):
+            return _doi_response(params)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            works.resolve_dois(["10.1234/abc"])
+            work = works.get("W1")
+
+        assert mock_request.call_count == 1
+        assert work.doi == "https://doi.org/10.1234/abc"
+
+    def test_resolve_orcids(self):
+        authors = Authors()
+        orcid = "0000-0002-1825-0097"
+
+        def side_effect(url, params, operation=None):
+            assert params["filter"] == f"orcid:{orcid}"
+            return {
+                "meta": {"count": 1},
+                "results": [
+                    {
+                        "id": "https://openalex.org/A1",
+                        "display_name": "Josiah Carberry",
+                        "orcid": f"https://orcid.org/{orcid}",
+                    }
+                ],
+            }
+
+        with patch.object(Authors, "_execute_request", side_effect=side_effect):
+            resolved = authors.resolve_orcids([f"https://orcid.org/{orcid}"])
+
+        assert (
+            resolved[f"https://orcid.org/{orcid}"].id
+            == "https://openalex.org/A1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_resolve_dois(self):
+        works = AsyncWorks()
+
+        async def async_side_effect(url, params, operation=None):
+            return _doi_response(params)
+
+        with patch.object(
+            AsyncWorks,
+            "_execute_request",
+            new=AsyncMock(side_effect=async_side_effect),
+        ):
+            resolved = await works.resolve_dois(
+                ["10.1234/abc", "10.1234/missing"]
+            )
+
+        assert resolved["10.1234/abc"].display_name == "10.1234/abc"
+        assert resolved["10.1234/missing"] is None
+
+    @pytest.mark.asyncio
+    async def test_async_resolve_orcids_skips_invalid(self):
+        authors = AsyncAuthors()
+
+        with patch.object(
+            AsyncAuthors, "_execute_request", new=AsyncMock()
+        ) as mock_request:
+            resolved = await authors.resolve_orcids(["bogus"])
+
+        assert resolved == {"bogus": None}
+        mock_request.assert_not_awaited()
+
+
+class TestNegativeCaching:
+    @staticmethod
+    def _config():
+        return OpenAlexConfig(cache_enabled=True, cache_negative_ttl=60)
+
+    def test_missing_ids_are_not_refetched(self):
+        works = Works(config=self._config())
+
+        def side_effect(url, params, operation=None):
+            response = _list_response(params)
+            response["results"] = [
+                r for r in response["results"] if not r["id"].endswith("W2")
+            ]
+            return response
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            first = works.get_many(["W1", "W2"])
+            again = works.get_many(["W2", "W1"])
+
+        # The batch, then a single get confirming the 404
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.args[1] == {}
+        assert [w.id for w in first] == [w.id for w in again]
+        assert works.cache_stats()["negative_hits"] == 1
+
+    def test_batch_miss_confirmations_are_capped(self):
+        from openalex.constants import MAX_CONFIRMED_MISSES
+
+        works = Works(config=self._config())
+        ids = [f"W{i}" for i in range(1, 21)]
+
+        def side_effect(url, params, operation=None):
+            response = _list_response(params)
+            response["results"] = []
+            return response
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            assert works.get_many(ids) == []
+            assert works.get_many(ids) == []
+
+        assert mock_request.call_count == 1 + MAX_CONFIRMED_MISSES
+        assert works.cache_stats()["negative_hits"] == len(ids)
+
+    def test_unresolved_dois_are_not_refetched(self):
+        works = Works(config=self._config())
+
+        def side_effect(url, params, operation=None):
+            return _doi_response(params)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            works.resolve_dois(["10.1234/missing", "10.1234/abc"])
+            resolved = works.resolve_dois(["10.1234/missing"])
+
+        assert mock_request.call_count == 1
+        assert resolved == {"10.1234/missing": None}
+
+    def test_merged_ids_are_not_cached_as_missing(self):
+        works = Works(config=self._config())
+
+        def side_effect(url, params, operation=None):
+            if "filter" not in params:
+                # W2 was merged into W3
+                return {"id": "https://openalex.org/W3", "display_name": "W3"}
+            response = _list_response(params)
+            response["results"][1] = {
+                "id": "https://openalex.org/W3",
+                "display_name": "W3",
+            }
+            return response
+
+        with patch.object(
+            Works, "_execute_request", side_effect=side_effect
+        ) as mock_request:
+            first = works.get_many(["W1", "W2"])
+            again = works.get_many(["W1", "W2"])
+
+        assert mock_request.call_count == 2
+        assert [w.id for w in first] == [w.id for w in again]
+        assert first[1].id == "https://openalex.org/W3"
+        assert works.cache_stats()["negative_stores"] == 0
+
+    def test_not_found_single_get_is_cached(self):
+        works = Works(config=self._config())
+
+        with patch.object(
+            Works,
+            "_execute_request",
+            side_effect=NotFoundError("gone", resource_id="W9"),
+        ) as mock_request:
+            for _ in range(3):
+                with pytest.raises(NotFoundError):
+                    works.get("W9")
+
+        assert mock_request.call_count == 1
+        stats = works.cache_stats()
+        assert (stats["negative_stores"], stats["negative_hits"]) == (1, 2)
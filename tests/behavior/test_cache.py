@@ -385,3 +385,150 @@ class TestCacheBehavior:
 
             # But only one API call should be made
             assert mock_request.call_count == 1
+
+
+class TestConditionalRevalidation:
+    """Expired entries are revalidated with ETag/Last-Modified."""
+
+    @staticmethod
+    def _stand_in_server(requests_seen):
+        """Return a request handler acting as an OpenAlex server."""
+        import httpx
+
+        etag = '"v1"'
+        body = {"id": "https://openalex.org/W123", "title": "Validated Work"}
+
+        def handle(method, url, params=None, headers=None, **kwargs):
+            requests_seen.append(dict(headers or {}))
+            request = httpx.Request(method, url)
+            if (headers or {}).get("If-None-Match") == etag:
+                return httpx.Response(
+                    304, headers={"ETag": etag}, request=request
+                )
+            return httpx.Response(
+                200,
+                json=body,
+                headers={
+                    "ETag": etag,
+                    "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                },
+                request=request,
+            )
+
+        return handle
+
+    def test_not_modified_response_renews_cached_entity(self):
+        """A 304 keeps serving the cached body without a new download."""
+        from openalex import OpenAlexConfig, Works
+
+        config = OpenAlexConfig(
+            cache_enabled=True,
+            cache_ttl=0.05,
+            cache_revalidate_ttl=60,
+            retry_enabled=False,
+        )
+        requests_seen = []
+
+        with patch(
+            "httpx.Client.request",
+            side_effect=self._stand_in_server(requests_seen),
+        ):
+            works = Works(config=config)
+            assert works.get("W123").title == "Validated Work"
+            time.sleep(0.1)
+            assert works.get("W123").title == "Validated Work"
+            assert works.get("W123").title == "Validated Work"
+
+        assert len(requests_seen) == 2
+        assert "If-None-Match" not in requests_seen[0]
+        assert requests_seen[1]["If-None-Match"] == '"v1"'
+        assert requests_seen[1]["If-Modified-Since"] == (
+            "Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+        stats = works.cache_stats()
+        assert (stats["revalidations"], stats["not_modified"]) == (1, 1)
+
+
+class TestListResultsPopulateEntityCache:
+    """List pages can seed the per-entity cache."""
+
+    @staticmethod
+    def _page(url, params, operation=None):
+        return {
+            "meta": {"count": 2, "per_page": 25},
+            "results": [
+                {"id": "https://openalex.org/W1", "title": "One"},
+                {"id": "https://openalex.org/W2", "title": "Two"},
+            ],
+        }
+
+    def test_listed_works_are_served_from_cache(self):
+        from openalex import OpenAlexConfig, Works
+
+        config = OpenAlexConfig(cache_enabled=True, cache_list_results=True)
+        works = Works(config=config)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=self._page
+        ) as mock_request:
+            works.filter(publication_year=2024).get()
+            assert Works(config=config)["W2"].title == "Two"
+
+        assert mock_request.call_count == 1
+
+    def test_selected_fields_are_not_cached_as_entities(self):
+        from openalex import OpenAlexConfig, Works
+
+        config = OpenAlexConfig(cache_enabled=True, cache_list_results=True)
+        works = Works(config=config)
+
+        with patch.object(
+            Works, "_execute_request", side_effect=self._page
+        ) as mock_request:
+            works.select(["id", "title"]).get()
+            works["W1"]
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_stream_pages_populate_cache(self):
+        from unittest.mock import AsyncMock
+
+        from openalex import AsyncWorks, OpenAlexConfig
+
+        config = OpenAlexConfig(cache_enabled=True, cache_list_results=True)
+        works = AsyncWorks(config=config)
+
+        with patch.object(
+            AsyncWorks,
+            "_execute_request",
+            new=AsyncMock(side_effect=self._page),
+        ) as mock_request:
+            await works.get_list(filter={"publication_year": 2024})
+            work = await works.get("W1")
+
+        assert work.title == "One"
+        assert mock_request.await_count == 1
+
+
+class TestProjectedSelect:
+    """Narrow selects over cached entities are answered locally."""
+
+    def test_select_after_full_get_makes_no_request(self):
+        from openalex import OpenAlexConfig, Works
+
+        config = OpenAlexConfig(cache_enabled=True)
+        full = {
+            "id": "https://openalex.org/W1",
+            "title": "One",
+            "cited_by_count": 7,
+        }
+
+        with patch.object(
+            Works, "_execute_request", return_value=full
+        ) as mock_request:
+            Works(config=config).get("W1")
+            work = Works(config=config).get("W1", select=["id", "title"])
+
+        assert mock_request.call_count == 1
+        assert work.title == "One"
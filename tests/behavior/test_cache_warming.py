@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from openalex import Works, OpenAlexConfig
+from openalex.exceptions import NotFoundError
 from openalex.models import Work
 
 
@@ -88,3 +89,164 @@ class TestCacheWarming:
 
         stats = works.cache_stats()
         assert stats["hits"] >= 2
+
+
+def _list_response(params):
+    """Echo the IDs of an ``openalex_id`` filter, except ``W404``.
+
+    Single-entity gets (no filter) answer ``404``.
+    """
+    if "filter" not in params:
+        raise NotFoundError("gone")
+    ids = params["filter"].removeprefix("openalex_id:").split("|")
+    return {
+        "meta": {"count": len(ids), "per_page": 200},
+        "results": [
+            {"id": f"https://openalex.org/{i}", "display_name": i}
+            for i in ids
+            if i != "W404"
+        ],
+    }
+
+
+class TestBatchedWarmup:
+    def test_warm_ids_batches_and_skips_fresh_entries(self):
+        works = Works(
+            config=OpenAlexConfig(cache_enabled=True, cache_negative_ttl=60)
+        )
+        ids = [f"W{i}" for i in range(1, 251)] + ["W404", "bad-id"]
+        progress = []
+
+        with patch.object(
+            Works,
+            "_execute_request",
+            side_effect=lambda url, params, operation=None: _list_response(
+                params
+            ),
+        ) as mock_request:
+            report = works.warm_ids(ids, progress=progress.append)
+            # Three batches and a single get confirming W404 is missing
+            assert mock_request.call_count == 4
+
+            again = works.warm_ids(ids)
+            assert mock_request.call_count == 4
+
+        assert (report.requested, report.fetched, report.missing) == (
+            251,
+            250,
+            1,
+        )
+        assert (report.invalid, report.requests, report.done) == (1, 3, 251)
+        assert len(progress) == 3
+        assert again.fresh == 251
+        assert again.requests == 0
+
+        with patch.object(Works, "_execute_request") as mock_request:
+            works.get("W7")
+            mock_request.assert_not_called()
+
+    def test_warm_ids_refetches_stale_entries(self):
+        works = Works(
+            config=OpenAlexConfig(
+                cache_enabled=True, cache_ttl=0.05, cache_stale_ttl=60
+            )
+        )
+        ids = ["W1", "W2"]
+
+        with patch.object(
+            Works,
+            "_execute_request",
+            side_effect=lambda url, params, operation=None: _list_response(
+                params
+            ),
+        ) as mock_request:
+            works.warm_ids(ids)
+            time.sleep(0.1)
+            again = works.warm_ids(ids)
+
+        assert mock_request.call_count == 2
+        assert (again.fresh, again.fetched) == (0, 2)
+
+    def test_manifest_warms_shared_sqlite_cache(self, tmp_path):
+        from openalex.cache.warmup import warm_manifest
+
+        manifest = tmp_path / "hot.txt"
+        manifest.write_text(
+            "# hot set\n"
+            "W1\n"
+            "https://openalex.org/W2\n"
+            '{"endpoint": "works", "filter": {"publication_year": 2020}}\n'
+        )
+
+        def respond(url, params, operation=None):
+            if params["filter"].startswith("openalex_id:"):
+                return _list_response(params)
+            return {"meta": {"count": 0}, "results": []}
+
+        def config():
+            return OpenAlexConfig(
+                cache_enabled=True,
+                cache_backend="sqlite",
+                cache_path=tmp_path / "cache.db",
+            )
+
+        with patch.object(
+            Works, "_execute_request", side_effect=respond
+        ) as mock_request:
+            report = warm_manifest(manifest, config())
+            assert mock_request.call_count == 2
+
+            # A second process sharing the file finds everything cached
+            rerun = warm_manifest(manifest, config())
+            assert mock_request.call_count == 2
+
+        assert (report.fetched, report.fresh) == (3, 0)
+        assert (rerun.fetched, rerun.fresh) == (0, 3)
+
+    def test_manifest_refetches_stale_query_pages(self, tmp_path):
+        from dataclasses import replace
+
+        from openalex.cache.manager import get_cache_manager
+        from openalex.cache.warmup import warm_manifest
+
+        manifest = tmp_path / "hot.txt"
+        manifest.write_text('{"endpoint": "works", "search": "cats"}\n')
+        config = OpenAlexConfig(cache_enabled=True)
+        cache = get_cache_manager(config).cache
+
+        with patch.object(
+            Works,
+            "_execute_request",
+            return_value={"meta": {"count": 0}, "results": []},
+        ) as mock_request:
+            warm_manifest(manifest, config)
+            # The page outlived its TTL through an adaptive extension
+            ((key, entry),) = [
+                (k, e) for k, e in cache.entries() if ":list:" in k
+            ]
+            cache.set_entry(
+                key,
+                replace(
+                    entry, created_at=entry.created_at - 7200, extended=True
+                ),
+            )
+            rerun = warm_manifest(manifest, config)
+
+        assert mock_request.call_count == 2
+        assert (rerun.fetched, rerun.fresh) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_async_warm_ids(self):
+        from openalex import AsyncWorks
+
+        works = AsyncWorks(config=OpenAlexConfig(cache_enabled=True))
+
+        async def respond(url, params, operation=None):
+            return _list_response(params)
+
+        with patch.object(AsyncWorks, "_execute_request", side_effect=respond):
+            report = await works.warm_ids(
+                [f"W{i}" for i in range(1, 151)], max_concurrent=2
+            )
+
+        assert (report.fetched, report.requests) == (150, 2)
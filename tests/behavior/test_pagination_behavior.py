@@ -534,3 +534,224 @@ class TestPaginationBehavior:
             # Should raise error when hitting bad page
             with pytest.raises(ServerError):
                 list(authors.paginate(per_page=1))
+
+
+RECORDS = [
+    ("W1", 2020, "article"),
+    ("W2", 2020, "article"),
+    ("W3", 2020, "book"),
+    ("W4", 2021, "article"),
+    ("W5", 2021, "book"),
+    ("W6", None, "article"),
+]
+
+
+def _fake_partitioned_api(params):
+    """Serve filter, group-by and cursor requests over ``RECORDS``."""
+    conditions = [
+        part.split(":", 1)
+        for part in params.get("filter", "").split(",")
+        if part
+    ]
+
+    def matches(record):
+        _, year, work_type = record
+        for key, value in conditions:
+            if key == "publication_year" and value != (
+                "null" if year is None else str(year)
+            ):
+                return False
+            if key == "type" and value != work_type:
+                return False
+        return True
+
+    records = [r for r in RECORDS if matches(r)]
+
+    if "group-by" in params:
+        field = params["group-by"].split(":")[0]
+        counts = {}
+        for _, year, work_type in records:
+            key = (
+                ("unknown" if year is None else str(year))
+                if field == "publication_year"
+                else f"https://openalex.org/work-types/{work_type}"
+            )
+            counts[key] = counts.get(key, 0) + 1
+        return {
+            "meta": {"count": len(records), "next_cursor": None},
+            "results": [],
+            "group_by": [{"key": k, "count": c} for k, c in counts.items()],
+        }
+
+    per_page = int(params.get("per-page", 25))
+    cursor = params.get("cursor")
+    start = 0 if cursor in (None, "*") else int(cursor)
+    end = start + per_page
+    return {
+        "meta": {
+            "count": len(records),
+            "per_page": per_page,
+            "next_cursor": str(end) if cursor and end < len(records) else None,
+        },
+        "results": [
+            {"id": f"https://openalex.org/{r[0]}"} for r in records[start:end]
+        ],
+    }
+
+
+@pytest.mark.behavior
+class TestPartitionedHarvest:
+    """Partitioned harvests cover every record exactly once."""
+
+    def test_harvest_covers_all_records(self):
+        from openalex import Works
+
+        def mock_response(*args, **kwargs):
+            data = _fake_partitioned_api(kwargs["params"])
+            return Mock(status_code=200, json=Mock(return_value=data))
+
+        with patch("httpx.Client.request", side_effect=mock_response):
+            query = Works().query()
+            partitions = query.partitions(
+                ["publication_year", "type"], max_partition_size=2
+            )
+            works = list(
+                query.harvest(
+                    ["publication_year", "type"],
+                    per_page=1,
+                    max_workers=3,
+                    max_partition_size=2,
+                    rate_limit=1000,
+                )
+            )
+
+        assert [p.key for p in partitions] == [
+            "publication_year=2020,type=article",
+            "publication_year=2020,type=book",
+            "publication_year=2021",
+            "publication_year=null",
+        ]
+        assert sorted(w.id.rsplit("/", 1)[-1] for w in works) == [
+            "W1",
+            "W2",
+            "W3",
+            "W4",
+            "W5",
+            "W6",
+        ]
+
+    def test_harvest_pages_bypass_the_list_cache(self):
+        from openalex import OpenAlexConfig, Works
+
+        page_requests = []
+
+        def mock_response(*args, **kwargs):
+            params = kwargs["params"]
+            if "cursor" in params:
+                page_requests.append(params["cursor"])
+            data = _fake_partitioned_api(params)
+            return Mock(status_code=200, json=Mock(return_value=data))
+
+        query = Works(config=OpenAlexConfig(cache_enabled=True)).query()
+        with patch("httpx.Client.request", side_effect=mock_response):
+            first = list(query.harvest("publication_year", rate_limit=1000))
+            pages = len(page_requests)
+            second = list(query.harvest("publication_year", rate_limit=1000))
+
+        assert len(first) == len(second) == len(RECORDS)
+        assert pages > 0
+        assert len(page_requests) == 2 * pages
+
+    @pytest.mark.asyncio
+    async def test_async_harvest_covers_all_records(self):
+        from openalex import AsyncWorks
+
+        async def mock_response(*args, **kwargs):
+            data = _fake_partitioned_api(kwargs["params"])
+            return Mock(status_code=200, json=Mock(return_value=data))
+
+        with patch("httpx.AsyncClient.request", side_effect=mock_response):
+            works = [
+                work
+                async for work in AsyncWorks()
+                .query()
+                .harvest(
+                    "publication_year",
+                    per_page=2,
+                    max_partition_size=1,
+                    rate_limit=1000,
+                )
+            ]
+
+        assert len({w.id for w in works}) == len(RECORDS)
+
+    def test_checkpointed_harvest_skips_finished_partitions(self, tmp_path):
+        from openalex import Works
+
+        page_requests = []
+
+        def mock_response(*args, **kwargs):
+            params = kwargs["params"]
+            if "cursor" in params and "group-by" not in params:
+                page_requests.append(params.get("filter"))
+            data = _fake_partitioned_api(params)
+            return Mock(status_code=200, json=Mock(return_value=data))
+
+        checkpoint = tmp_path / "harvest.db"
+        with patch("httpx.Client.request", side_effect=mock_response):
+            query = Works().query()
+            first = list(
+                query.harvest(
+                    "publication_year",
+                    max_partition_size=2,
+                    rate_limit=1000,
+                    checkpoint=checkpoint,
+                )
+            )
+            requests_after_first = len(page_requests)
+            second = list(
+                query.harvest(
+                    "publication_year",
+                    max_partition_size=2,
+                    rate_limit=1000,
+                    checkpoint=checkpoint,
+                )
+            )
+
+        assert len(first) == len(RECORDS)
+        assert second == []
+        assert len(page_requests) == requests_after_first
+
+    @pytest.mark.asyncio
+    async def test_gather_beyond_page_limit_uses_partitioned_cursors(self):
+        from openalex import AsyncWorks
+
+        page_requests = []
+
+        async def mock_response(*args, **kwargs):
+            params = kwargs["params"]
+            if "page" in params and "per-page" in params:
+                page_requests.append(params["page"])
+            data = _fake_partitioned_api(params)
+            return Mock(status_code=200, json=Mock(return_value=data))
+
+        with (
+            patch("httpx.AsyncClient.request", side_effect=mock_response),
+            patch("openalex.utils.pagination.MAX_PAGED_RESULTS", 2),
+        ):
+            paginator = (
+                AsyncWorks()
+                .query()
+                .paginate(per_page=2, partition_by="publication_year")
+            )
+            works = await paginator.gather()
+
+        assert [w.id.rsplit("/", 1)[-1] for w in works] == [
+            "W1",
+            "W2",
+            "W3",
+            "W4",
+            "W5",
+            "W6",
+        ]
+        assert page_requests == []
@@ -560,6 +560,7 @@ def _reset_global_state():
 
     import openalex.cache.manager
     import openalex.entities
+    import openalex.templates
 
     if not hasattr(_reset_global_state, "_original_get_cache_manager"):
         _reset_global_state._original_get_cache_manager = (
@@ -572,6 +573,9 @@ def _reset_global_state():
     openalex.entities.get_cache_manager = (
         _reset_global_state._original_get_cache_manager
     )
+    openalex.templates.get_cache_manager = (
+        _reset_global_state._original_get_cache_manager
+    )
 
     clear_cache()
     _cache_managers.clear()
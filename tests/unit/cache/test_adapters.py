@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from openalex import OpenAlexConfig
+from openalex.cache import (
+    AsyncBaseCache,
+    AsyncCacheAdapter,
+    MemoryCache,
+    SQLiteCache,
+    as_async_cache,
+)
+from openalex.cache.manager import CacheManager
+
+
+class _SlowCache(MemoryCache):
+    """Memory cache whose reads block like a remote backend would."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.threads = set()
+
+    def get_entry(self, key):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return super().get_entry(key)
+
+
+class TestAsyncCacheAdapter:
+    @pytest.mark.asyncio
+    async def test_memory_cache_runs_inline(self):
+        cache = as_async_cache(MemoryCache())
+        assert isinstance(cache, AsyncCacheAdapter)
+        assert not cache.offload
+
+        await cache.aset("works:W1", {"id": "W1"}, 60)
+        assert await cache.aget("works:W1") == {"id": "W1"}
+        await cache.adelete("works:W1")
+        assert await cache.aget_entry("works:W1") is None
+
+    @pytest.mark.asyncio
+    async def test_sqlite_cache_is_offloaded(self, tmp_path):
+        cache = as_async_cache(SQLiteCache(tmp_path / "cache.db"))
+        assert cache.offload
+
+        await cache.aset_many({"works:W1": 1, "works:W2": 2}, 60)
+        assert await cache.aget_many(["works:W1", "works:W3"]) == {
+            "works:W1": 1
+        }
+        entry = await cache.aget_entry("works:W2")
+        assert entry is not None
+        assert entry.data == 2
+
+    def test_async_caches_are_returned_unchanged(self):
+        cache = AsyncCacheAdapter(MemoryCache())
+        assert isinstance(cache, AsyncBaseCache)
+        assert as_async_cache(cache) is cache
+
+    @pytest.mark.asyncio
+    async def test_slow_backend_does_not_block_the_loop(self):
+        manager = CacheManager(OpenAlexConfig(cache_enabled=True))
+        slow = _SlowCache(delay=0.2)
+        manager._cache = slow
+        manager._acache = AsyncCacheAdapter(slow)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        async def fetch():
+            return {"id": "W1"}
+
+        task = asyncio.create_task(ticker())
+        try:
+            await manager.aget_or_fetch("works", fetch, "W1")
+        finally:
+            task.cancel()
+
+        assert ticks >= 5
+        assert threading.current_thread().name not in slow.threads
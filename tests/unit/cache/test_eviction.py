@@ -0,0 +1,131 @@
+import pytest
+
+from openalex import OpenAlexConfig
+from openalex.cache import MemoryCache, SmartMemoryCache
+from openalex.cache.eviction import EVICTION_POLICIES, create_policy
+from openalex.cache.manager import CacheManager
+
+
+def _scan(cache, count, prefix="scan"):
+    """Read then store ``count`` one-off keys, like a streaming harvest."""
+    for i in range(count):
+        key = f"{prefix}{i}"
+        if cache.get(key) is None:
+            cache.set(key, i, 60)
+
+
+class TestEvictionPolicies:
+    def test_lru_evicts_least_recently_used(self):
+        cache = MemoryCache(max_size=2, policy="lru")
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.set("c", 3, 60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["eviction_policy"] == "lru"
+
+    def test_overwrite_does_not_evict(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.set("a", 10, 60)
+
+        assert (cache.get("a"), cache.get("b")) == (10, 2)
+        assert cache.stats()["evictions"] == 0
+
+    def test_lfu_evicts_least_frequently_used(self):
+        cache = MemoryCache(max_size=2, policy="lfu")
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.set("c", 3, 60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        cache.delete("a")
+        cache.set("d", 4, 60)
+        assert cache.get("c") == 3
+
+    @pytest.mark.parametrize("policy", ["lfu", "tinylfu"])
+    def test_hot_entries_survive_scans(self, policy):
+        cache = MemoryCache(max_size=100, policy=policy)
+        hot = [f"I{i}" for i in range(10)]
+        for key in hot:
+            cache.set(key, key, 60)
+            for _ in range(5):
+                cache.get(key)
+
+        _scan(cache, 1000)
+
+        assert all(cache.get(key) == key for key in hot)
+        assert len(cache._cache) == 100
+
+    def test_lru_is_flushed_by_scans(self):
+        cache = MemoryCache(max_size=100, policy="lru")
+        cache.set("I1", "I1", 60)
+        cache.get("I1")
+
+        _scan(cache, 1000)
+
+        assert cache.get("I1") is None
+
+    def test_tinylfu_reports_admission_stats(self):
+        cache = SmartMemoryCache(max_size=100, policy="tinylfu")
+        cache.set("hot", 1, 60)
+        for _ in range(3):
+            cache.get("hot")
+        _scan(cache, 300)
+
+        policy_stats = cache.stats()["policy"]
+        assert policy_stats["rejected"] > 0
+        assert policy_stats["window_hits"] + policy_stats["main_hits"] == 3
+        assert (
+            policy_stats["window_size"]
+            + policy_stats["probation_size"]
+            + policy_stats["protected_size"]
+        ) == 100
+
+    @pytest.mark.parametrize("policy", sorted(EVICTION_POLICIES))
+    def test_policies_report_their_hit_rate(self, policy):
+        cache = MemoryCache(max_size=10, policy=policy)
+        cache.set("a", 1, 60)
+        cache.set("a", 2, 60)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.get("c")
+
+        policy_stats = cache.stats()["policy"]
+        assert (policy_stats["hits"], policy_stats["misses"]) == (2, 2)
+        assert policy_stats["hit_rate"] == 0.5
+
+        cache.clear()
+        assert cache.stats()["policy"]["hit_rate"] == 0
+
+    @pytest.mark.parametrize("policy", sorted(EVICTION_POLICIES))
+    def test_policies_stay_consistent_with_cache(self, policy):
+        cache = MemoryCache(max_size=10, policy=policy)
+        for i in range(200):
+            key = f"k{i % 37}"
+            if i % 5 == 0:
+                cache.delete(key)
+            elif cache.get(key) is None:
+                cache.set(key, i, 60)
+            assert len(cache._cache) <= 10
+
+        cache.clear()
+        assert cache._policy.victim() is None
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="Unknown eviction policy"):
+            create_policy("mru", 10)
+
+    def test_policy_selected_from_config(self):
+        config = OpenAlexConfig(
+            cache_enabled=True, cache_eviction_policy="tinylfu"
+        )
+        assert CacheManager(config).stats()["eviction_policy"] == "tinylfu"
@@ -0,0 +1,328 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from openalex import OpenAlexConfig
+from openalex.cache import FetchResult
+from openalex.cache.base import CacheEntry
+from openalex.cache.manager import CacheManager
+from openalex.exceptions import NotFoundError
+
+
+def _manager(**overrides):
+    config = OpenAlexConfig(
+        cache_enabled=True, cache_ttl=0.05, cache_stale_ttl=60, **overrides
+    )
+    return CacheManager(config)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestStaleWhileRevalidate:
+    def test_stale_entry_is_served_while_refreshing(self):
+        manager = _manager()
+        manager.get_or_fetch("works", lambda: {"v": 1}, "W1")
+        time.sleep(0.1)
+
+        release = threading.Event()
+
+        def slow_fetch():
+            release.wait(5)
+            return {"v": 2}
+
+        assert manager.get_or_fetch("works", slow_fetch, "W1") == {"v": 1}
+        assert manager.get_or_fetch("works", slow_fetch, "W1") == {"v": 1}
+        release.set()
+        _wait_for(lambda: manager.stats()["refreshes"] == 1)
+
+        assert manager.get_or_fetch("works", slow_fetch, "W1") == {"v": 2}
+        stats = manager.stats()
+        assert (stats["stale_hits"], stats["refreshes"]) == (1, 1)
+
+    def test_failed_refresh_keeps_stale_value(self):
+        manager = _manager()
+        manager.get_or_fetch("works", lambda: {"v": 1}, "W1")
+        time.sleep(0.1)
+
+        def failing_fetch():
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        assert manager.get_or_fetch("works", failing_fetch, "W1") == {"v": 1}
+        _wait_for(lambda: manager.stats()["refresh_failures"] == 1)
+        assert manager.get_or_fetch("works", failing_fetch, "W1") == {"v": 1}
+
+    def test_entries_expire_after_stale_window(self):
+        manager = CacheManager(
+            OpenAlexConfig(cache_enabled=True, cache_ttl=0.01)
+        )
+        manager.get_or_fetch("works", lambda: {"v": 1}, "W1")
+        time.sleep(0.05)
+
+        assert manager.get_or_fetch("works", lambda: {"v": 2}, "W1") == {"v": 2}
+        assert manager.stats()["stale_hits"] == 0
+
+    @pytest.mark.parametrize("extended", [False, True])
+    def test_entries_kept_past_the_stale_window(self, extended):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True, cache_ttl=0.05, cache_stale_ttl=1
+            )
+        )
+        now = time.time()
+        manager.cache.set_entry(
+            "works:W1",
+            CacheEntry(
+                {"v": 1}, now + 60, created_at=now - 10, extended=extended
+            ),
+        )
+
+        value = manager.get_or_fetch("works", lambda: {"v": 2}, "W1")
+
+        # Only an adaptive extension keeps the entry servable while stale
+        assert value == ({"v": 1} if extended else {"v": 2})
+        _wait_for(lambda: manager.get_or_fetch("works", dict, "W1") == {"v": 2})
+
+    def test_retained_entry_is_refetched_without_revalidation(self):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True, cache_ttl=0.05, cache_revalidate_ttl=60
+            )
+        )
+        first = FetchResult({"v": 1}, {"ETag": '"a"'})
+        manager.get_or_fetch("works", lambda: first, "W1")
+        time.sleep(0.1)
+
+        assert manager.get_or_fetch("works", lambda: {"v": 2}, "W1") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_async_refreshes_in_a_task(self):
+        manager = _manager()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return {"v": calls}
+
+        assert await manager.aget_or_fetch("works", fetch, "W1") == {"v": 1}
+        await asyncio.sleep(0.1)
+
+        stale = await asyncio.gather(
+            *(manager.aget_or_fetch("works", fetch, "W1") for _ in range(5))
+        )
+        assert stale == [{"v": 1}] * 5
+        while manager.stats()["refreshes"] == 0:
+            await asyncio.sleep(0.01)
+
+        assert calls == 2
+        assert await manager.aget_or_fetch("works", fetch, "W1") == {"v": 2}
+
+
+class TestConditionalRevalidation:
+    def test_expired_entry_is_revalidated_with_its_validators(self):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True, cache_ttl=0.05, cache_revalidate_ttl=60
+            )
+        )
+        seen = []
+
+        def revalidate(headers):
+            seen.append(headers)
+            return FetchResult(not_modified=True)
+
+        first = FetchResult({"v": 1}, {"ETag": '"a"'})
+        assert manager.get_or_fetch("works", lambda: first, "W1") == {"v": 1}
+        time.sleep(0.1)
+
+        for _ in range(2):
+            value = manager.get_or_fetch(
+                "works", lambda: {"v": 2}, "W1", revalidate_func=revalidate
+            )
+            assert value == {"v": 1}
+        assert seen == [{"If-None-Match": '"a"'}]
+        assert manager.stats()["not_modified"] == 1
+
+    def test_changed_entity_replaces_the_entry(self):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True, cache_ttl=0.05, cache_revalidate_ttl=60
+            )
+        )
+        first = FetchResult({"v": 1}, {"ETag": '"a"'})
+        manager.get_or_fetch("works", lambda: first, "W1")
+        time.sleep(0.1)
+
+        def revalidate(_headers):
+            return FetchResult({"v": 2}, {"ETag": '"b"'})
+
+        value = manager.get_or_fetch(
+            "works", lambda: None, "W1", revalidate_func=revalidate
+        )
+        assert value == {"v": 2}
+        entry = manager.cache.get_entry("works:W1")
+        assert entry.validators == {"ETag": '"b"'}
+
+    @pytest.mark.asyncio
+    async def test_async_revalidation(self):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True, cache_ttl=0.05, cache_revalidate_ttl=60
+            )
+        )
+
+        async def fetch():
+            return FetchResult({"v": 1}, {"Last-Modified": "yesterday"})
+
+        async def revalidate(headers):
+            assert headers == {"If-Modified-Since": "yesterday"}
+            return FetchResult(not_modified=True)
+
+        await manager.aget_or_fetch("works", fetch, "W1")
+        await asyncio.sleep(0.1)
+
+        value = await manager.aget_or_fetch(
+            "works", fetch, "W1", revalidate_func=revalidate
+        )
+        assert value == {"v": 1}
+        assert manager.stats()["revalidations"] == 1
+
+
+class TestNegativeCaching:
+    def test_disabled_by_default(self):
+        manager = CacheManager(OpenAlexConfig(cache_enabled=True))
+        manager.set_missing("works", ["W1"])
+
+        assert manager.lookup_many("works", ["W1"]) == ({}, set())
+
+    def test_missing_entries_expire_after_negative_ttl(self):
+        manager = CacheManager(
+            OpenAlexConfig(cache_enabled=True, cache_negative_ttl=0.05)
+        )
+        manager.set_missing("works", ["W1"])
+        manager.set_many("works", {"W2": {"id": "W2"}})
+
+        assert manager.lookup_many("works", ["W1", "W2"]) == (
+            {"W2": {"id": "W2"}},
+            {"W1"},
+        )
+        assert manager.get_many("works", ["W1"]) == {}
+        time.sleep(0.1)
+        assert manager.lookup_many("works", ["W1"]) == ({}, set())
+
+    def test_lookups_leave_stale_entries_pending(self):
+        manager = _manager(cache_negative_ttl=60)
+        manager.set_many("works", {"W1": {"id": "W1"}})
+        manager.set_missing("works", ["W404"])
+        time.sleep(0.1)
+        manager.set_many("works", {"W2": {"id": "W2"}})
+
+        assert manager.lookup_many("works", ["W1", "W2", "W404"]) == (
+            {"W2": {"id": "W2"}},
+            {"W404"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_lookups_leave_stale_entries_pending(self):
+        manager = _manager()
+        await manager.aset_many("works", {"W1": {"id": "W1"}})
+        await asyncio.sleep(0.1)
+        await manager.aset_many("works", {"W2": {"id": "W2"}})
+
+        found, missing = await manager.alookup_many("works", ["W1", "W2"])
+        assert (found, missing) == ({"W2": {"id": "W2"}}, set())
+
+    @pytest.mark.asyncio
+    async def test_async_not_found_is_cached(self):
+        manager = CacheManager(
+            OpenAlexConfig(cache_enabled=True, cache_negative_ttl=60)
+        )
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            raise NotFoundError
+
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                await manager.aget_or_fetch("works", fetch, "W1")
+        assert calls == 1
+
+
+class TestProjectedHits:
+    def test_select_is_projected_from_full_entity(self):
+        manager = CacheManager(OpenAlexConfig(cache_enabled=True))
+        manager.set_many("works", {"W1": {"id": "W1", "title": "T", "x": 1}})
+
+        def fetch():
+            raise AssertionError
+
+        value = manager.get_or_fetch(
+            "works", fetch, "W1", params={"select": "id,title"}
+        )
+        assert value == {"id": "W1", "title": "T"}
+        assert manager.stats()["projected_hits"] == 1
+
+    def test_narrower_select_uses_wider_select_entry(self):
+        manager = CacheManager(OpenAlexConfig(cache_enabled=True))
+        wide = {"select": ["id", "title", "doi"]}
+        manager.get_or_fetch(
+            "works",
+            lambda: {"id": "W1", "title": "T", "doi": "d"},
+            "W1",
+            params=wide,
+        )
+
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"id": "W1", "cited_by_count": 3}
+
+        narrow = manager.get_or_fetch(
+            "works", fetch, "W1", params={"select": ["doi"]}
+        )
+        assert narrow == {"doi": "d"}
+        assert calls == []
+
+        manager.get_or_fetch(
+            "works", fetch, "W1", params={"select": ["id", "cited_by_count"]}
+        )
+        assert calls == [1]
+
+    def test_stale_superset_is_not_projected(self):
+        manager = _manager()
+        manager.set_many("works", {"W1": {"id": "W1", "title": "old"}})
+        time.sleep(0.1)
+
+        value = manager.get_or_fetch(
+            "works",
+            lambda: {"id": "W1"},
+            "W1",
+            params={"select": "id"},
+        )
+        assert value == {"id": "W1"}
+        assert manager.stats()["projected_hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_select_is_projected(self):
+        manager = CacheManager(OpenAlexConfig(cache_enabled=True))
+        manager.set_many("works", {"W1": {"id": "W1", "title": "T"}})
+
+        async def fetch():
+            raise AssertionError
+
+        value = await manager.aget_or_fetch(
+            "works", fetch, "W1", params={"select": ["title"]}
+        )
+        assert value == {"title": "T"}
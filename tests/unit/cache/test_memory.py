@@ -0,0 +1,323 @@
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+
+from openalex import OpenAlexConfig, Works
+from openalex.cache import (
+    ExpirySweeper,
+    MemoryCache,
+    SmartMemoryCache,
+    SQLiteCache,
+)
+from openalex.cache.base import CacheEntry, FetchResult
+from openalex.cache.manager import NOT_FOUND, CacheManager, get_cache_manager
+from openalex.metrics import get_metrics, reset_metrics
+
+
+def _payload(n):
+    """A response body of roughly ``n`` bytes."""
+    return {"id": "W1", "abstract": "x" * (n - 25)}
+
+
+class TestByteBudget:
+    def test_stats_report_body_bytes(self):
+        cache = MemoryCache(max_bytes=10_000)
+        body = _payload(100)
+        cache.set("a", body, 60)
+        cache.set("b", "plain", 60)
+
+        stats = cache.stats()
+        assert len(json.dumps(body, separators=(",", ":"))) == 100
+        assert stats["bytes"] == 100 + len("plain")
+        assert stats["max_bytes"] == 10_000
+
+    def test_known_body_length_is_not_re_encoded(self, monkeypatch):
+        def fail(value):
+            raise AssertionError("payload encoded")
+
+        monkeypatch.setattr("openalex.cache.memory._estimate_size", fail)
+        budgeted = MemoryCache(max_bytes=10_000)
+        budgeted.set_entry("a", CacheEntry.create(_payload(300), 60, 300))
+        unbudgeted = MemoryCache()
+        unbudgeted.set("a", _payload(300), 60)
+
+        assert budgeted.stats()["bytes"] == 300
+        assert unbudgeted.stats()["bytes"] == 0
+
+    def test_manager_sizes_entries_by_response_body(self):
+        config = OpenAlexConfig(cache_enabled=True, cache_max_bytes=10_000)
+        manager = CacheManager(config)
+        body = _payload(300)
+
+        manager.get_or_fetch(
+            "works", lambda: FetchResult(body, size=1234), "W1"
+        )
+
+        assert manager.stats()["bytes"] == 1234
+        assert manager.get_many("works", ["W1"]) == {"W1": body}
+
+    def test_evicts_to_stay_within_budget(self):
+        cache = MemoryCache(max_size=100, max_bytes=1000)
+        for key in "abcdef":
+            cache.set(key, _payload(300), 60)
+
+        stats = cache.stats()
+        assert stats["bytes"] == 900
+        assert stats["size"] == 3
+        assert stats["evictions"] == 3
+        assert cache.get("a") is None
+        assert cache.get("f") is not None
+
+    def test_overwrite_and_delete_update_bytes(self):
+        cache = SmartMemoryCache(max_bytes=1000)
+        cache.set("a", _payload(300), 60)
+        cache.set("b", _payload(300), 60)
+        cache.set("a", _payload(600), 60)
+
+        assert cache.stats()["bytes"] == 900
+        assert cache.stats()["evictions"] == 0
+
+        cache.set("a", _payload(800), 60)
+        assert cache.get("b") is None
+        assert cache.stats()["bytes"] == 800
+
+        cache.delete("a")
+        assert cache.stats()["bytes"] == 0
+
+    def test_entry_larger_than_budget_is_not_cached(self):
+        cache = MemoryCache(max_bytes=100)
+        cache.set("small", _payload(50), 60)
+        cache.set("small", _payload(500), 60)
+
+        assert cache.get("small") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_entity_pages_are_sized_by_body_length(self):
+        config = OpenAlexConfig(cache_enabled=True, cache_max_bytes=100_000)
+        response = httpx.Response(
+            200,
+            json={"meta": {"count": 1}, "results": [{"id": "W1"}]},
+            request=httpx.Request("GET", "https://api.openalex.org/works"),
+        )
+
+        with patch("httpx.Client.request", return_value=response):
+            Works(config=config).filter(publication_year=2020).get()
+
+        stats = get_cache_manager(config).stats()
+        assert stats["bytes"] == len(response.content)
+
+    def test_budget_from_config(self):
+        config = OpenAlexConfig(cache_enabled=True, cache_max_bytes=4096)
+        stats = CacheManager(config).stats()
+        assert stats["max_bytes"] == 4096
+
+
+class TestCompressedEntries:
+    def test_large_entries_are_compressed_until_read(self):
+        reset_metrics()
+        cache = MemoryCache(compress_threshold=500)
+        small = {"id": "P1"}
+        large = _payload(5000)
+        cache.set("small", small, 60)
+        cache.set("large", large, 60)
+
+        stats = cache.stats()
+        assert stats["compressed_entries"] == 1
+        assert stats["bytes"] < 500
+        assert cache.get("small") is small
+        assert cache.get("large") == large
+        assert len(get_metrics().cache_decode_times) == 1
+        assert "avg_decode_time_ms" in get_metrics().to_dict()["cache"]
+
+    def test_non_json_values_are_kept_as_objects(self):
+        cache = MemoryCache(compress_threshold=0)
+        value = {"ids": {1, 2}}
+        cache.set("a", value, 60)
+
+        assert cache.get("a") is value
+        assert cache.stats()["compressed_entries"] == 0
+
+    def test_compression_stretches_a_byte_budget(self):
+        plain = MemoryCache(max_size=100, max_bytes=20_000)
+        packed = MemoryCache(
+            max_size=100, max_bytes=20_000, compress_threshold=1000
+        )
+        for cache in (plain, packed):
+            for i in range(50):
+                cache.set(f"W{i}", _payload(4000), 60)
+
+        assert plain.stats()["size"] == 5
+        assert packed.stats()["size"] == 50
+
+    def test_threshold_from_config(self):
+        config = OpenAlexConfig(
+            cache_enabled=True, cache_compress_threshold=100
+        )
+        manager = CacheManager(config)
+        manager.set_many("works", {"W1": _payload(1000)})
+
+        assert manager.stats()["compressed_entries"] == 1
+        assert manager.get_many("works", ["W1"]) == {"W1": _payload(1000)}
+
+
+class TestActiveExpiry:
+    def test_expire_drops_only_expired_entries(self):
+        cache = MemoryCache()
+        for i in range(50):
+            cache.set(f"old{i}", i, 0.01)
+        cache.set("new", 1, 60)
+        time.sleep(0.05)
+
+        assert cache.expire() == 50
+        stats = cache.stats()
+        assert (stats["size"], stats["expired"]) == (1, 50)
+        assert cache.get("new") == 1
+
+    def test_replaced_entries_keep_their_new_expiry(self):
+        cache = MemoryCache()
+        cache.set("a", 1, 0.01)
+        cache.set("a", 2, 60)
+        time.sleep(0.05)
+
+        assert cache.expire() == 0
+        assert cache.get("a") == 2
+
+    def test_adaptive_ttl_extension_is_respected(self):
+        cache = SmartMemoryCache(base_ttl=0.05, ttl_multiplier=100)
+        cache.set("hot", 1)
+        for _ in range(3):
+            cache.get("hot")
+        time.sleep(0.1)
+
+        assert cache.expire() == 0
+        assert cache.get("hot") == 1
+        assert cache.get_entry("hot").extended
+
+    def test_not_found_entries_keep_their_negative_ttl(self):
+        cache = SmartMemoryCache(base_ttl=300, max_ttl=3600)
+        cache.set("works:W404", NOT_FOUND, 1)
+        for _ in range(10):
+            entry = cache.get_entry("works:W404")
+
+        assert entry.expires_at - entry.created_at < 2
+        assert not entry.extended
+
+    def test_adaptive_ttl_never_shortens_an_entry(self):
+        cache = SmartMemoryCache(base_ttl=300, max_ttl=3600)
+        week = 7 * 86400
+        cache.set("publishers:P1", 1, week)
+        cache.set_entry("publishers:P2", CacheEntry.create(2, week))
+        for _ in range(5):
+            cache.get("publishers:P1")
+            cache.get("publishers:P2")
+
+        for key in ("publishers:P1", "publishers:P2"):
+            remaining = cache.get_entry(key).expires_at - time.time()
+            assert remaining > week - 60
+
+    def test_extensions_are_rescheduled_by_the_sweep(self):
+        cache = SmartMemoryCache(base_ttl=0.05, ttl_multiplier=3, max_ttl=0.15)
+        cache.set("hot", 1)
+        for _ in range(1000):
+            cache.get("hot")
+
+        assert len(cache._expiry) == 1
+        time.sleep(0.1)
+        assert cache.expire() == 0
+        assert len(cache._expiry) == 1
+        time.sleep(0.1)
+        assert cache.expire() == 1
+
+    def test_adaptive_ttls_are_dropped_with_their_entries(self):
+        cache = SmartMemoryCache(max_size=2)
+        cache.set("expired", 1, 0.01)
+        cache.set("deleted", 2, 60)
+        cache.delete("deleted")
+        time.sleep(0.05)
+        cache.expire()
+        for i in range(3):
+            cache.set(f"k{i}", i, 60)
+
+        assert sorted(cache._key_ttls) == ["k1", "k2"]
+        assert cache.stats()["adaptive_keys"] == 2
+
+    def test_superseded_records_are_compacted(self):
+        cache = MemoryCache()
+        for _ in range(5000):
+            cache.set("a", 1, 60)
+
+        assert len(cache._expiry) <= 1001
+
+    def test_sqlite_expire_deletes_rows(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("a", 1, 0.01)
+        cache.set("b", 2, 60)
+        time.sleep(0.05)
+
+        assert cache.expire() == 1
+        assert cache.stats()["size"] == 1
+
+    def test_sweeper_expires_in_background(self):
+        cache = MemoryCache()
+        sweeper = ExpirySweeper(cache, interval=0.01)
+        sweeper.start()
+        try:
+            cache.set("a", 1, 0.01)
+            deadline = time.monotonic() + 5
+            while cache.stats()["size"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sweeper.stop()
+
+        assert cache.stats()["size"] == 0
+        assert sweeper.expired == 1
+        assert not sweeper.running
+
+    def test_managers_share_one_sweeper_thread(self):
+        def sweeper_threads():
+            return sum(
+                thread.name == "openalex-cache-sweeper"
+                for thread in threading.enumerate()
+            )
+
+        managers = [
+            get_cache_manager(
+                OpenAlexConfig(
+                    cache_enabled=True,
+                    cache_ttl=0.01,
+                    cache_sweep_interval=0.01,
+                )
+            )
+            for _ in range(5)
+        ]
+        for manager in managers:
+            manager.set_many("works", {"W1": {"id": "W1"}})
+        deadline = time.monotonic() + 5
+        while any(m.stats()["size"] for m in managers):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert sweeper_threads() == 1
+
+        for manager in managers:
+            manager.close()
+        while sweeper_threads():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    def test_manager_starts_sweeper(self):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True, cache_ttl=0.01, cache_sweep_interval=0.01
+            )
+        )
+        manager.set_many("works", {"W1": {"id": "W1"}})
+        deadline = time.monotonic() + 5
+        while manager.stats()["size"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        stats = manager.stats()
+        assert stats["size"] == 0
+        assert stats["sweeps"] > 0
@@ -0,0 +1,119 @@
+import threading
+
+from openalex import OpenAlexConfig
+from openalex.cache import (
+    MemoryCache,
+    ShardedMemoryCache,
+    SmartMemoryCache,
+    SQLiteCache,
+    StripedLock,
+    TieredCache,
+)
+from openalex.cache.manager import CacheManager
+
+
+class TestShardedMemoryCache:
+    def test_keys_live_in_one_segment(self):
+        # Each segment holds all 20 keys, so none is evicted however they hash
+        cache = ShardedMemoryCache.create(MemoryCache, 4, max_size=80)
+        for i in range(20):
+            cache.set(f"works:W{i}", {"id": i}, 60)
+
+        for i in range(20):
+            key = f"works:W{i}"
+            assert cache.get(key) == {"id": i}
+            holders = [s for s in cache.segments if s.get(key) is not None]
+            assert holders == [cache.segment_for(key)]
+
+        cache.delete("works:W0")
+        assert cache.get("works:W0") is None
+
+    def test_budgets_are_split_between_segments(self):
+        cache = ShardedMemoryCache.create(
+            SmartMemoryCache, 4, max_size=10, max_bytes=1000, base_ttl=60
+        )
+        stats = cache.stats()
+
+        assert stats["shards"] == 4
+        assert stats["max_size"] == 12
+        assert stats["max_bytes"] == 1000
+        assert all(s.stats()["max_size"] == 3 for s in cache.segments)
+
+    def test_stats_are_summed(self):
+        cache = ShardedMemoryCache.create(MemoryCache, 3, max_size=30)
+        cache.set("a", 1, 60)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_concurrent_writers_keep_every_key(self):
+        cache = ShardedMemoryCache.create(MemoryCache, 8, max_size=8000)
+
+        def writer(start):
+            for i in range(start, start + 500):
+                cache.set(f"k{i}", i, 60)
+                assert cache.get(f"k{i}") == i
+
+        threads = [
+            threading.Thread(target=writer, args=(n * 500,)) for n in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.stats()["size"] == 4000
+
+    def test_segment_evictions_demote_in_tiered_cache(self, tmp_path):
+        l1 = ShardedMemoryCache.create(MemoryCache, 2, max_size=2)
+        cache = TieredCache(
+            l1, SQLiteCache(tmp_path / "l2.db"), write_through=False
+        )
+        for i in range(6):
+            cache.set(f"works:W{i}", {"id": i}, 60)
+
+        assert cache.stats()["demotions"] >= 4
+        for i in range(6):
+            assert cache.get(f"works:W{i}") == {"id": i}
+
+    def test_manager_uses_sharded_cache(self):
+        manager = CacheManager(
+            OpenAlexConfig(cache_enabled=True, cache_shards=4)
+        )
+
+        assert isinstance(manager.cache, ShardedMemoryCache)
+        assert manager.get_or_fetch("works", lambda: {"v": 1}, "W1") == {"v": 1}
+        assert manager.get_or_fetch("works", lambda: {"v": 2}, "W1") == {"v": 1}
+        assert manager.stats()["shards"] == 4
+
+
+class TestStripedLock:
+    def test_table_is_bounded(self):
+        locks = StripedLock(8)
+        distinct = {id(locks.for_key(f"works:W{i}")) for i in range(1000)}
+
+        assert len(locks) == 8
+        assert len(distinct) <= 8
+        assert locks.for_key("works:W1") is locks.for_key("works:W1")
+
+    def test_stripe_is_released_during_fetch(self):
+        manager = CacheManager(OpenAlexConfig(cache_enabled=True))
+        lock = manager._locks.for_key("works:W1")
+        free = []
+
+        def try_lock():
+            free.append(lock.acquire(blocking=False))
+            if free[-1]:
+                lock.release()
+
+        def fetch():
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+            return {"id": "W1"}
+
+        assert manager.get_or_fetch("works", fetch, "W1") == {"id": "W1"}
+        assert free == [True]
@@ -0,0 +1,249 @@
+import time
+
+import pytest
+
+from openalex import OpenAlexConfig
+from openalex.cache import (
+    MemoryCache,
+    ShardedMemoryCache,
+    SQLiteCache,
+    TieredCache,
+)
+from openalex.cache.base import CacheEntry
+from openalex.cache.manager import NOT_FOUND, CacheManager
+from openalex.cache.snapshot import (
+    iter_snapshot,
+    read_snapshot,
+    write_snapshot,
+)
+
+
+def _manager(**options):
+    return CacheManager(OpenAlexConfig(cache_enabled=True, **options))
+
+
+class TestSnapshotFormat:
+    def test_round_trip_keeps_values_ttls_and_validators(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        entries = [
+            ("works:W1", CacheEntry.create({"id": "W1"}, 60)),
+            ("works:W2", CacheEntry.create(NOT_FOUND, 30)),
+            (
+                "works:W3",
+                CacheEntry.create({"id": "W3"}, 90, validators={"ETag": "x"}),
+            ),
+            ("works:W4", CacheEntry.create({"id": "W4"}, -1)),
+        ]
+
+        assert write_snapshot(path, entries) == 3
+        loaded = dict(read_snapshot(path))
+
+        assert set(loaded) == {"works:W1", "works:W2", "works:W3"}
+        assert loaded["works:W1"].data == {"id": "W1"}
+        assert loaded["works:W1"].size == len('{"id":"W1"}')
+        assert loaded["works:W2"].data == NOT_FOUND
+        assert 59 < loaded["works:W1"].expires_at - time.time() <= 60
+        assert loaded["works:W3"].validators == {"ETag": "x"}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_entries_keep_their_age(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.snap"
+        created = time.time() - 100
+        entry = CacheEntry(data=1, expires_at=created + 160, created_at=created)
+        write_snapshot(path, [("a", entry)])
+        later = time.time() + 20
+        monkeypatch.setattr("openalex.cache.snapshot.time.time", lambda: later)
+
+        ((_, loaded),) = read_snapshot(path)
+
+        assert loaded.created_at == pytest.approx(created, abs=1)
+        assert loaded.expires_at == pytest.approx(created + 160, abs=1)
+
+    def test_time_since_export_is_subtracted(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.snap"
+        write_snapshot(
+            path,
+            [
+                ("a", CacheEntry.create(1, 10)),
+                ("b", CacheEntry.create(2, 100)),
+            ],
+        )
+        later = time.time() + 50
+        monkeypatch.setattr("openalex.cache.snapshot.time.time", lambda: later)
+
+        loaded = list(read_snapshot(path))
+
+        assert [key for key, _ in loaded] == ["b"]
+        assert loaded[0][1].expires_at - later == pytest.approx(50, abs=1)
+
+    def test_large_snapshots_stream_in_chunks(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        body = "x" * 500
+        entries = (
+            (f"works:W{i}", CacheEntry.create({"i": i, "body": body}, 60))
+            for i in range(3000)
+        )
+
+        assert write_snapshot(path, entries) == 3000
+        assert len(read_snapshot(path)) == 3000
+
+    @pytest.mark.parametrize(
+        ("content", "message"),
+        [
+            (b"nope", "not a cache snapshot"),
+            (b"XXXX" + bytes(10), "not a cache snapshot"),
+            (b"OACS\x01\x00" + bytes(8), "unsupported cache snapshot version"),
+        ],
+    )
+    def test_invalid_files_are_rejected(self, tmp_path, content, message):
+        path = tmp_path / "bad.snap"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError, match=message):
+            read_snapshot(path)
+
+    def test_truncated_file_is_rejected(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        write_snapshot(
+            path,
+            ((f"k{i}", CacheEntry.create(i, 60)) for i in range(1000)),
+        )
+        path.write_bytes(path.read_bytes()[:-20])
+
+        with pytest.raises(ValueError, match="snapshot"):
+            read_snapshot(path)
+
+    def test_corrupt_checksum_is_rejected_before_any_entry(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        write_snapshot(path, [("a", CacheEntry.create(1, 60))])
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(ValueError, match="corrupt cache snapshot"):
+            next(iter_snapshot(path))
+
+    def test_failed_write_keeps_the_old_snapshot(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        write_snapshot(path, [("a", CacheEntry.create(1, 60))])
+
+        def entries():
+            yield "b", CacheEntry.create(2, 60)
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            write_snapshot(path, entries())
+
+        assert [key for key, _ in read_snapshot(path)] == ["a"]
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestManagerSnapshots:
+    def test_export_and_load_into_fresh_manager(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        source = _manager(cache_negative_ttl=60)
+        source.get_or_fetch("works", lambda: {"id": "W1"}, "W1")
+        source.set_missing("works", ["W404"])
+
+        assert source.export_snapshot(path) == 2
+
+        target = _manager(cache_negative_ttl=60)
+        assert target.load_snapshot(path) == 2
+        assert target.get_or_fetch(
+            "works", lambda: pytest.fail("fetched"), "W1"
+        ) == {"id": "W1"}
+        found, missing = target.lookup_many("works", ["W1", "W404"])
+        assert found == {"W1": {"id": "W1"}}
+        assert missing == {"W404"}
+
+    def test_truncated_snapshot_loads_nothing(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        body = "x" * 500
+        write_snapshot(
+            path,
+            (
+                (f"works:W{i}", CacheEntry.create({"body": body}, 60))
+                for i in range(3000)
+            ),
+        )
+        path.write_bytes(path.read_bytes()[:-2000])
+        target = _manager(cache_maxsize=5000)
+
+        with pytest.raises(ValueError, match="snapshot"):
+            target.load_snapshot(path)
+        assert target.stats()["size"] == 0
+
+    def test_load_streams_entries_into_the_cache(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.snap"
+        write_snapshot(
+            path, ((f"works:W{i}", CacheEntry.create(i, 60)) for i in range(50))
+        )
+        monkeypatch.setattr(
+            "openalex.cache.snapshot.read_snapshot",
+            lambda _: pytest.fail("snapshot decoded into a list"),
+        )
+        target = _manager()
+
+        assert target.load_snapshot(path) == 50
+        assert target.stats()["size"] == 50
+
+    def test_loaded_entries_keep_their_age(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        created = time.time() - 100
+        write_snapshot(
+            path,
+            [
+                (
+                    "works:W1",
+                    CacheEntry(
+                        data={"id": "W1"},
+                        expires_at=created + 200,
+                        created_at=created,
+                    ),
+                )
+            ],
+        )
+        target = _manager()
+
+        assert target.load_snapshot(path) == 1
+        entry = target.cache.get_entry("works:W1")
+        assert entry.created_at == pytest.approx(created, abs=1)
+
+    def test_disabled_manager_is_a_no_op(self, tmp_path):
+        manager = CacheManager(OpenAlexConfig(cache_enabled=False))
+
+        assert manager.export_snapshot(tmp_path / "cache.snap") == 0
+        assert not (tmp_path / "cache.snap").exists()
+
+
+class TestEntries:
+    def test_memory_entries_skip_expired_and_keep_stats(self):
+        cache = MemoryCache(compress_threshold=1)
+        cache.set("a", {"v": 1}, 60)
+        cache.set("b", {"v": 2}, -1)
+
+        assert [(k, e.data) for k, e in cache.entries()] == [("a", {"v": 1})]
+        assert cache.stats()["hits"] == 0
+
+    def test_sqlite_entries_page_through_rows(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("openalex.cache.sqlite.ENTRIES_PAGE", 3)
+        cache = SQLiteCache(tmp_path / "c.db", max_size=100)
+        for i in range(10):
+            cache.set(f"k{i}", i, 60)
+        cache.set("old", 0, -1)
+
+        assert sorted(e.data for _, e in cache.entries()) == list(range(10))
+
+    def test_sharded_and_tiered_entries(self, tmp_path):
+        sharded = ShardedMemoryCache.create(MemoryCache, 4, max_size=40)
+        for i in range(8):
+            sharded.set(f"k{i}", i, 60)
+        assert len(list(sharded.entries())) == 8
+
+        tiered = TieredCache(
+            MemoryCache(max_size=2), SQLiteCache(tmp_path / "l2.db")
+        )
+        for i in range(5):
+            tiered.set(f"k{i}", i, 60)
+        keys = [key for key, _ in tiered.entries()]
+        assert sorted(keys) == [f"k{i}" for i in range(5)]
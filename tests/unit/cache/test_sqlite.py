@@ -0,0 +1,175 @@
+import multiprocessing
+import sqlite3
+import time
+import zlib
+
+import pytest
+
+from openalex import OpenAlexConfig
+from openalex.cache import SQLiteCache
+from openalex.cache.manager import CacheManager
+
+
+def _write_keys(path, prefix):
+    cache = SQLiteCache(path, max_size=1000)
+    for i in range(50):
+        cache.set(f"works:{prefix}{i}", {"id": f"{prefix}{i}"}, 60)
+    cache.close()
+
+
+class TestSQLiteCache:
+    def test_round_trip_stores_compressed_json(self, tmp_path):
+        path = tmp_path / "cache.db"
+        cache = SQLiteCache(path)
+        payload = {"id": "W1", "title": "x" * 500, "authors": [1, 2, 3]}
+
+        cache.set("works:W1", payload, 60)
+
+        assert cache.get("works:W1") == payload
+        assert cache.get("works:W2") is None
+        with sqlite3.connect(path) as conn:
+            (blob,) = conn.execute(
+                "SELECT value FROM cache WHERE key = 'works:W1'"
+            ).fetchone()
+        assert len(blob) < 500
+        assert zlib.decompress(blob).startswith(b'{"id":"W1"')
+        stats = cache.stats()
+        assert stats["backend"] == "sqlite"
+        assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("works:W1", {"id": "W1"}, 0.01)
+        time.sleep(0.02)
+
+        assert cache.get("works:W1") is None
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_oldest_entries_beyond_max_size(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db", max_size=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key, 60)
+
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+        assert cache.stats()["evictions"] == 1
+
+    def test_size_is_checked_every_few_inserts(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.db"
+        cache = SQLiteCache(path, max_size=100)
+        counts = []
+        original = cache._evict
+
+        def counting_evict(conn, now):
+            counts.append(1)
+            original(conn, now)
+
+        monkeypatch.setattr(cache, "_evict", counting_evict)
+        for i in range(105):
+            cache.set(f"k{i}", i, 60)
+
+        assert len(counts) == 10
+        assert cache.stats()["size"] == 105
+        for i in range(105, 110):
+            cache.set(f"k{i}", i, 60)
+        assert cache.stats()["size"] == 100
+        with sqlite3.connect(path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN DELETE FROM cache WHERE expires_at < 0"
+            ).fetchall()
+        assert "cache_expires_at" in str(plan)
+
+    def test_shared_between_processes(self, tmp_path):
+        path = tmp_path / "cache.db"
+        SQLiteCache(path).close()
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_write_keys, args=(path, prefix))
+            for prefix in ("A", "B")
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+            assert worker.exitcode == 0
+
+        cache = SQLiteCache(path, max_size=1000)
+        assert cache.stats()["size"] == 100
+        assert cache.get("works:B49") == {"id": "B49"}
+
+
+class TestSQLiteCacheConfig:
+    def test_manager_uses_configured_backend(self, tmp_path):
+        path = tmp_path / "shared.db"
+        config = OpenAlexConfig(
+            cache_enabled=True, cache_backend="sqlite", cache_path=path
+        )
+        CacheManager(config).set_many("works", {"W1": {"id": "W1"}})
+
+        # A new manager (another run or worker) starts warm
+        manager = CacheManager(config.model_copy())
+        assert isinstance(manager.cache, SQLiteCache)
+        assert manager.get_many("works", ["W1"]) == {"W1": {"id": "W1"}}
+
+    def test_sqlite_backend_has_its_own_size(self, tmp_path):
+        config = OpenAlexConfig(
+            cache_enabled=True,
+            cache_backend="sqlite",
+            cache_path=tmp_path / "shared.db",
+            cache_sqlite_maxsize=50_000,
+        )
+
+        assert CacheManager(config).cache.stats()["max_size"] == 50_000
+
+    def test_rejects_unknown_backend(self):
+        with pytest.raises(ValueError, match="cache_backend"):
+            OpenAlexConfig(cache_backend="redis")
+
+
+class TestSQLiteValidators:
+    def test_validators_round_trip(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("works:W1", {"id": "W1"}, 60, {"ETag": '"v1"'})
+        cache.set("works:W2", {"id": "W2"}, 60)
+
+        assert cache.get_entry("works:W1").validators == {"ETag": '"v1"'}
+        assert cache.get_entry("works:W2").validators is None
+
+    def test_upgrades_files_without_validators(self, tmp_path):
+        path = tmp_path / "cache.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB NOT "
+                "NULL, expires_at REAL NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO cache VALUES (?, ?, ?, ?)",
+                ("works:W1", zlib.compress(b'"old"'), time.time() + 60, 0),
+            )
+        conn.close()
+
+        cache = SQLiteCache(path)
+        assert cache.get("works:W1") == "old"
+        cache.set("works:W2", "new", 60, {"ETag": '"v2"'})
+        assert cache.get_entry("works:W2").validators == {"ETag": '"v2"'}
+
+    def test_new_files_create_validators_column(self, tmp_path, monkeypatch):
+        def no_alter(conn):
+            raise AssertionError("fresh files must not be altered")
+
+        monkeypatch.setattr(
+            SQLiteCache, "_add_validators_column", staticmethod(no_alter)
+        )
+        cache = SQLiteCache(tmp_path / "cache.db")
+
+        cache.set("works:W1", {"id": "W1"}, 60, {"ETag": '"v1"'})
+        assert cache.get_entry("works:W1").validators == {"ETag": '"v1"'}
+
+    def test_concurrent_upgrade_tolerates_duplicate_column(self, tmp_path):
+        path = tmp_path / "cache.db"
+        SQLiteCache(path).close()
+
+        with sqlite3.connect(path) as conn:
+            # The column was added by another process in the meantime
+            SQLiteCache._add_validators_column(conn)
+        conn.close()
@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+from openalex import OpenAlexConfig
+from openalex.cache import MemoryCache, SQLiteCache, TieredCache
+from openalex.cache.base import CacheEntry
+from openalex.cache.manager import CacheManager
+
+
+def _tiered(tmp_path, l1_size=2, **kwargs):
+    return TieredCache(
+        MemoryCache(max_size=l1_size),
+        SQLiteCache(tmp_path / "l2.db"),
+        **kwargs,
+    )
+
+
+class TestTieredCache:
+    def test_writes_go_through_to_both_tiers(self, tmp_path):
+        cache = _tiered(tmp_path)
+        cache.set("works:W1", {"id": "W1"}, 60)
+
+        assert cache.l1.get("works:W1") == {"id": "W1"}
+        assert cache.l2.get("works:W1") == {"id": "W1"}
+        assert cache.get("works:W1") == {"id": "W1"}
+        assert cache.stats()["l1_hits"] == 1
+
+    def test_l2_hits_are_promoted_with_remaining_ttl(self, tmp_path):
+        cache = _tiered(tmp_path)
+        cache.l2.set("works:W1", {"id": "W1"}, 60)
+
+        assert cache.get("works:W1") == {"id": "W1"}
+        entry = cache.l1.get_entry("works:W1")
+        assert entry is not None
+        assert 0 < entry.expires_at - time.time() <= 60
+
+        cache.get("works:W1")
+        stats = cache.stats()
+        assert (stats["l1_hits"], stats["l2_hits"]) == (1, 1)
+        assert stats["promotions"] == 1
+
+    def test_promotion_keeps_age_and_validators(self, tmp_path):
+        cache = _tiered(tmp_path)
+        created = time.time() - 30
+        cache.l2.set_entry(
+            "works:W1",
+            CacheEntry(
+                data={"id": "W1"},
+                expires_at=created + 60,
+                created_at=created,
+                validators={"ETag": '"v1"'},
+            ),
+        )
+
+        cache.get("works:W1")
+        entry = cache.l1.get_entry("works:W1")
+        assert entry.created_at == pytest.approx(created)
+        assert entry.expires_at == pytest.approx(created + 60)
+        assert entry.validators == {"ETag": '"v1"'}
+
+    def test_l1_evictions_are_demoted(self, tmp_path):
+        cache = _tiered(tmp_path, l1_size=2, write_through=False)
+        cache.set("works:W0", {"id": "W0"}, 60, {"ETag": '"v0"'})
+        created = cache.l1.get_entry("works:W0").created_at
+        assert cache.l2.get("works:W0") is None
+        for i in range(1, 3):
+            cache.set(f"works:W{i}", {"id": f"W{i}"}, 60)
+
+        assert cache.l1.get("works:W0") is None
+        demoted = cache.l2.get_entry("works:W0")
+        assert demoted.data == {"id": "W0"}
+        assert demoted.created_at == pytest.approx(created)
+        assert demoted.validators == {"ETag": '"v0"'}
+        assert cache.stats()["demotions"] == 1
+
+    def test_write_through_skips_demotion(self, tmp_path, monkeypatch):
+        cache = _tiered(tmp_path, l1_size=2)
+        writes = []
+        monkeypatch.setattr(
+            cache.l2, "set_entry", lambda *args: writes.append(args)
+        )
+        for i in range(3):
+            cache.set(f"works:W{i}", {"id": f"W{i}"}, 60)
+
+        assert cache.l1.get("works:W0") is None
+        assert cache.get("works:W0") == {"id": "W0"}
+        assert writes == []
+        assert cache.stats()["demotions"] == 0
+
+    def test_misses_and_deletes_cover_both_tiers(self, tmp_path):
+        cache = _tiered(tmp_path)
+        cache.set("works:W1", {"id": "W1"}, 60)
+        cache.delete("works:W1")
+
+        assert cache.get("works:W1") is None
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["l1"]["size"] == stats["l2"]["size"] == 0
+
+    def test_manager_builds_tiered_backend(self, tmp_path):
+        config = OpenAlexConfig(
+            cache_enabled=True,
+            cache_backend="tiered",
+            cache_path=tmp_path / "l2.db",
+            cache_maxsize=1,
+        )
+        manager = CacheManager(config)
+        manager.set_many("works", {"W1": {"id": "W1"}, "W2": {"id": "W2"}})
+
+        assert isinstance(manager.cache, TieredCache)
+        assert manager.get_many("works", ["W1", "W2"]) == {
+            "W1": {"id": "W1"},
+            "W2": {"id": "W2"},
+        }
+        assert manager.stats()["backend"] == "tiered"
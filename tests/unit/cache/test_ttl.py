@@ -0,0 +1,194 @@
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from openalex import AsyncWorks, OpenAlexConfig, Works
+from openalex.cache.manager import CacheManager, get_cache_manager
+from openalex.cache.ttl import STABLE_ENTITY_TTLS, TTLPolicy
+
+DAY = 86400.0
+
+
+def _updated(days_ago):
+    when = datetime.now(UTC) - timedelta(days=days_ago)
+    return when.isoformat()
+
+
+class TestRules:
+    def test_most_specific_rule_wins(self):
+        policy = TTLPolicy(
+            60,
+            {
+                "works": 300,
+                "*:autocomplete": 30,
+                "works:autocomplete": 10,
+                "publishers": 7 * DAY,
+            },
+        )
+
+        assert policy.ttl("works") == 300
+        assert policy.ttl("works", "list") == 300
+        assert policy.ttl("works", "autocomplete") == 10
+        assert policy.ttl("authors", "autocomplete") == 30
+        assert policy.ttl("publishers", "group_by") == 7 * DAY
+        assert policy.ttl("authors") == 60
+
+    @pytest.mark.parametrize(
+        ("rules", "message"),
+        [
+            ({"planets": 5}, "unknown endpoint"),
+            ({"works:search": 5}, "unknown operation"),
+            ({"*": 5}, "needs an operation"),
+            ({"works": -1}, "negative"),
+        ],
+    )
+    def test_malformed_rules_are_rejected(self, rules, message):
+        with pytest.raises(ValueError, match=message):
+            TTLPolicy(60, rules)
+
+    def test_config_validates_rules(self):
+        with pytest.raises(ValidationError, match="unknown endpoint"):
+            OpenAlexConfig(cache_ttl_rules={"planets": 5})
+
+        config = OpenAlexConfig(cache_ttl_rules=dict(STABLE_ENTITY_TTLS))
+        assert TTLPolicy.from_config(config).ttl("concepts") == 30 * DAY
+
+
+class TestPayloadAge:
+    def test_disabled_by_default(self):
+        policy = TTLPolicy(60)
+
+        assert policy.for_payload(60, {"updated_date": _updated(365)}) == 60
+
+    def test_stable_payloads_live_longer_up_to_the_cap(self):
+        policy = TTLPolicy(60, age_factor=0.1, max_ttl=7 * DAY)
+
+        recent = policy.for_payload(60, {"updated_date": _updated(1)})
+        older = policy.for_payload(60, {"updated_date": _updated(20)})
+        ancient = policy.for_payload(60, {"updated_date": _updated(3650)})
+
+        assert recent == pytest.approx(0.1 * DAY, rel=0.01)
+        assert older == pytest.approx(2 * DAY, rel=0.01)
+        assert ancient == 7 * DAY
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"updated_date": "2024-01-11T00:00:00+00:00"},
+            {"updated_date": "not a date"},
+            {"id": "W1"},
+            [{"updated_date": "2020-01-01"}],
+        ],
+    )
+    def test_never_shorter_than_the_rule(self, payload):
+        policy = TTLPolicy(60, age_factor=1.0)
+        stored_at = datetime(2024, 1, 11, tzinfo=UTC).timestamp()
+
+        assert policy.for_payload(60, payload, stored_at) == 60
+
+    def test_naive_dates_and_stored_at(self):
+        policy = TTLPolicy(60, age_factor=1.0)
+        stored_at = datetime(2024, 1, 11, tzinfo=UTC).timestamp()
+
+        ttl = policy.for_payload(
+            0, {"updated_date": "2024-01-01T00:00:00"}, stored_at
+        )
+
+        assert ttl == 10 * DAY
+
+
+class TestManagerPolicy:
+    def test_endpoint_rules_set_entry_ttl(self):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True,
+                cache_ttl=60,
+                cache_ttl_rules={"publishers": 7 * DAY},
+            )
+        )
+
+        assert manager.get_ttl_for_endpoint("publishers") == 7 * DAY
+        assert manager.get_ttl_for_endpoint("works", "list") == 60
+
+    def test_stable_entities_outlive_cache_ttl(self, monkeypatch):
+        manager = CacheManager(
+            OpenAlexConfig(
+                cache_enabled=True, cache_ttl=60, cache_ttl_age_factor=0.1
+            )
+        )
+        manager.get_or_fetch(
+            "works", lambda: {"id": "W1", "updated_date": _updated(30)}, "W1"
+        )
+        manager.get_or_fetch(
+            "works", lambda: {"id": "W2", "updated_date": _updated(0)}, "W2"
+        )
+        later = time.time() + 3600
+        monkeypatch.setattr("openalex.cache.base.time.time", lambda: later)
+
+        cached = manager.get_or_fetch(
+            "works", lambda: pytest.fail("refetched"), "W1"
+        )
+        refetched = manager.get_or_fetch("works", lambda: {"id": "W2"}, "W2")
+
+        assert cached["id"] == "W1"
+        assert refetched == {"id": "W2"}
+
+    def test_zero_ttl_rule_turns_caching_off(self):
+        config = OpenAlexConfig(
+            cache_enabled=True, cache_ttl_rules={"*:autocomplete": 0}
+        )
+        works = Works(config=config)
+
+        with patch.object(
+            Works, "_execute_request", return_value={"results": []}
+        ) as mock_request:
+            works.autocomplete("mach")
+            works.autocomplete("mach")
+
+        assert mock_request.call_count == 2
+        assert works.cache_stats()["size"] == 0
+
+    def test_zero_list_rule_leaves_the_cache_unchanged(self):
+        config = OpenAlexConfig(
+            cache_enabled=True, cache_ttl_rules={"*:list": 0}
+        )
+        works = Works(config=config)
+
+        with patch.object(
+            Works, "_execute_request", return_value={"results": []}
+        ) as mock_request:
+            works.list(search="mach")
+            works.list(search="mach")
+
+        assert mock_request.call_count == 2
+        assert works.cache_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_list_rule_leaves_the_async_cache_unchanged(self):
+        config = OpenAlexConfig(
+            cache_enabled=True, cache_ttl_rules={"*:list": 0}
+        )
+        works = AsyncWorks(config=config)
+
+        with patch.object(
+            AsyncWorks, "_execute_request", return_value={"results": []}
+        ) as mock_request:
+            await works.list(search="mach")
+            await works.list(search="mach")
+
+        assert mock_request.call_count == 2
+        assert get_cache_manager(config).stats()["size"] == 0
+
+    def test_autocomplete_is_cached_by_default(self):
+        works = Works(config=OpenAlexConfig(cache_enabled=True))
+
+        with patch.object(
+            Works, "_execute_request", return_value={"results": []}
+        ) as mock_request:
+            works.autocomplete("mach")
+            works.autocomplete("mach")
+
+        assert mock_request.call_count == 1
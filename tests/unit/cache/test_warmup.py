@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+import pytest
+
+from openalex import Works
+from openalex.cache.warmup import (
+    SavedQuery,
+    WarmupReport,
+    main,
+    parse_manifest,
+)
+
+
+class TestParseManifest:
+    def test_ids_queries_and_comments(self):
+        manifest = parse_manifest(
+            [
+                "# comment",
+                "",
+                "W1",
+                "https://openalex.org/A5",
+                "keywords machine-learning",
+                '{"endpoint": "works", "search": "x", "pages": 3}',
+            ]
+        )
+
+        assert manifest.ids == {
+            "works": ["W1"],
+            "authors": ["https://openalex.org/A5"],
+            "keywords": ["machine-learning"],
+        }
+        assert manifest.queries == [SavedQuery("works", {"search": "x"}, 3)]
+        assert len(manifest) == 6
+
+    @pytest.mark.parametrize(
+        "line",
+        ["planets P1", '{"search": "x"}', "{not json", "1234"],
+    )
+    def test_bad_lines_are_rejected(self, line):
+        with pytest.raises(ValueError, match="line 1"):
+            parse_manifest([line])
+
+
+class TestWarmupReport:
+    def test_summary(self):
+        report = WarmupReport(requested=4, fresh=1, fetched=2, missing=1)
+
+        assert report.done == 4
+        assert "4/4 entries (1 fresh, 2 fetched, 1 missing" in report.summary()
+
+
+class TestMain:
+    def test_warms_manifest_into_cache_file(self, tmp_path, capsys):
+        manifest = tmp_path / "hot.txt"
+        manifest.write_text("W1\nW2\n")
+
+        def respond(url, params, operation=None):
+            ids = params["filter"].removeprefix("openalex_id:").split("|")
+            return {
+                "meta": {"count": len(ids)},
+                "results": [{"id": f"https://openalex.org/{i}"} for i in ids],
+            }
+
+        with patch.object(Works, "_execute_request", side_effect=respond):
+            status = main(
+                [
+                    str(manifest),
+                    "--cache-path",
+                    str(tmp_path / "cache.db"),
+                    "--quiet",
+                ]
+            )
+
+        assert status == 0
+        assert "2 fetched" in capsys.readouterr().out
+        assert (tmp_path / "cache.db").exists()
+
+    def test_bad_manifest_exits_with_usage_status(self, tmp_path, capsys):
+        status = main([str(tmp_path / "missing.txt")])
+
+        assert status == 2
+        assert "openalex-warm" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        ("backend", "option"),
+        [("sqlite", "cache_sqlite_maxsize"), ("tiered", "cache_l2_maxsize")],
+    )
+    def test_max_entries_sizes_the_sqlite_file(
+        self, tmp_path, monkeypatch, backend, option
+    ):
+        manifest = tmp_path / "hot.txt"
+        manifest.write_text("W1\n")
+        configs = []
+
+        def fake_warm(manifest, config, **kwargs):
+            configs.append(config)
+            return WarmupReport()
+
+        monkeypatch.setattr("openalex.cache.warmup.warm_manifest", fake_warm)
+
+        main([str(manifest), "--backend", backend, "--max-entries", "5"])
+
+        assert getattr(configs[0], option) == 5
@@ -121,3 +121,195 @@ class TestResilience(IsolatedTestCase):
             assert len(results) == 10
         finally:
             await queue.stop()
+
+    def test_request_coalescer_shares_in_flight_call(self):
+        """Identical concurrent calls run once and share the result."""
+        import threading
+
+        from openalex.resilience import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return {"id": "W1"}
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(coalescer.do("k", fetch))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while coalescer.stats()["coalesced"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert coalescer.stats() == {
+            "executed": 1,
+            "coalesced": 4,
+            "in_flight": 0,
+        }
+
+        # Once finished, the next call executes again
+        coalescer.do("k", fetch)
+        assert len(calls) == 2
+
+    def test_request_coalescer_propagates_errors(self):
+        from openalex.resilience import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+
+        with pytest.raises(ZeroDivisionError):
+            coalescer.do("k", lambda: 1 / 0)
+        assert coalescer.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_request_coalescer(self):
+        from openalex.resilience import AsyncRequestCoalescer
+
+        coalescer = AsyncRequestCoalescer()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "W1"}
+
+        results = await asyncio.gather(
+            *(coalescer.do("k", fetch) for _ in range(5)),
+            coalescer.do("other", fetch),
+        )
+
+        assert len(calls) == 2
+        assert results[0] is results[4]
+        assert coalescer.stats()["coalesced"] == 4
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ServerError("boom")
+
+        outcomes = await asyncio.gather(
+            coalescer.do("err", failing),
+            coalescer.do("err", failing),
+            return_exceptions=True,
+        )
+        assert all(isinstance(o, ServerError) for o in outcomes)
+
+    @pytest.mark.asyncio
+    async def test_async_connection_coalesces_identical_gets(self):
+        import httpx
+
+        from openalex.connection import AsyncConnection
+
+        calls = []
+
+        async def fake_request(*args, **kwargs):
+            calls.append(kwargs.get("params"))
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200,
+                json={"id": "W1"},
+                request=httpx.Request("GET", kwargs["url"]),
+            )
+
+        connection = AsyncConnection(OpenAlexConfig())
+        with patch("httpx.AsyncClient.request", side_effect=fake_request):
+            url = "https://api.openalex.org/works/W1"
+            await asyncio.gather(
+                *(connection.request("GET", url) for _ in range(3)),
+                connection.request("GET", url, params={"select": "id"}),
+            )
+        await connection.close()
+
+        assert len(calls) == 2
+        assert connection.coalescer.stats()["coalesced"] == 2
+
+        disabled = AsyncConnection(
+            OpenAlexConfig(request_coalescing_enabled=False)
+        )
+        assert disabled.coalescer is None
+
+    @pytest.mark.asyncio
+    async def test_async_connection_does_not_forward_operation(self):
+        import httpx
+
+        from openalex.connection import AsyncConnection
+
+        async def fake_request(*args, **kwargs):
+            assert "operation" not in kwargs
+            return httpx.Response(
+                200, json={}, request=httpx.Request("GET", kwargs["url"])
+            )
+
+        connection = AsyncConnection(OpenAlexConfig())
+        with patch("httpx.AsyncClient.request", side_effect=fake_request):
+            await connection.request(
+                "GET", "https://api.openalex.org/works", operation="list"
+            )
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        from openalex.resilience import AsyncRequestCoalescer
+
+        coalescer = AsyncRequestCoalescer()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"id": "W1"}
+
+        leader = asyncio.create_task(coalescer.do("k", fetch))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(coalescer.do("k", fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert results == [{"id": "W1"}] * 3
+        assert len(calls) == 2
+        assert coalescer.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_get_json_shares_decoded_payload(self):
+        import httpx
+
+        from openalex.connection import AsyncConnection
+
+        calls = []
+
+        async def fake_request(*args, **kwargs):
+            calls.append(kwargs.get("params"))
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200,
+                json={"id": "W1"},
+                request=httpx.Request("GET", kwargs["url"]),
+            )
+
+        connection = AsyncConnection(OpenAlexConfig())
+        with patch("httpx.AsyncClient.request", side_effect=fake_request):
+            url = "https://api.openalex.org/works/W1"
+            results = await asyncio.gather(
+                *(connection.get_json(url) for _ in range(3))
+            )
+        await connection.close()
+
+        assert len(calls) == 1
+        assert results[0] == {"id": "W1"}
+        assert all(result is results[0] for result in results)
@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from openalex.models import ListResult, Meta
+from openalex.streaming import (
+    AsyncStreamingPaginator,
+    Checkpoint,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    StreamingPaginator,
+    open_checkpoint_store,
+)
+
+CURSORS = {"*": "c2", "c2": "c3", "c3": None}
+
+
+def make_page(cursor):
+    return ListResult(
+        meta=Meta(
+            count=6,
+            db_response_time_ms=0,
+            page=1,
+            per_page=2,
+            next_cursor=CURSORS[cursor],
+        ),
+        results=[f"{cursor}-a", f"{cursor}-b"],
+    )
+
+
+@pytest.fixture(params=["state.json", "state.db"])
+def store_path(request, tmp_path):
+    return tmp_path / request.param
+
+
+class TestCheckpointStores:
+    def test_round_trip(self, store_path):
+        store = open_checkpoint_store(store_path)
+        expected_type = (
+            SQLiteCheckpointStore
+            if store_path.suffix == ".db"
+            else FileCheckpointStore
+        )
+        assert isinstance(store, expected_type)
+        assert store.load("k") is None
+
+        store.save("k", Checkpoint("fp", "c2", 2))
+        loaded = open_checkpoint_store(store_path).load("k")
+        assert (loaded.fingerprint, loaded.cursor, loaded.yielded) == (
+            "fp",
+            "c2",
+            2,
+        )
+        assert store.resume("k", "other") is None
+
+        store.delete("k")
+        assert store.load("k") is None
+
+    def test_file_stores_sharing_a_path_keep_every_save(self, tmp_path):
+        path = tmp_path / "state.json"
+        stores = [FileCheckpointStore(path) for _ in range(4)]
+        start = threading.Barrier(len(stores))
+
+        def save_keys(index, store):
+            start.wait()
+            for i in range(25):
+                store.save(f"{index}-{i}", Checkpoint("fp", None, i))
+
+        threads = [
+            threading.Thread(target=save_keys, args=(index, store))
+            for index, store in enumerate(stores)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        reader = FileCheckpointStore(path)
+        assert all(
+            reader.load(f"{index}-{i}") is not None
+            for index in range(len(stores))
+            for i in range(25)
+        )
+
+
+class TestResumableStreams:
+    def test_stream_resumes_after_last_consumed_page(self, store_path):
+        requested = []
+
+        def fetch(params):
+            requested.append(params["cursor"])
+            return make_page(params["cursor"])
+
+        first = StreamingPaginator(fetch, {"q": 1}, checkpoint=store_path)
+        consumed = [next(first) for _ in range(3)]
+        assert consumed == ["*-a", "*-b", "c2-a"]
+        # Interrupted half way through the second page
+
+        resumed = StreamingPaginator(fetch, {"q": 1}, checkpoint=store_path)
+        assert list(resumed) == ["c2-a", "c2-b", "c3-a", "c3-b"]
+        assert requested == ["*", "c2", "c2", "c3"]
+
+        finished = StreamingPaginator(fetch, {"q": 1}, checkpoint=store_path)
+        assert list(finished) == []
+        assert len(requested) == 4
+
+        other_query = StreamingPaginator(fetch, {"q": 2}, checkpoint=store_path)
+        assert next(other_query) == "*-a"
+
+    @pytest.mark.asyncio
+    async def test_async_stream_resumes(self, tmp_path):
+        async def fetch(params):
+            return make_page(params["cursor"])
+
+        path = tmp_path / "async.sqlite"
+        first = AsyncStreamingPaginator(
+            fetch, {}, checkpoint=path, checkpoint_key="run"
+        )
+        assert [await anext(first) for _ in range(3)] == [
+            "*-a",
+            "*-b",
+            "c2-a",
+        ]
+
+        resumed = AsyncStreamingPaginator(
+            fetch, {}, checkpoint=path, checkpoint_key="run"
+        )
+        assert [item async for item in resumed] == [
+            "c2-a",
+            "c2-b",
+            "c3-a",
+            "c3-b",
+        ]
+        assert open_checkpoint_store(path).load("run").done
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+
+import pytest
+
+from openalex.query import or_
+from openalex.streaming.partition import (
+    Partition,
+    apply_partition,
+    async_harvest_partitions,
+    async_plan_partitions,
+    group_filter_value,
+    harvest_partitions,
+    plan_partitions,
+)
+
+GROUPS = {
+    (): {"publication_year": [(2020, 30), (2021, 5)]},
+    (("publication_year", 2020),): {"type": [("article", 25), ("book", 5)]},
+}
+
+
+def probe(filters, field):
+    return GROUPS[tuple(filters.items())][field]
+
+
+class Item:
+    def __init__(self, id):
+        self.id = id
+
+
+class TestPartitionPlanning:
+    def test_splits_until_partitions_are_small_enough(self):
+        partitions = plan_partitions(
+            probe, ["publication_year", "type"], total=35, max_size=10
+        )
+
+        assert [(p.filters, p.count) for p in partitions] == [
+            ({"publication_year": 2020, "type": "article"}, 25),
+            ({"publication_year": 2020, "type": "book"}, 5),
+            ({"publication_year": 2021}, 5),
+        ]
+        assert partitions[0].key == "publication_year=2020,type=article"
+
+    def test_small_result_sets_are_not_split(self):
+        assert plan_partitions(probe, ["publication_year"], 35, 100) == [
+            Partition({}, 35)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_planning_matches_sync(self):
+        async def async_probe(filters, field):
+            return probe(filters, field)
+
+        partitions = await async_plan_partitions(
+            async_probe, ["publication_year", "type"], 35, 10
+        )
+        assert partitions == plan_partitions(
+            probe, ["publication_year", "type"], 35, 10
+        )
+
+    def test_apply_partition_and_group_values(self):
+        assert apply_partition(None, {"type": "article"}) == {"type": "article"}
+        assert apply_partition({"type": "book"}, {"type": "article"}) == {
+            "type": ("book", "article")
+        }
+        assert apply_partition("is_oa:true", {"type": "article"}) == (
+            "is_oa:true,type:article"
+        )
+        with pytest.raises(TypeError):
+            apply_partition(or_(type="book"), {"type": "article"})
+
+        assert group_filter_value("2020") == "2020"
+        assert group_filter_value("unknown") is None
+        assert (
+            group_filter_value("https://openalex.org/work-types/article")
+            == "article"
+        )
+
+
+class TestHarvestPartitions:
+    def test_merges_partitions_concurrently_and_deduplicates(self):
+        active = set()
+        overlap = threading.Event()
+
+        def open_stream(partition):
+            active.add(partition.key)
+            if len(active) > 1:
+                overlap.set()
+            overlap.wait(1)
+            year = partition.filters["year"]
+            yield from (Item(f"W{year}-{i}") for i in range(3))
+            yield Item("W-shared")
+
+        partitions = [Partition({"year": y}, 4) for y in (2020, 2021, 2022)]
+        items = list(
+            harvest_partitions(
+                partitions, open_stream, max_workers=3, deduplicate=True
+            )
+        )
+
+        ids = sorted(item.id for item in items)
+        assert len(ids) == 10
+        assert ids.count("W-shared") == 1
+        assert overlap.is_set()
+
+    def test_items_are_not_deduplicated_by_default(self):
+        def open_stream(partition):
+            yield Item("W-shared")
+
+        partitions = [Partition({"year": y}, 1) for y in (2020, 2021)]
+        items = list(harvest_partitions(partitions, open_stream))
+
+        assert [item.id for item in items] == ["W-shared", "W-shared"]
+
+    def test_errors_stop_the_harvest(self):
+        def open_stream(partition):
+            if partition.filters["year"] == 2021:
+                raise RuntimeError("slice failed")
+            yield Item("W1")
+
+        partitions = [Partition({"year": y}, 1) for y in (2020, 2021)]
+        with pytest.raises(RuntimeError, match="slice failed"):
+            list(harvest_partitions(partitions, open_stream, max_workers=2))
+
+    @pytest.mark.asyncio
+    async def test_async_harvest(self):
+        async def open_stream(partition):
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield Item(f"W{partition.filters['year']}-{i}")
+
+        partitions = [Partition({"year": y}, 3) for y in (2020, 2021, 2022)]
+        items = [
+            item
+            async for item in async_harvest_partitions(
+                partitions, open_stream, max_workers=2
+            )
+        ]
+        assert len({item.id for item in items}) == 9
@@ -125,3 +125,55 @@ class TestStreaming:
                 assert work.id
 
         assert count == 2
+
+    def test_streaming_prefetch_and_final_page(self):
+        from openalex.models import ListResult, Meta
+        from openalex.streaming import StreamingPaginator
+
+        cursors = {"*": "c2", "c2": "c3", "c3": None}
+        requested = []
+
+        def fetch(params):
+            cursor = params["cursor"]
+            requested.append(cursor)
+            return ListResult(
+                meta=Meta(
+                    count=6,
+                    db_response_time_ms=0,
+                    page=1,
+                    per_page=2,
+                    next_cursor=cursors[cursor],
+                ),
+                results=[f"{cursor}-a", f"{cursor}-b"],
+            )
+
+        results = list(StreamingPaginator(fetch, {}, per_page=2, prefetch=2))
+        assert results == ["*-a", "*-b", "c2-a", "c2-b", "c3-a", "c3-b"]
+        assert requested == ["*", "c2", "c3"]
+
+        limited = StreamingPaginator(fetch, {}, per_page=2, max_results=3)
+        assert len(list(limited)) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_streaming_prefetch_error(self):
+        from openalex.models import ListResult, Meta
+        from openalex.streaming import AsyncStreamingPaginator
+
+        async def fetch(params):
+            if params["cursor"] == "c2":
+                raise RuntimeError("cursor expired")
+            return ListResult(
+                meta=Meta(
+                    count=2,
+                    db_response_time_ms=0,
+                    page=1,
+                    per_page=1,
+                    next_cursor="c2",
+                ),
+                results=["first"],
+            )
+
+        paginator = AsyncStreamingPaginator(fetch, {}, per_page=1, prefetch=2)
+        assert await anext(paginator) == "first"
+        with pytest.raises(RuntimeError, match="cursor expired"):
+            await anext(paginator)
@@ -25,6 +25,14 @@ class FakeLogger:
         self.errors.append(formatted_msg)
 
 
+def _list_response(params):
+    ids = params["filter"].removeprefix("openalex_id:").split("|")
+    return {
+        "meta": {"count": len(ids)},
+        "results": [{"id": f"https://openalex.org/{i}"} for i in ids],
+    }
+
+
 @pytest.mark.asyncio
 async def test_get_many_skips_invalid(
     monkeypatch: pytest.MonkeyPatch, mock_work_data
@@ -33,13 +41,14 @@ async def test_get_many_skips_invalid(
     logger = FakeLogger()
     monkeypatch.setattr("openalex.entities.logger", logger)
 
-    # Mock the _get_single_entity method to return a Work object
-    async def fake_get_single(
-        self: AsyncBaseEntity[Work, BaseFilter], eid: str, params=None
-    ) -> Work:
-        return Work.model_validate(
-            {**mock_work_data, "id": f"https://openalex.org/{eid.upper()}"}
-        )
+    async def fake_execute(
+        self: AsyncBaseEntity[Work, BaseFilter], url, params, operation=None
+    ):
+        data = _list_response(params)
+        data["results"] = [
+            {**mock_work_data, "id": r["id"]} for r in data["results"]
+        ]
+        return data
 
     def fake_validate(eid: str, _typ: str) -> str:
         if eid == "bad":
@@ -47,8 +56,8 @@ async def test_get_many_skips_invalid(
         return eid.upper()
 
     monkeypatch.setattr(
-        "openalex.templates.AsyncEntityTemplate._get_single_entity",
-        fake_get_single,
+        "openalex.templates.AsyncEntityTemplate._execute_request",
+        fake_execute,
     )
     monkeypatch.setattr("openalex.templates.validate_entity_id", fake_validate)
 
@@ -67,23 +76,115 @@ async def test_get_many_handles_errors(monkeypatch: pytest.MonkeyPatch) -> None:
     logger = FakeLogger()
     monkeypatch.setattr("openalex.templates.logger", logger)
 
-    async def fake_get_single(
-        self: AsyncBaseEntity[str, BaseFilter], eid: str, params=None
-    ) -> str:
-        if eid == "B2":
+    async def fake_fetch_batch(
+        self: AsyncBaseEntity[str, BaseFilter], batch: list[str]
+    ) -> dict[str, dict[str, str]]:
+        if "B2" in batch:
             raise RuntimeError("boom")
-        return f"ok-{eid}"
+        return {
+            eid: {"id": f"https://openalex.org/{eid}", "display_name": eid}
+            for eid in batch
+        }
 
     monkeypatch.setattr(
-        "openalex.templates.AsyncEntityTemplate._get_single_entity",
-        fake_get_single,
+        "openalex.templates.AsyncEntityTemplate._fetch_id_batch",
+        fake_fetch_batch,
     )
     monkeypatch.setattr(
         "openalex.templates.validate_entity_id", lambda e, _t: e
     )
+    monkeypatch.setattr("openalex.templates.MAX_OR_FILTER_VALUES", 1)
 
     entity = DummyEntity(config=OpenAlexConfig())
     results = await entity.get_many(["A1", "B2"], max_concurrent=2)
 
-    assert results == ["ok-A1"]
+    assert [r.id for r in results] == ["https://openalex.org/A1"]
     assert logger.errors == ["Failed to fetch B2"]
+    assert logger.warnings[-1] == "Entities not found: B2"
+
+
+@pytest.mark.asyncio
+async def test_get_batches_concurrent_calls(
+    monkeypatch: pytest.MonkeyPatch, mock_work_data
+) -> None:
+    """Concurrent single gets share one OR-filter request when enabled."""
+    import asyncio
+
+    from openalex.exceptions import NotFoundError
+
+    requests: list[dict] = []
+
+    async def fake_execute(
+        self: AsyncBaseEntity[Work, BaseFilter], url, params, operation=None
+    ):
+        requests.append(params)
+        if "filter" not in params:
+            raise NotFoundError("gone")
+        data = _list_response(params)
+        data["results"] = [
+            {**mock_work_data, "id": r["id"]}
+            for r in data["results"]
+            if not r["id"].endswith("W404")
+        ]
+        return data
+
+    monkeypatch.setattr(
+        "openalex.templates.AsyncEntityTemplate._execute_request",
+        fake_execute,
+    )
+
+    entity = DummyEntity(config=OpenAlexConfig(get_batching_enabled=True))
+    results = await asyncio.gather(
+        entity.get("W1"),
+        entity.get("W2"),
+        entity.get("W1"),
+        entity.get("W404"),
+        return_exceptions=True,
+    )
+
+    # The batch, then a single get confirming the 404
+    assert len(requests) == 2
+    assert requests[0]["filter"] == "openalex_id:W1|W2|W404"
+    assert requests[1] == {}
+    assert results[0].id == "https://openalex.org/W1"
+    assert results[1].id == "https://openalex.org/W2"
+    assert results[2].id == "https://openalex.org/W1"
+    assert isinstance(results[3], NotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_get_batching_respects_max_size_and_params(
+    monkeypatch: pytest.MonkeyPatch, mock_work_data
+) -> None:
+    import asyncio
+
+    requests: list[dict] = []
+
+    async def fake_execute(
+        self: AsyncBaseEntity[Work, BaseFilter], url, params, operation=None
+    ):
+        requests.append(params)
+        if operation == "get":
+            return {**mock_work_data, "id": "https://openalex.org/W9"}
+        data = _list_response(params)
+        data["results"] = [
+            {**mock_work_data, "id": r["id"]} for r in data["results"]
+        ]
+        return data
+
+    monkeypatch.setattr(
+        "openalex.templates.AsyncEntityTemplate._execute_request",
+        fake_execute,
+    )
+
+    config = OpenAlexConfig(
+        get_batching_enabled=True, get_batch_max_size=2, get_batch_window=1.0
+    )
+    entity = DummyEntity(config=config)
+    await asyncio.wait_for(
+        asyncio.gather(entity.get("W1"), entity.get("W2")), timeout=0.5
+    )
+    await entity.get("W9", select="id")
+
+    assert [r["filter"] for r in requests[:1]] == ["openalex_id:W1|W2"]
+    assert requests[1] == {"select": "id"}
@@ -114,18 +114,15 @@ class TestSyncEntityTemplate:
     def test_execute_request(self, mock_get_connection):
         """Test HTTP request execution."""
         mock_connection = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"test": "data"}
-        mock_connection.request.return_value = mock_response
+        mock_connection.get_json.return_value = {"test": "data"}
         mock_get_connection.return_value = mock_connection
 
         entity = DummySyncEntity()
 
-        with patch("openalex.templates.raise_for_status"):
-            result = entity._execute_request("http://test.com", {})
+        result = entity._execute_request("http://test.com", {})
 
         assert result == {"test": "data"}
-        mock_connection.request.assert_called_once()
+        mock_connection.get_json.assert_called_once()
 
     @patch("openalex.connection.get_connection")
     @patch("openalex.templates.get_cache_manager")
@@ -195,17 +192,15 @@ class TestAsyncEntityTemplate:
         from unittest.mock import AsyncMock
 
         mock_connection = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"test": "data"}
-        mock_connection.request = AsyncMock(return_value=mock_response)
+        mock_connection.get_json = AsyncMock(return_value={"test": "data"})
         mock_get_connection.return_value = mock_connection
 
         entity = DummyAsyncEntity()
 
-        with patch("openalex.templates.raise_for_status"):
-            result = await entity._execute_request("http://test.com", {})
+        result = await entity._execute_request("http://test.com", {})
 
         assert result == {"test": "data"}
+        mock_connection.get_json.assert_awaited_once()
 
     @patch("openalex.connection.get_async_connection")
     async def test_async_get_single_entity(
@@ -254,20 +249,28 @@ class TestAsyncEntityTemplate:
 
         entity = DummyAsyncEntity()
 
+        list_data = {
+            "meta": {"count": 2},
+            "results": [
+                {**mock_work_data, "id": "https://openalex.org/W1"},
+                {**mock_work_data, "id": "https://openalex.org/W2"},
+            ],
+        }
+
         with patch.object(
             entity,
             "_normalize_and_validate_id",
             side_effect=lambda x: x.upper(),
         ):
             with patch.object(
-                entity,
-                "_get_single_entity",
-                return_value=Work.model_validate(mock_work_data),
-            ):
+                entity, "_execute_request", return_value=list_data
+            ) as mock_execute:
                 results = await entity.get_many(["w1", "w2"])
 
         assert len(results) == 2
         assert all(isinstance(r, Work) for r in results)
+        mock_execute.assert_called_once()
+        assert mock_execute.call_args.args[1]["filter"] == "openalex_id:W1|W2"
 
 
 class TestTemplateComparison:
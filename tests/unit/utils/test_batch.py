@@ -0,0 +1,50 @@
+"""
+Test batching utilities.
+Tests async micro-batching of single-key loads.
+"""
+
+import asyncio
+
+import pytest
+
+
+class TestMicroBatching:
+    """Test async micro-batching of single-key loads."""
+
+    @pytest.mark.asyncio
+    async def test_loads_within_window_share_a_batch(self):
+        from openalex.utils import AsyncMicroBatcher
+
+        batches = []
+
+        async def load_many(keys):
+            batches.append(keys)
+            return {k: k.upper() for k in keys if k != "missing"}
+
+        batcher = AsyncMicroBatcher(load_many, window=0.01)
+        results = await asyncio.gather(
+            batcher.load("a"),
+            batcher.load("b"),
+            batcher.load("a"),
+            batcher.load("missing"),
+        )
+
+        assert batches == [["a", "b", "missing"]]
+        assert results == ["A", "B", "A", None]
+
+        assert await batcher.load("c") == "C"
+        assert len(batches) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_reach_every_caller(self):
+        from openalex.utils import AsyncMicroBatcher
+
+        async def load_many(keys):
+            raise RuntimeError("boom")
+
+        batcher = AsyncMicroBatcher(load_many, window=0)
+        results = await asyncio.gather(
+            batcher.load("a"), batcher.load("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
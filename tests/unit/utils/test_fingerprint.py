@@ -0,0 +1,117 @@
+"""
+Test canonical request fingerprints.
+Tests utils/fingerprint.py and the consumers that share its value.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+class TestRequestFingerprint:
+    """Test the fingerprint function itself."""
+
+    def test_key_order_does_not_matter(self):
+        from openalex.utils.fingerprint import request_fingerprint
+
+        a = request_fingerprint("works", {"search": "x", "filter": "y:1"})
+        b = request_fingerprint("works", {"filter": "y:1", "search": "x"})
+
+        assert a == b
+        assert len(a) == 32
+
+    def test_endpoint_and_values_matter(self):
+        from openalex.utils.fingerprint import request_fingerprint
+
+        base = request_fingerprint("works", {"search": "x"})
+
+        assert request_fingerprint("authors", {"search": "x"}) != base
+        assert request_fingerprint("works", {"search": "y"}) != base
+        assert request_fingerprint("works") == request_fingerprint("works", {})
+
+    def test_stable_across_processes(self):
+        from openalex.utils.fingerprint import request_fingerprint
+
+        code = (
+            "from openalex.utils.fingerprint import request_fingerprint;"
+            "print(request_fingerprint('works', {'search': 'x'}))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"PYTHONHASHSEED": "123"},
+        ).stdout.strip()
+
+        assert out == request_fingerprint("works", {"search": "x"})
+
+
+class TestSharedFingerprint:
+    """Test that every consumer derives from the same fingerprint."""
+
+    def test_query_caches_fingerprint(self):
+        from openalex import Works
+        from openalex.streaming.checkpoint import query_fingerprint
+
+        query = Works().filter(publication_year=2020).search("x")
+        first = query.fingerprint
+
+        assert query.fingerprint is first
+        assert first == query_fingerprint("works", query.params)
+        assert query.sort(cited_by_count="desc").fingerprint != first
+
+    def test_async_query_resets_on_change(self):
+        from openalex import AsyncWorks
+
+        query = AsyncWorks().query().filter(publication_year=2020)
+        first = query.fingerprint
+
+        assert query.fingerprint is first
+        assert query.search("x").fingerprint != first
+
+    def test_consumers_agree(self):
+        from openalex.cache.base import CacheKeyBuilder
+        from openalex.resilience.coalescer import request_key
+        from openalex.utils.fingerprint import request_fingerprint
+
+        params = {"filter": "publication_year:2020", "per-page": "25"}
+        fp = request_fingerprint("works", params)
+
+        assert CacheKeyBuilder.list_key("works", fp) == f"works:list:{fp}"
+        assert CacheKeyBuilder.build_key("works", params=params).endswith(fp)
+        assert request_key("get", "works", params) == f"GET {fp}"
+
+    def test_get_with_kwargs_uses_list_query(self):
+        from unittest.mock import patch
+
+        from openalex import Works
+        from openalex.streaming.checkpoint import query_fingerprint
+
+        query = Works().filter(publication_year=2020)
+        with patch.object(Works, "list_query") as list_query:
+            query.get(per_page=5)
+
+        (sent,) = list_query.call_args.args
+        assert sent.params == {**query.params, "per_page": 5}
+        assert sent.fingerprint == query_fingerprint(
+            "works", {**query.params, "per_page": 5}
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_get_uses_list_query(self):
+        from unittest.mock import AsyncMock, patch
+
+        from openalex import AsyncWorks
+
+        query = AsyncWorks().query().filter(publication_year=2020)
+        with patch.object(AsyncWorks, "list_query", AsyncMock()) as list_query:
+            await query.get()
+            await query.get(per_page=5)
+
+        first, second = (c.args[0] for c in list_query.call_args_list)
+        assert first is query
+        assert second.normalized_params["per-page"] == "5"
+        assert second.fingerprint != query.fingerprint
+        assert "per_page" not in query.normalized_params
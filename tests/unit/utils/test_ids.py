@@ -269,3 +269,54 @@ class TestIDHandling:
 
         # Special cases
         assert ids_equal("keywords/test", "https://openalex.org/keywords/test")
+
+    def test_normalize_doi(self):
+        """DOIs are reduced to their bare lowercase form."""
+        from openalex.utils import normalize_doi
+
+        assert normalize_doi("https://doi.org/10.1234/ABC") == "10.1234/abc"
+        assert normalize_doi("http://dx.doi.org/10.1234/abc") == "10.1234/abc"
+        assert normalize_doi("doi: 10.1234/abc") == "10.1234/abc"
+        assert normalize_doi(" 10.1234/abc ") == "10.1234/abc"
+        assert normalize_doi("10.1234/a,b") is None
+        assert normalize_doi("not-a-doi") is None
+        assert normalize_doi(None) is None
+
+    def test_normalize_orcid(self):
+        """ORCID iDs accept URLs and uppercase the checksum."""
+        from openalex.utils import normalize_orcid
+
+        expected = "0000-0002-1825-009X"
+        assert (
+            normalize_orcid("https://orcid.org/0000-0002-1825-009x") == expected
+        )
+        assert normalize_orcid("0000-0002-1825-009X") == expected
+        assert normalize_orcid("0000-0002-1825") is None
+
+    def test_normalize_ror(self):
+        """ROR IDs accept URLs and are lowercased."""
+        from openalex.utils import normalize_ror
+
+        assert normalize_ror("https://ror.org/02MHBDP94") == "02mhbdp94"
+        assert normalize_ror("ror.org/02mhbdp94") == "02mhbdp94"
+        assert normalize_ror("12345") is None
+
+    def test_normalize_pmid(self):
+        """PMIDs accept prefixes and PubMed URLs."""
+        from openalex.utils import normalize_pmid
+
+        assert normalize_pmid("123456") == "123456"
+        assert normalize_pmid("pmid:123456") == "123456"
+        assert (
+            normalize_pmid("https://pubmed.ncbi.nlm.nih.gov/123456/")
+            == "123456"
+        )
+        assert normalize_pmid("PMC123") is None
+
+    def test_normalize_issn(self):
+        """ISSNs are hyphenated with an uppercase check digit."""
+        from openalex.utils import normalize_issn
+
+        assert normalize_issn("1234-567x") == "1234-567X"
+        assert normalize_issn("12345678") == "1234-5678"
+        assert normalize_issn("123-45678") is None
@@ -12,6 +12,8 @@ from openalex.utils.pagination import (
     _pad_results,
     AsyncPaginator,
     Paginator,
+    async_prefetch_iter,
+    prefetch_iter,
 )
 
 
@@ -253,3 +255,163 @@ class TestPaginationUtilities:
 
         gathered = await paginator.gather(pages=2)
         assert gathered == [1, 2]
+
+    def test_paginator_prefetch_fetches_ahead(self):
+        """Prefetching runs ahead of the consumer but stays bounded."""
+        import threading
+
+        fetched: list[int] = []
+        fetched_event = threading.Condition()
+
+        def fetch(params):
+            page = params["page"]
+            with fetched_event:
+                fetched.append(page)
+                fetched_event.notify_all()
+            if page > 5:
+                return self.make_list_result([], page=page, count=5)
+            return self.make_list_result([page], page=page, count=5)
+
+        paginator = Paginator(fetch, per_page=1, prefetch=2)
+        pages = paginator.pages()
+        assert next(pages).results == [1]
+
+        with fetched_event:
+            # Page 1 consumed, 2 and 3 buffered, 4 waiting for a free slot
+            assert fetched_event.wait_for(lambda: len(fetched) >= 4, 1)
+        assert len(fetched) <= 4
+
+        assert [p.results for p in pages] == [[2], [3], [4], [5], []]
+
+    def test_paginator_prefetch_raises_in_position(self):
+        """Errors from prefetched pages surface after earlier pages."""
+
+        def fetch(params):
+            if params["page"] == 3:
+                raise APIError("page 3 failed")
+            return self.make_list_result([params["page"]], count=5)
+
+        seen = []
+        with pytest.raises(APIError, match="page 3 failed"):
+            for page in Paginator(fetch, per_page=1, prefetch=3):
+                seen.extend(page.results)
+        assert seen == [1, 2]
+
+    @pytest.mark.parametrize("error", [KeyboardInterrupt, SystemExit])
+    def test_prefetch_forwards_base_exceptions(self, error):
+        """A producer killed by a BaseException still wakes the consumer."""
+
+        def source():
+            yield 1
+            raise error
+
+        seen = []
+        with pytest.raises(error):
+            for item in prefetch_iter(source(), 2):
+                seen.append(item)
+        assert seen == [1]
+
+    @pytest.mark.asyncio
+    async def test_async_prefetch_forwards_base_exceptions(self):
+        async def source():
+            yield 1
+            raise KeyboardInterrupt
+
+        seen = []
+        with pytest.raises(KeyboardInterrupt):
+            async for item in async_prefetch_iter(source(), 2):
+                seen.append(item)
+        assert seen == [1]
+
+    @pytest.mark.asyncio
+    async def test_async_paginator_prefetch(self):
+        """Async prefetch keeps order, limits and error positions."""
+
+        async def fetch(params):
+            page = params["page"]
+            if page == 4:
+                raise APIError("page 4 failed")
+            return self.make_list_result([page], count=5)
+
+        limited = AsyncPaginator(fetch, per_page=1, max_results=3, prefetch=2)
+        assert await limited.all() == [1, 2, 3]
+
+        seen = []
+        with pytest.raises(APIError, match="page 4 failed"):
+            async for page in AsyncPaginator(
+                fetch, per_page=1, prefetch=2
+            ).pages():
+                seen.extend(page.results)
+        assert seen == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_async_paginator_gather_sliding_window(self):
+        """A slow page does not hold back the pages after it."""
+        release = asyncio.Event()
+        active = 0
+        peak = 0
+
+        async def fetch(params):
+            nonlocal active, peak
+            page = params["page"]
+            active += 1
+            peak = max(peak, active)
+            try:
+                if page == 1:
+                    await release.wait()
+                else:
+                    await asyncio.sleep(0)
+                if page == 5:
+                    release.set()
+                return self.make_list_result([page], page=page, count=5)
+            finally:
+                active -= 1
+
+        paginator = AsyncPaginator(fetch, per_page=1, concurrency=2)
+        arrival = [
+            page.results[0] async for page in paginator.gather_pages(pages=5)
+        ]
+
+        assert arrival[:3] == [2, 3, 4]
+        assert sorted(arrival) == [1, 2, 3, 4, 5]
+        assert peak == 2
+
+        release.clear()
+        assert await paginator.gather(pages=5) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_async_paginator_gather_switches_to_cursors(self):
+        """Counts beyond the numbered-page limit are walked with cursors."""
+        lanes = {"year:2020": ["a", "b", "c"], "year:2021": ["d"]}
+        requests = []
+
+        async def fetch(params):
+            requests.append(params)
+            if params.get("per-page") == 1 and "cursor" not in params:
+                return self.make_list_result(["x"], count=20_000)
+            items = lanes[params["filter"]]
+            index = 0 if params["cursor"] == "*" else int(params["cursor"])
+            next_index = index + params["per-page"]
+            return self.make_list_result(
+                items[index:next_index],
+                next_cursor=str(next_index)
+                if next_index < len(items)
+                else None,
+            )
+
+        async def partitioner(max_size):
+            assert max_size == 10_000
+            return [{"filter": f} for f in lanes]
+
+        paginator = AsyncPaginator(
+            fetch, per_page=2, concurrency=2, partitioner=partitioner
+        )
+        assert await paginator.gather() == ["a", "b", "c", "d"]
+        assert all("page" not in params for params in requests[1:])
+
+        requests.clear()
+        single = AsyncPaginator(
+            fetch, {"filter": "year:2020"}, per_page=2, max_results=10_001
+        )
+        assert await single.gather() == ["a", "b", "c"]
+        assert [params.get("cursor") for params in requests[1:]] == ["*", "2"]